@@ -1,11 +1,7 @@
-from datetime import datetime
 import os
-import re
 from PySide6.QtWidgets import QDialog, QMessageBox
 from ui.StaticTable import Ui_StaticTable
-import fnmatch
-from tkinter import Tk, filedialog
-from utils.data_utils import hex_string_to_binary_file
+from utils import table_utils
 
 
 class StaticTableDlg(QDialog, Ui_StaticTable):
@@ -15,13 +11,13 @@ class StaticTableDlg(QDialog, Ui_StaticTable):
         # 实验总批数
         self.experimental_total_hex = ''
         # 静态表中间.bin中间参数
-        self.middle_bin = ''
+        self.middle_bin = b''
         # 每类动作数.bin参数
-        self.actions_bin = ''
+        self.actions_bin = b''
         # 静态表.bin尾部参数
-        self.tail_bin = ''
+        self.tail_bin = b''
         # 静态表.bin总参数
-        self.total_bin = ''
+        self.total_bin = b''
         # 动态表数
         self.dynamic_count = 0
         # 初始化每类动作数
@@ -38,12 +34,6 @@ class StaticTableDlg(QDialog, Ui_StaticTable):
         # 生成静态表
         self.pushButton_3.clicked.connect(self.generate_static_bin)
 
-    def convert_and_reverse(self, d_value, e_value):
-        """将十进制数转换为指定长度的十六进制字符串，并反转每两个字符一组"""
-        hex_str = format(d_value, f'0{e_value * 2}X')
-        # 每两个字符一组进行反转
-        reversed_hex = ''.join([hex_str[i:i + 2] for i in range(0, len(hex_str), 2)][::-1])
-        return reversed_hex
     def get_actions_count(self):
         """
         计算每类动作数,读取电脑中文件夹中的所有文件
@@ -51,36 +41,15 @@ class StaticTableDlg(QDialog, Ui_StaticTable):
         :return:
         """
         # 打开文件夹选择对话框
-        Tk().withdraw()  # 隐藏主窗口
-        folder_selected = filedialog.askdirectory()
+        folder_selected = table_utils.ask_directory()
 
         if not folder_selected:
             return
 
-        # 初始化计数字典
-        self.actions_count = {hex(i)[-1].upper(): 0 for i in range(16)}
-
-        # 正则表达式匹配以四位十六进制数
-        pattern = re.compile(r'AT.*?([0-9A-Fa-f]{4}).*?\.bin$')
-
-        # 筛选文件
-        for root, dirs, files in os.walk(folder_selected):
-            for filename in fnmatch.filter(files, 'AT*.bin'):
-                match = pattern.match(filename)
-                if match:
-                    hex_num = match.group(1).upper()
-                    first_char = hex_num[0]
-                    if first_char in self.actions_count:
-                        self.actions_count[first_char] += 1
-
-        # 使用 convert_and_reverse 函数处理每个类别的文件数量
-        result_list = []
-        for key, value in self.actions_count.items():
-            manipulated_hex = self.convert_and_reverse(value, 2)
-            result_list.append(manipulated_hex)
-
-        # 将结果连接成一个字符串
-        self.actions_bin = ''.join(result_list)
+        # 按动作ID的首位分类统计动作表数
+        self.actions_count = table_utils.count_actions(folder_selected)
+        # 每类动作数（每类u16，低字节在前）
+        self.actions_bin = table_utils.build_actions_bytes(self.actions_count)
 
         # 打印分类统计结果和处理后的字符串
         print("每类动作数分类统计：")
@@ -93,34 +62,21 @@ class StaticTableDlg(QDialog, Ui_StaticTable):
         :return:
         """
         # 打开文件夹选择对话框
-        Tk().withdraw()  # 隐藏主窗口
-        folder_selected = filedialog.askdirectory()
+        folder_selected = table_utils.ask_directory()
 
         if not folder_selected:
             return
 
         # 筛选文件
-        self.dynamic_count = 0
-        for root, dirs, files in os.walk(folder_selected):
-            for filename in fnmatch.filter(files, 'DT*.bin'):
-                self.dynamic_count += 1
+        self.dynamic_count = table_utils.count_dynamic_tables(folder_selected)
         print(f"文件夹中共有流程表文件：{self.dynamic_count}个")
         self.lineEdit.setText(str(self.dynamic_count))
         self.experimental_total_hex = format(self.dynamic_count, '02X')
         print(f"对应的十六进制值为：{self.experimental_total_hex}")
     def read_txt_file(self, file_name):
         """读取与脚本文件位于相同目录下的 txt 文件内容"""
-        # 获取脚本文件的当前目录
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-
-        # 构建 txt 文件的完整路径
-        file_path = os.path.join(script_dir, file_name)
+        return table_utils.read_static_part(file_name)
 
-        # 读取 txt 文件内容
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-
-        return content
     def generate_static_bin(self):
         """
         生成静态表.bin文件
@@ -132,16 +88,8 @@ class StaticTableDlg(QDialog, Ui_StaticTable):
                 return
             self.dynamic_count = int(self.lineEdit.text())
             self.experimental_total_hex = format(self.dynamic_count, '02X')
-        # 读取静态表中间.bin
-        self.middle_bin = self.read_txt_file('static_middle_bin.txt')
-        # 读取静态表尾部.bin
-        self.tail_bin = self.read_txt_file('static_tail_bin.txt')
-        # 计算静态表总.bin
-        self.total_bin = self.experimental_total_hex + self.middle_bin + self.actions_bin + self.tail_bin
-
-        # 获取今天的月份和日期，并格式化为字符串
-        today = datetime.today()
-        month_day_str = today.strftime('%m%d')
+        # 计算静态表总.bin = 实验总批数 + 中间参数 + 每类动作数 + 尾部参数
+        self.total_bin = table_utils.build_static_table(self.dynamic_count, self.actions_bin)
 
         # 将生成的静态表写入文件
         if len(self.actions_bin) == 0 or self.dynamic_count == 0:
@@ -152,8 +100,8 @@ class StaticTableDlg(QDialog, Ui_StaticTable):
         if not os.path.exists(base_path):
             os.makedirs(base_path)
         # 生成静态表的.bin文件
-        output_file_path = base_path + os.path.sep + 'ST_静态表' + month_day_str + '.bin'
-        hex_string_to_binary_file(self.total_bin, output_file_path)
+        output_file_path = base_path + os.path.sep + table_utils.static_table_file_name()
+        table_utils.write_table_file(self.total_bin, output_file_path)
         print(f"静态表生成成功！\n文件所在目录：{base_path}")
         QMessageBox.information(None, "Success", f"静态表生成成功！\n文件所在目录：{base_path}")
         # 关闭窗口
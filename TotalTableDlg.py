@@ -1,11 +1,9 @@
 import os
-import re
-import datetime
 
 from PySide6.QtWidgets import QDialog, QMessageBox
 from ui.totaltable import Ui_TotalTable
-from utils.data_utils import hex_string_to_binary_file
-from tkinter import Tk, filedialog
+from utils import table_utils
+from utils.total_table_cache import TotalTableCache
 
 
 class TotalTableDlg(QDialog, Ui_TotalTable):
@@ -17,25 +15,25 @@ class TotalTableDlg(QDialog, Ui_TotalTable):
         # 静态表的十六进制值
         self.static_val_hex = ''
         # 静态表内容
-        self.static_content_hex = ''
+        self.static_content = b''
         # 动作表长度
         self.action_length = 0
         # 动作表的十六进制值
         self.action_val_hex = ''
         # 动作表内容
-        self.action_content_hex = ''
+        self.action_content = b''
         # 动态表长度
         self.dynamic_length = 0
         # 动态表的十六进制值
         self.dynamic_val_hex = ''
         # 动态表内容
-        self.dynamic_content_hex = ''
+        self.dynamic_content = b''
         # 监控表长度
         self.monitoring_length = 0
         # 监控表的十六进制值
         self.monitoring_val_hex = ''
         # 监控表内容
-        self.monitoring_content_hex = ''
+        self.monitoring_content = b''
         # 总表长度
         self.total_table_length = 0
         # 总表的十六进制值
@@ -46,10 +44,8 @@ class TotalTableDlg(QDialog, Ui_TotalTable):
         self.motor_hex_str = '00C0'
         # 表头的十六进制参数值
         self.table_head_hex = ''
-        # 总表的十六进制参数值
-        self.total_table_hex = ''
-        # 表头+3总表(3次总表)的十六进制配置值
-        self.finally_total_table_hex = ''
+        # 总表的增量构建缓存，未改动的表文件从上一次生成的总表中截取
+        self.table_cache = TotalTableCache(os.path.abspath('./total_bin'))
         # 读取配置
         # furnace_config = get_config('E')
         # ------------电机选择--------------
@@ -166,8 +162,7 @@ class TotalTableDlg(QDialog, Ui_TotalTable):
         :return：
         """
         # 打开文件夹选择对话框
-        Tk().withdraw()  # 隐藏主窗口
-        file_path = filedialog.askopenfilename(
+        file_path = table_utils.ask_open_file(
             title="选择 .bin 文件",
             filetypes=[("二进制文件", "*.bin"), ("所有文件", "*.*")]
         )
@@ -177,19 +172,16 @@ class TotalTableDlg(QDialog, Ui_TotalTable):
             return
         # 筛选符合条件的文件
         if os.path.basename(file_path).startswith('ST') and '静态表' in os.path.basename(file_path):
-            with open(file_path, 'rb') as file:
-                file_content = file.read()
-                file_length = len(file_content)
-                file_length_str = str(file_length)  # 将文件字节数转换为字符串
-                file_content_hex = file_content.hex().upper()  # 转换为十六进制字符串
-
-                print(f"获取到静态表文件: {os.path.basename(file_path)}")
-                print(f"静态表字节数: {file_length}")
-                # print(f"内容字符串: {file_content_hex}")
+            file_content = self.table_cache.read_segment('static', [file_path])
+            file_length = len(file_content)
+            file_length_str = str(file_length)  # 将文件字节数转换为字符串
+
+            print(f"获取到静态表文件: {os.path.basename(file_path)}")
+            print(f"静态表字节数: {file_length}")
         else:
             print("未找到符合条件的 .bin 文件")
         self.static_length = file_length
-        self.static_content_hex = file_content_hex
+        self.static_content = file_content
         # 更新 GUI 元素
         self.staticTable_lineEdit.setText(file_length_str)
         self.static_val_hex = self.calculate_hex_string(0)
@@ -201,20 +193,7 @@ class TotalTableDlg(QDialog, Ui_TotalTable):
         :param length:
         :return:
         """
-        # 基础值
-        base_value = 2181038080
-        # 计算总和
-        total_value = base_value + length
-        # 转换为十六进制（8位，不足位数前补0）
-        hex_value = format(total_value, '08X')
-        # 提取部分
-        part1 = hex_value[6:8]  # 第 7 和第 8 位
-        part2 = hex_value[4:6]  # 第 5 和第 6 位
-        part3 = hex_value[2:4]  # 第 3 和第 4 位
-        part4 = hex_value[0:2]  # 第 1 和第 2 位
-        # 拼接结果
-        result = (part1 + part2 + part3 + part4) * 3  # 重复三次
-        return result
+        return table_utils.calculate_hex_string(length)
 
     def total_length_format_hex(self, total_length):
         """
@@ -222,25 +201,15 @@ class TotalTableDlg(QDialog, Ui_TotalTable):
         :param total_length:
         :return:
         """
-        # 转换为十六进制，确保长度为 8 位，不足的前面补零
-        hex_value = format(total_length, '08X')
-        # 提取各部分
-        part1 = hex_value[6:8]  # 第 7 和第 8 位
-        part2 = hex_value[4:6]  # 第 5 和第 6 位
-        part3 = hex_value[2:4]  # 第 3 和第 4 位
-        part4 = hex_value[0:2]  # 第 1 和第 2 位
-        # 拼接结果
-        result = (part1 + part2 + part3 + part4) * 3  # 重复三次
-        return result
+        return table_utils.total_length_format_hex(total_length)
 
     def get_total_action(self):
         """
-        读取动作表文件夹下所有以 AT 开头且包含四位十六进制数的 .bin 文件，拼接其内容为十六进制字符串，并计算总字节数
+        读取动作表文件夹下所有以 AT 开头且包含四位十六进制数的 .bin 文件，拼接其内容并计算总字节数
         :return:
         """
         # 打开文件夹选择对话框
-        Tk().withdraw()  # 隐藏主窗口
-        folder_path = filedialog.askdirectory(
+        folder_path = table_utils.ask_directory(
             title="选择 .bin 文件"
         )
 
@@ -248,64 +217,35 @@ class TotalTableDlg(QDialog, Ui_TotalTable):
             print("未选择任何文件夹")
             return
 
-        total_hex_content = ''
-        total_length = 0
-
-        # 正则表达式匹配以四位十六进制数
-        pattern = re.compile(r'AT.*?([0-9A-Fa-f]{4}).*?\.bin$')
-
-        # 遍历文件夹中的文件
-        for root, dirs, files in os.walk(folder_path):
-            for filename in files:
-                if filename.endswith('.bin') and pattern.match(filename):
-                    file_path = os.path.join(root, filename)
-                    with open(file_path, 'rb') as file:
-                        file_content = file.read()
-                        file_content_hex = file_content.hex().upper()  # 转换为十六进制字符串
-                        total_hex_content += file_content_hex
-                        total_length += len(file_content)
+        # 拼接文件夹中所有动作表的内容
+        action_files = table_utils.list_table_files(folder_path, table_utils.ACTION_FILE_PATTERN)
+        total_content = self.table_cache.read_segment('action', action_files)
+        total_length = len(total_content)
         # 动作表长度
         total_length_str = str(total_length)  # 将文件字节数转换为字符串
         self.action_length = total_length
         # 动作表内容
-        self.action_content_hex = total_hex_content
+        self.action_content = total_content
         # 更新 GUI 元素
         self.actionTable_lineEdit.setText(total_length_str)
         self.action_val_hex = self.calculate_hex_string(self.static_length)
         self.lineEdit_8.setText(self.action_val_hex)
         print(f"获取到所有动作表总字节数: {total_length}")
-        # print(f"拼接后的十六进制字符串: {total_hex_content}")
 
         # ------------生成总的动作表.bin文件------------
-        if len(self.action_content_hex) == 0:
+        if len(self.action_content) == 0:
             return
-        # 文件夹不存在则创建
         base_path = os.path.abspath('./total_bin')
-        if not os.path.exists(base_path):
-            os.makedirs(base_path)
-
-        # 计算总动作表的校验和
-        checksum = self.calculate_checksum(self.action_content_hex)
-        # 生成文件名，格式为 总动作表_0x校验和_生成时间.bin
-        file_name = self.generate_table_name("总动作表", checksum) + '.bin'
-        output_file_path = os.path.join(base_path, file_name)
-        # 生成总动作表的.bin文件
-        # output_file_path = base_path + os.path.sep + '总动作表' + '.bin'
-        # 将十六进制字符串转换为字节对象
-        hex_bytes = bytes.fromhex(self.action_content_hex)
-        # 将字节写入二进制文件
-        with open(output_file_path, 'wb') as binary_file:
-            binary_file.write(hex_bytes)
-
+        # 生成总动作表的.bin文件，文件名格式为 总动作表_0x校验和_生成时间.bin
+        table_utils.stream_table_file([self.action_content], base_path, "总动作表")
 
     def get_total_dynamic(self):
         """
-        读取动态表文件夹下所有以 DT 开头且包含四位数的 .bin 文件，拼接其内容为十六进制字符串，并计算总字节数
+        读取动态表文件夹下所有以 DT 开头且包含四位数的 .bin 文件，拼接其内容并计算总字节数
         :return:
         """
         # 打开文件夹选择对话框
-        Tk().withdraw()  # 隐藏主窗口
-        folder_path = filedialog.askdirectory(
+        folder_path = table_utils.ask_directory(
             title="选择 .bin 文件"
         )
 
@@ -313,27 +253,15 @@ class TotalTableDlg(QDialog, Ui_TotalTable):
             print("未选择任何文件夹")
             return
 
-        total_hex_content = ''
-        total_length = 0
-
-        # 正则表达式匹配以四位数字
-        pattern = re.compile(r'DT.*?(\d{4}).*?\.bin$')
-
-        # 遍历文件夹中的文件
-        for root, dirs, files in os.walk(folder_path):
-            for filename in files:
-                if filename.endswith('.bin') and pattern.match(filename):
-                    file_path = os.path.join(root, filename)
-                    with open(file_path, 'rb') as file:
-                        file_content = file.read()
-                        file_content_hex = file_content.hex().upper()  # 转换为十六进制字符串
-                        total_hex_content += file_content_hex
-                        total_length += len(file_content)
+        # 拼接文件夹中所有动态表的内容
+        dynamic_files = table_utils.list_table_files(folder_path, table_utils.DYNAMIC_FILE_PATTERN)
+        total_content = self.table_cache.read_segment('dynamic', dynamic_files)
+        total_length = len(total_content)
         # 动态表长度
         total_length_str = str(total_length)  # 将文件字节数转换为字符串
         self.dynamic_length = total_length
-        # 动作表内容
-        self.dynamic_content_hex = total_hex_content
+        # 动态表内容
+        self.dynamic_content = total_content
         # 更新 GUI 元素
         self.dynamicTable_lineEdit.setText(total_length_str)
         self.dynamic_val_hex = self.calculate_hex_string(self.static_length + self.action_length)
@@ -341,25 +269,11 @@ class TotalTableDlg(QDialog, Ui_TotalTable):
         print(f"获取到所有动态表总字节数: {total_length}")
 
         # ------------生成总的动态表.bin文件------------
-        if len(self.dynamic_content_hex) == 0:
+        if len(self.dynamic_content) == 0:
             return
-        # 文件夹不存在则创建
         base_path = os.path.abspath('./total_bin')
-        if not os.path.exists(base_path):
-            os.makedirs(base_path)
-
-        # 计算总动态表的校验和
-        checksum = self.calculate_checksum(self.dynamic_content_hex)
-        # 生成文件名，格式为 总动作表_0x校验和_生成时间.bin
-        file_name = self.generate_table_name("总动态表", checksum) + '.bin'
-        output_file_path = os.path.join(base_path, file_name)
-        # 生成总动态表的.bin文件
-        # output_file_path = base_path + os.path.sep + '总动态表' + '.bin'
-        # 将十六进制字符串转换为字节对象
-        hex_bytes = bytes.fromhex(self.dynamic_content_hex)
-        # 将字节写入二进制文件
-        with open(output_file_path, 'wb') as binary_file:
-            binary_file.write(hex_bytes)
+        # 生成总动态表的.bin文件，文件名格式为 总动态表_0x校验和_生成时间.bin
+        table_utils.stream_table_file([self.dynamic_content], base_path, "总动态表")
 
     def get_total_monitoring(self):
         """
@@ -367,8 +281,7 @@ class TotalTableDlg(QDialog, Ui_TotalTable):
         :return:
         """
         # 打开文件夹选择对话框
-        Tk().withdraw()  # 隐藏主窗口
-        file_path = filedialog.askopenfilename(
+        file_path = table_utils.ask_open_file(
             title="选择 .bin 文件",
             filetypes=[("二进制文件", "*.bin"), ("所有文件", "*.*")]
         )
@@ -380,19 +293,16 @@ class TotalTableDlg(QDialog, Ui_TotalTable):
         filename = os.path.basename(file_path)
         # 筛选符合条件的文件
         if filename.startswith('zt') and filename.endswith('.bin'):
-            with open(file_path, 'rb') as file:
-                file_content = file.read()
-                file_length = len(file_content)
-                file_length_str = str(file_length)  # 将文件字节数转换为字符串
-                file_content_hex = file_content.hex().upper()  # 转换为十六进制字符串
-
-                print(f"获取到监控表文件: {os.path.basename(file_path)}")
-                print(f"监控表总字节数: {file_length}")
-                # print(f"监控表内容: {file_content_hex}")
+            file_content = self.table_cache.read_segment('monitoring', [file_path])
+            file_length = len(file_content)
+            file_length_str = str(file_length)  # 将文件字节数转换为字符串
+
+            print(f"获取到监控表文件: {os.path.basename(file_path)}")
+            print(f"监控表总字节数: {file_length}")
         else:
             print("未找到符合条件的 .bin 文件")
         self.monitoring_length = file_length
-        self.monitoring_content_hex = file_content_hex
+        self.monitoring_content = file_content
         # 更新 GUI 元素
         self.monitoringTable_lineEdit.setText(file_length_str)
         self.monitoring_val_hex = self.calculate_hex_string(self.static_length+self.action_length+self.dynamic_length)
@@ -422,8 +332,9 @@ class TotalTableDlg(QDialog, Ui_TotalTable):
             QMessageBox.information(None, "Success", "没有表头需要生成，请先获取其他表数据！")
             return
 
+        table_head = bytes.fromhex(self.table_head_hex)
         # 计算表头的校验和
-        checksum = self.calculate_checksum(self.table_head_hex)
+        checksum = self.calculate_checksum(table_head)
 
         # 文件夹不存在则创建
         base_path = os.path.abspath('./total_bin')
@@ -434,8 +345,9 @@ class TotalTableDlg(QDialog, Ui_TotalTable):
         # file_name = self.generate_table_name("表头", checksum) + '.bin'
         #output_file_path = os.path.join(base_path, file_name)
         # 生成静态表的.bin文件
-        output_file_path = base_path + os.path.sep + f'AT_已_F000表(电机1关电机2关电机3关电机4关电机5关)00C0H(静态表长度{self.static_length})25H(动作表长度{self.action_length})25H(动态表长度{self.dynamic_length})25H(监控表长度{self.monitoring_length})25H(总长度{self.total_table_length})25H' + '.bin'
-        hex_string_to_binary_file(self.table_head_hex, output_file_path)
+        output_file_path = base_path + os.path.sep + table_utils.table_head_file_name(
+            self.static_length, self.action_length, self.dynamic_length, self.monitoring_length)
+        table_utils.write_table_file(table_head, output_file_path)
         print(f"表头生成成功！\n文件所在目录：{base_path}")
         QMessageBox.information(None, "Success", f"表头生成成功！\n文件所在目录：{base_path}")
 
@@ -445,29 +357,16 @@ class TotalTableDlg(QDialog, Ui_TotalTable):
         :return:
         """
         # 总表 = 静态表 + 总动作表 + 总动态表 + 总监控表
-        self.total_table_hex = self.static_content_hex + self.action_content_hex + self.dynamic_content_hex + self.monitoring_content_hex
+        segments = self.total_table_segments()
         # 将生成的总表写入文件
-        if len(self.total_table_hex) == 0:
+        if sum(len(segment) for segment in segments) == 0:
             QMessageBox.information(None, "Success", "没有总表需要生成！")
             return
-        # 文件夹不存在则创建
         base_path = os.path.abspath('./total_bin')
-        if not os.path.exists(base_path):
-            os.makedirs(base_path)
-
-        # 计算总表的校验和
-        checksum = self.calculate_checksum(self.total_table_hex)
-
-        # 生成文件名，格式为 总表_0x校验和_生成时间.bin
-        file_name = self.generate_table_name("总表", checksum) + '.bin'
-        output_file_path = os.path.join(base_path, file_name)
-        # 生成总表的.bin文件
-        #output_file_path = base_path + os.path.sep + '总表' + '.bin'
-        # 将十六进制字符串转换为字节对象
-        hex_bytes = bytes.fromhex(self.total_table_hex)
-        # 将字节写入二进制文件
-        with open(output_file_path, 'wb') as binary_file:
-            binary_file.write(hex_bytes)
+        # 生成总表的.bin文件，文件名格式为 总表_0x校验和_生成时间.bin
+        output_file_path, checksum = table_utils.stream_table_file(segments, base_path, "总表")
+        # 记录本次总表的构建清单，下次生成时只重新读取改动过的表文件
+        self.table_cache.save(output_file_path)
         print(f"总表生成成功！\n文件所在目录：{base_path}")
         QMessageBox.information(None, "Success", f"总表生成成功！\n文件所在目录：{base_path}")
 
@@ -478,48 +377,30 @@ class TotalTableDlg(QDialog, Ui_TotalTable):
         """
         self.table_head_hex = (self.total_table_config + self.motor_hex_str + self.static_val_hex + self.action_val_hex +
                     self.dynamic_val_hex + self.monitoring_val_hex + self.total_table_length_val_hex)
-        self.total_table_hex = self.static_content_hex + self.action_content_hex + self.dynamic_content_hex + self.monitoring_content_hex
-        # 最终总表 = 表头 + 总表*3
-        self.finally_total_table_hex = self.table_head_hex + self.total_table_hex*3
-        if len(self.total_table_hex) == 0:
+        segments = self.total_table_segments()
+        if sum(len(segment) for segment in segments) == 0:
             QMessageBox.information(None, "Success", "没有总表+3总表需要生成！")
             return
         # 将生成的表头+3总表写入文件
-        # 文件夹不存在则创建
         base_path = os.path.abspath('./total_bin')
-        if not os.path.exists(base_path):
-            os.makedirs(base_path)
-
-        # 计算最终总表的校验和
-        checksum = self.calculate_checksum(self.finally_total_table_hex)
-        # 生成文件名，格式为 总表+3总表_0x校验和_生成时间.bin
-        file_name = self.generate_table_name("总表+3总表", checksum) + '.bin'
-        output_file_path = os.path.join(base_path, file_name)
-        # 生成总表的.bin文件
-        # output_file_path = base_path + os.path.sep + '表头+3总表' + '.bin'
-        # 将十六进制字符串转换为字节对象
-        hex_bytes = bytes.fromhex(self.finally_total_table_hex)
-        # 将字节写入二进制文件
-        with open(output_file_path, 'wb') as binary_file:
-            binary_file.write(hex_bytes)
+        # 最终总表 = 表头 + 总表*3，同一份总表数据依次写入三次，文件名格式为 总表+3总表_0x校验和_生成时间.bin
+        table_utils.stream_table_file([bytes.fromhex(self.table_head_hex)] + segments * 3, base_path, "总表+3总表")
         print(f"总表+3总表生成成功！\n文件所在目录：{base_path}")
         QMessageBox.information(None, "Success", f"总表+3总表生成成功！\n文件所在目录：{base_path}")
         # 关闭窗口
         self.close()
 
-    def calculate_checksum(self, hex_str):
-        """根据给定的十六进制字符串计算校验和"""
-        # 将十六进制字符串转换为字节数组
-        data = bytes.fromhex(hex_str)
-        # 计算所有字节的累加和，取低字节
-        checksum = sum(data) % 256
-        return checksum
+    def total_table_segments(self):
+        """
+        总表的各部分：静态表、总动作表、总动态表、总监控表
+        :return:
+        """
+        return [self.static_content, self.action_content, self.dynamic_content, self.monitoring_content]
+
+    def calculate_checksum(self, data):
+        """计算字节串的校验和"""
+        return table_utils.calculate_checksum(data)
 
     def generate_table_name(self, base_name, checksum):
         """生成表名，格式为 表名_0x校验和_生成时间"""
-        current_time = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        table_name = f"{base_name}_0x{checksum:02X}_{current_time}"
-        return table_name
-
-
-
+        return table_utils.generate_table_name(base_name, checksum)
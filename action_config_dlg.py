@@ -0,0 +1,171 @@
+from PySide6.QtCore import Signal
+from PySide6.QtWidgets import QDialog, QMessageBox
+
+from utils.data_utils import get_action_id
+from utils.field_spec import ENCODE_ERRORS
+
+# 无法编码的输入控件的样式
+INVALID_STYLE = "background-color: #FFC8C8;"
+
+
+class ActionConfigDlg(QDialog):
+    """
+    动作参数配置界面的基类
+
+    界面上的输入框、下拉框、复选框绑定到参数声明（utils/action_specs.py）中的输入，
+    输入改变时只重新计算依赖它的字段，并只刷新这些字段的16进制值和16进制缩写。
+    输入值无法编码（非数字、超出范围等）时该控件标红并在提示中说明原因，存在无效输入时不能生成动作ID。
+    子类需要同时继承对应的Ui类，并在构造函数中绑定控件。
+    """
+
+    # 创建信号
+    config_hex_signal = Signal(str, int)
+
+    def __init__(self, spec):
+        """
+        :param spec: 动作类别的参数声明（ActionSpec）
+        """
+        super(ActionConfigDlg, self).__init__()
+        # 最终生成参数配置的十六进制编码
+        self.config_hex = ""
+        # 最终生成参数配置的字节串
+        self.config_bytes = b""
+        # 是否是新动作(是=1, 否=0)
+        self.is_new_action = 0
+        # 存放最后生成的动作id
+        self.action_id = ""
+        self.setupUi(self)
+        self.spec = spec
+        # 缓存的参数记录
+        self.record = spec.new_record()
+        # {字段名: (16进制输入框, 16进制缩写输入框)}
+        self.displays = {}
+        # {输入名: 控件}
+        self.input_widgets = {}
+        # 无法编码的输入 {输入名: {字段名: 错误信息}}
+        self.invalid_inputs = {}
+
+        # 生成动作ID按钮
+        self.generateIDPushButton.clicked.connect(self.generate_action_ID)
+        # 确定按钮
+        self.commitPushButton.clicked.connect(self.commit_config)
+        # 取消按钮
+        self.cancelPushButton.clicked.connect(self.cancel_config)
+
+    # ---------------- 控件绑定 ----------------
+    def bind_line_edit(self, line_edit, input_name):
+        """
+        输入框绑定到输入，显示默认值
+        """
+        self.input_widgets[input_name] = line_edit
+        line_edit.setText(str(self.record.values[input_name]))
+        line_edit.textChanged.connect(lambda text: self.input_changed(input_name, text))
+
+    def bind_combo_box(self, combo_box, input_name):
+        """
+        下拉框的索引绑定到输入，选中默认选项
+        """
+        self.input_widgets[input_name] = combo_box
+        combo_box.setCurrentIndex(self.record.values[input_name])
+        combo_box.currentIndexChanged.connect(lambda index: self.input_changed(input_name, index))
+
+    def bind_check_box(self, check_box, input_name, checked_val="11", unchecked_val="00"):
+        """
+        复选框绑定到输入
+        :param checked_val: 选中时输入的值
+        :param unchecked_val: 未选中时输入的值
+        """
+        self.input_widgets[input_name] = check_box
+        check_box.setChecked(self.record.values[input_name] == checked_val)
+        check_box.stateChanged.connect(
+            lambda state: self.input_changed(input_name, checked_val if state == 2 else unchecked_val))
+
+    def bind_display(self, field_name, hex_line_edit, omit_line_edit=None):
+        """
+        字段的16进制值和16进制缩写显示到界面上
+        """
+        self.displays[field_name] = (hex_line_edit, omit_line_edit)
+        self.show_field(field_name)
+
+    def show_field(self, field_name):
+        """
+        刷新一个字段在界面上显示的16进制值和16进制缩写
+        """
+        display = self.displays.get(field_name)
+        if display is None:
+            return
+        hex_line_edit, omit_line_edit = display
+        hex_line_edit.setText(self.record.field_hex(field_name))
+        if omit_line_edit is not None:
+            omit_line_edit.setText(self.record.field_omit(field_name))
+
+    def input_changed(self, input_name, value):
+        """
+        输入改变：重新计算依赖该输入的字段，只刷新这些字段的显示
+        编码失败的字段保留原来的字节，该输入标记为无效
+        """
+        errors = {}
+        for field_name in self.record.assign(input_name, value):
+            try:
+                self.record.refresh(field_name)
+            except ENCODE_ERRORS as error:
+                errors[field_name] = str(error) or type(error).__name__
+                continue
+            # 字段编码成功，之前因该字段标记的无效输入随之恢复
+            for name in [name for name, fields in self.invalid_inputs.items() if fields.pop(field_name, None)]:
+                if not self.invalid_inputs[name]:
+                    self.mark_input(name)
+            self.show_field(field_name)
+        if errors:
+            self.invalid_inputs.setdefault(input_name, {}).update(errors)
+        self.mark_input(input_name)
+
+    def mark_input(self, input_name):
+        """
+        按是否能编码设置输入控件的样式和提示
+        """
+        fields = self.invalid_inputs.get(input_name)
+        if not fields:
+            self.invalid_inputs.pop(input_name, None)
+        widget = self.input_widgets.get(input_name)
+        if widget is None:
+            return
+        if fields:
+            widget.setStyleSheet(INVALID_STYLE)
+            widget.setToolTip("\n".join(f"{field_name}：{error}" for field_name, error in fields.items()))
+        else:
+            widget.setStyleSheet("")
+            widget.setToolTip("")
+
+    # ---------------- 生成动作ID、提交、取消 ----------------
+    def lookup_action_id(self, config_hex):
+        """
+        根据参数编码查询（或分配）动作ID
+        :return: (动作id, 是否是新动作)
+        """
+        return get_action_id(config_hex, self.spec.action_code)
+
+    def generate_action_ID(self):
+        # 有无法编码的输入时记录中保留的是旧值，不能生成动作ID
+        if self.invalid_inputs:
+            messages = [f"{field_name}：{error}" for fields in self.invalid_inputs.values()
+                        for field_name, error in fields.items()]
+            QMessageBox.warning(self, "错误", "以下参数无效，请修改后再生成动作ID：\n" + "\n".join(messages))
+            return
+        # 得到最终的动作参数编码
+        self.config_bytes = self.record.to_bytes()
+        self.config_hex = self.record.hex()
+        self.action_id, self.is_new_action = self.lookup_action_id(self.config_hex)
+        # id显示到界面
+        self.actionIDLineEdit.setText(self.action_id)
+
+    def commit_config(self):
+        # 发送信号(id的前两位和后两位要调换位置)
+        self.config_hex_signal.emit(self.action_id[2:] + self.action_id[0:2] + self.config_hex, self.is_new_action)
+        # 发送完关闭窗口
+        self.close()
+
+    def cancel_config(self):
+        # 取消配置
+        self.actionIDLineEdit.clear()
+        self.close()
@@ -0,0 +1,70 @@
+import importlib
+import threading
+
+# 动作参数配置界面注册表 {动作代码: (模块名, 类名, 界面名称)}
+# 动作代码为动作ID的首位（与动作下拉框的索引一一对应），配置界面在第一次打开时才导入
+ACTION_DIALOGS = {
+    '0': ("furnace_switch_dlg", "FurnaceSwitchDlg", "0炉子开关参数配置界面"),
+    '1': ("hearth_wire_motor_dlg", "HearthWireMotorDlg", "1炉丝电机参数配置界面"),
+    '2': ("transfer1_dlg", "Transfer1Dlg", "转机1参数配置界面"),
+    '3': ("sample2_dlg", "Sample2Dlg", "样提机2参数配置界面"),
+    '4': ("stove3_dlg", "Stove3Dlg", "炉上机3参数配置界面"),
+    '5': ("stove4_dlg", "Stove4Dlg", "炉中机4参数配置界面"),
+    '6': ("stove5_dlg", "Stove5Dlg", "炉下机5参数配置界面"),
+    '7': ("motor_status_inquiry_dlg", "MotorStatusInquiryDlg", "电机状态查询参数配置界面"),
+    '8': ("magnetic_field_dlg", "MagneticFieldDlg", "磁场参数配置界面"),
+    '9': ("motor_magnetic_field_current_dlg", "MotorMagneticFieldCurrentDlg", "电机磁场电流参数配置界面"),
+    'A': ("furnace_wire_heating_dlg", "FurnaceWireHeatingDlg", "炉丝加热电压参数配置界面"),
+    'B': ("PID_Temperature_control_dlg", "PIDTemperatureControlDlg", "PID控温曲线配置界面"),
+    'C': ("online_monitoring_status_dlg", "OnlineMonitoringStatusDlg", "在线监控状态查询表"),
+    'D': ("motor_closing_dlg", "MotorClosingDlg", "电机关闭设置界面"),
+    'E': ("online_monitoring_head_dlg", "OnlineMonitoringHeadDlg", "在线监控表头设置"),
+    'F': ("PID_config_settings_dlg", "PIDConfigSettingsDlg", "PID参数设置动作表"),
+}
+
+# 已导入的配置界面类 {动作代码: 类}
+_dialog_classes = {}
+_lock = threading.Lock()
+
+
+def action_code_of_index(index):
+    """
+    动作下拉框的索引转为动作代码
+    :param index: 下拉框索引（0~15）
+    :return: 动作代码（'0'~'F'）
+    """
+    return format(index, 'X')
+
+
+def dialog_title(action_code):
+    """
+    获取动作参数配置界面的名称
+    :param action_code: 动作代码
+    """
+    return ACTION_DIALOGS[str(action_code).upper()][2]
+
+
+def get_dialog_class(action_code):
+    """
+    按动作代码获取参数配置界面类，第一次使用时导入对应模块并缓存
+    :param action_code: 动作代码（'0'~'F'）
+    :return: 配置界面类
+    :raise KeyError: 未知的动作代码
+    """
+    action_code = str(action_code).upper()
+    with _lock:
+        dialog_class = _dialog_classes.get(action_code)
+        if dialog_class is None:
+            module_name, class_name, _ = ACTION_DIALOGS[action_code]
+            dialog_class = getattr(importlib.import_module(module_name), class_name)
+            _dialog_classes[action_code] = dialog_class
+        return dialog_class
+
+
+def create_dialog(action_code):
+    """
+    创建动作参数配置界面
+    :param action_code: 动作代码
+    :return: 配置界面对象
+    """
+    return get_dialog_class(action_code)()
@@ -3,32 +3,18 @@ import sys
 from PySide6 import QtWidgets
 from PySide6.QtCore import Signal
 import subprocess
-from PySide6.QtWidgets import QDialog, QTableWidgetItem, QMessageBox, QFileDialog
+from PySide6.QtWidgets import QDialog, QMessageBox, QFileDialog
 
 from ui.dynamictable import Ui_DynamicTable
-from StaticTableDlg import StaticTableDlg
-from TotalTableDlg import TotalTableDlg
 from ui.MainWindow import Ui_MainWindow
 from ui.NewFlowItem import Ui_NewFlowItem
 
-from furnace_switch_dlg import FurnaceSwitchDlg
-from hearth_wire_motor_dlg import HearthWireMotorDlg
-from transfer1_dlg import Transfer1Dlg
-from sample2_dlg import Sample2Dlg
-from stove3_dlg import Stove3Dlg
-from stove4_dlg import Stove4Dlg
-from stove5_dlg import Stove5Dlg
-from motor_status_inquiry_dlg import MotorStatusInquiryDlg
-from magnetic_field_dlg import MagneticFieldDlg
-from motor_magnetic_field_current_dlg import MotorMagneticFieldCurrentDlg
-from furnace_wire_heating_dlg import FurnaceWireHeatingDlg
-from PID_Temperature_control_dlg import PIDTemperatureControlDlg
-from online_monitoring_status_dlg import OnlineMonitoringStatusDlg
-from motor_closing_dlg import MotorClosingDlg
-from online_monitoring_head_dlg import OnlineMonitoringHeadDlg
-from PID_config_settings_dlg import PIDConfigSettingsDlg
-from utils.data_utils import hex_string_to_binary_file, clear_data, load_action_bin_to_data, store_data
-from db_utils import *
+import action_dialogs
+from flow_table_model import FlowTableModel
+from utils import table_utils
+from utils.data_utils import (action_code_of, data_dict, store_new_actions, sync_action_bin_to_data,
+                              write_action_bins)
+from db_utils import format_four_digits, save_to_excel
 
 
 class FlowItem:
@@ -36,6 +22,9 @@ class FlowItem:
     实验流程项类，定义了实验流程表中一行的参数信息
     """
 
+    __slots__ = ("startTime", "startCondition", "descText", "endCriterion", "interval", "duration", "remark",
+                 "actionID", "config_hex", "is_new_action")
+
     def __init__(self):
         # 起始时刻
         self.startTime = 0
@@ -122,86 +111,12 @@ class NewFlowItemDlg(QDialog, Ui_NewFlowItem):
         """
         打开动作参数配置对话框
         """
-        if self.currentIndex == 0:
-            dlg = FurnaceSwitchDlg()
-            dlg.config_hex_signal.connect(self.get_config_hex_from_dlg)
-            print("^^^^^^打开0炉子开关参数配置界面！")
-            dlg.exec()
-        elif self.currentIndex == 1:
-            dlg = HearthWireMotorDlg()
-            dlg.config_hex_signal.connect(self.get_config_hex_from_dlg)
-            print("^^^^^^打开1炉丝电机参数配置界面！")
-            dlg.exec()
-        elif self.currentIndex == 2:
-            dlg = Transfer1Dlg()
-            dlg.config_hex_signal.connect(self.get_config_hex_from_dlg)
-            print("^^^^^^打开转机1参数配置界面！")
-            dlg.exec()
-        elif self.currentIndex == 3:
-            dlg = Sample2Dlg()
-            dlg.config_hex_signal.connect(self.get_config_hex_from_dlg)
-            print("^^^^^^打开样提机2参数配置界面！")
-            dlg.exec()
-        elif self.currentIndex == 4:
-            dlg = Stove3Dlg()
-            dlg.config_hex_signal.connect(self.get_config_hex_from_dlg)
-            print("^^^^^^打开炉上机3参数配置界面！")
-            dlg.exec()
-        elif self.currentIndex == 5:
-            dlg = Stove4Dlg()
-            dlg.config_hex_signal.connect(self.get_config_hex_from_dlg)
-            print("^^^^^^打开炉中机4参数配置界面！")
-            dlg.exec()
-        elif self.currentIndex == 6:
-            dlg = Stove5Dlg()
-            dlg.config_hex_signal.connect(self.get_config_hex_from_dlg)
-            print("^^^^^^打开炉下机5参数配置界面！")
-            dlg.exec()
-        elif self.currentIndex == 7:
-            dlg = MotorStatusInquiryDlg()
-            dlg.config_hex_signal.connect(self.get_config_hex_from_dlg)
-            print("^^^^^^打开电机状态查询参数配置界面！")
-            dlg.exec()
-        elif self.currentIndex == 8:
-            dlg = MagneticFieldDlg()
-            dlg.config_hex_signal.connect(self.get_config_hex_from_dlg)
-            print("^^^^^^打开磁场参数配置界面！")
-            dlg.exec()
-        elif self.currentIndex == 9:
-            dlg = MotorMagneticFieldCurrentDlg()
-            dlg.config_hex_signal.connect(self.get_config_hex_from_dlg)
-            print("^^^^^^打开电机磁场电流参数配置界面！")
-            dlg.exec()
-        elif self.currentIndex == 10:
-            dlg = FurnaceWireHeatingDlg()
-            dlg.config_hex_signal.connect(self.get_config_hex_from_dlg)
-            print("^^^^^^打开炉丝加热电压参数配置界面！")
-            dlg.exec()
-        elif self.currentIndex == 11:
-            dlg = PIDTemperatureControlDlg()
-            dlg.config_hex_signal.connect(self.get_config_hex_from_dlg)
-            print("^^^^^^打开PID控温曲线配置界面！")
-            dlg.exec()
-        elif self.currentIndex == 12:
-            dlg = OnlineMonitoringStatusDlg()
-            dlg.config_hex_signal.connect(self.get_config_hex_from_dlg)
-            print("^^^^^^打开在线监控状态查询表！")
-            dlg.exec()
-        elif self.currentIndex == 13:
-            dlg = MotorClosingDlg()
-            dlg.config_hex_signal.connect(self.get_config_hex_from_dlg)
-            print("^^^^^^电机关闭设置界面！")
-            dlg.exec()
-        elif self.currentIndex == 14:
-            dlg = OnlineMonitoringHeadDlg()
-            dlg.config_hex_signal.connect(self.get_config_hex_from_dlg)
-            print("^^^^^^在线监控表头设置！")
-            dlg.exec()
-        elif self.currentIndex == 15:
-            dlg = PIDConfigSettingsDlg()
-            dlg.config_hex_signal.connect(self.get_config_hex_from_dlg)
-            print("^^^^^^PID参数设置动作表！")
-            dlg.exec()
+        # 配置界面按动作代码在第一次打开时导入
+        action_code = action_dialogs.action_code_of_index(self.currentIndex)
+        dlg = action_dialogs.create_dialog(action_code)
+        dlg.config_hex_signal.connect(self.get_config_hex_from_dlg)
+        print(f"^^^^^^打开{action_dialogs.dialog_title(action_code)}！")
+        dlg.exec()
 
     def changeCurrentIndex(self):
         """
@@ -253,24 +168,21 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         self.is_new_action = 0 # (0: 不是新动作，1: 是新动作)
         # 点击新建流程项按钮
         self.newItemButton.clicked.connect(self.show_new_item_dialog)
-        # 流程表项索引
-        self.rowCount = 0
-        # 流程表格样式设置
-        self.flowTableWidget.resizeRowsToContents()
+        # 实验流程表的模型，生成动态表时直接读取其中的流程项
+        self.flow_model = FlowTableModel(self)
+        self.flowTableView.setModel(self.flow_model)
+        # 流程表每次修改后检查时间线（同一设备的动作重叠、起始时刻顺序、流程项数）
+        self.timeline_issues = []
+        for signal in (self.flow_model.rowsInserted, self.flow_model.rowsRemoved, self.flow_model.rowsMoved,
+                       self.flow_model.modelReset):
+            signal.connect(self.check_timeline)
         # 存放新动作的16进制参数配置信息
         self.new_action_hex_list = []
         self.new_action_hex_list1 = []
-        # 临时存放动作参数配置的16进制编码
-        self.temp_config_hex = []
-        # 存放动态表的16进制配置信息
-        self.dynamic_hex_list = []
+        # 已生成的动作表文件的内容哈希 {文件路径: sha256}
+        self.action_bin_digests = {}
         # 生成动作表
         # self.pushButton_1.clicked.connect(self.generate_action_bin)
-        # 存放动作表信息
-        self.action_info = []
-        self.action_startTime = 0
-        self.action_actionID = ''
-        self.action_duration = 0
         # 删除动作表流程项
         self.deleteItemPushButton.clicked.connect(self.delete_action_item)
         # 生成动态表
@@ -292,6 +204,10 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         # 打开流程表
         self.open_excel_file_PushButton.clicked.connect(self.open_excel_file)
 
+        # 流程曲线（非模态，编辑流程表时随之更新）
+        self.flow_curve_dlg = None
+        self.flowCurvePushButton.clicked.connect(self.show_flow_curve_dialog)
+
     def load_data(self):
         """
         点击导入数据按钮：导入动作表数据
@@ -310,13 +226,19 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         # 用户选择了的有效目录
         if selected_directory:
             print("用户选择的目录:", selected_directory)
-            # 清空原有的数据
-            clear_data()
-            print("》》》》》》》导入数据开始》》》》》》")
-            # 导入新的数据
-            load_action_bin_to_data(selected_directory + os.path.sep)
-            print("》》》》》》》导入数据结束》》》》》》")
-            QMessageBox.information(None, "Success", "导入成功！")
+            print("》》》》》》》同步数据开始》》》》》》")
+            # 只导入新增、改动的动作表，删除已删除的动作表导入的记录
+            report = sync_action_bin_to_data(selected_directory + os.path.sep)
+            print("》》》》》》》同步数据结束》》》》》》")
+            summary = (f"新增文件{report['added']}个，改动{report['changed']}个，删除{report['removed']}个，"
+                       f"未改动{report['unchanged']}个")
+            duplicate_count = len(report["duplicates"])
+            collision_count = len(report["collisions"])
+            if duplicate_count or collision_count:
+                QMessageBox.warning(None, "同步完成", f"{summary}；跳过重复配置{duplicate_count}条，"
+                                                   f"ID冲突{collision_count}条（详见控制台输出）")
+            else:
+                QMessageBox.information(None, "Success", f"同步成功！{summary}")
 
     def show_new_item_dialog(self):
         new_item_dlg = NewFlowItemDlg()
@@ -330,54 +252,25 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         :param new_item: 新建的实验流程项
         :return:
         """
-        # 插入索引
-        index_item = QTableWidgetItem(str(self.rowCount + 1))
-        self.flowTableWidget.setItem(self.rowCount, 0, index_item)
-        # 插入起始时间
-        start_time_item = QTableWidgetItem(new_item.startTime)
-        self.flowTableWidget.setItem(self.rowCount, 1, start_time_item)
-        # # 插入动作起始条件
-        # start_condition_item = QTableWidgetItem(new_item.startCondition)
-        # self.flowTableWidget.setItem(self.rowCount, 2, start_condition_item)
-        # # 插入动作名称与描述
-        # desc_text_item = QTableWidgetItem(new_item.descText)
-        # self.flowTableWidget.setItem(self.rowCount, 3, desc_text_item)
-        # # 插入动作结束判据
-        # end_criterion_item = QTableWidgetItem(new_item.endCriterion)
-        # self.flowTableWidget.setItem(self.rowCount, 4, end_criterion_item)
-        # # 插入多长时间后下一个动作
-        # interval_item = QTableWidgetItem(new_item.interval)
-        # self.flowTableWidget.setItem(self.rowCount, 5, interval_item)
-        # 插入动作时间（s）
-        #duration_item = QTableWidgetItem(new_item.duration)
-        #self.flowTableWidget.setItem(self.rowCount, 6, duration_item)
-        # # 插入备注
-        # remark_item = QTableWidgetItem(new_item.remark)
-        # self.flowTableWidget.setItem(self.rowCount, 7, remark_item)
-        # 插入动作ID
-        action_ID_item = QTableWidgetItem(new_item.actionID)
-        self.flowTableWidget.setItem(self.rowCount, 8, action_ID_item)
         # 是否是新动作
         self.is_new_action = new_item.is_new_action
-        is_new_action_item = QTableWidgetItem("是" if new_item.is_new_action == 1 else "否")
-        self.flowTableWidget.setItem(self.rowCount, 9, is_new_action_item)
-
-        # -------------------把信息存入动态表------------------
         try:
-            self.action_startTime = int(new_item.startTime)
+            start_time = int(new_item.startTime)
         except ValueError:
             QMessageBox.warning(self, "错误", "请输入动作起始时刻！")
             return
-        self.action_actionID = new_item.actionID
-        # self.action_duration = int(new_item.duration)
-        self.action_duration = 0
-        self.action_info.append((self.action_startTime, self.action_actionID, self.action_duration))
-        self.temp_config_hex.append(new_item.config_hex)
-
-        # 更新行索引
-        self.rowCount = self.rowCount + 1
-        # 插入的动作时间
-        #self.finally_action_duration = int(new_item.duration)
+        if len(new_item.actionID) != 4:
+            QMessageBox.warning(self, "错误", "请先创建动作并生成动作ID！")
+            return
+        # 插入流程项（动作时间暂时都为0）
+        self.flow_model.append_item(start_time, new_item.actionID, new_item.config_hex, new_item.is_new_action)
+        # 新流程项引起的时间线问题（插入信号已触发检查）
+        new_row = self.flow_model.rowCount() - 1
+        new_issues = [issue for issue in self.timeline_issues if new_row in issue["rows"]]
+        if new_issues:
+            from utils.timeline_check import format_issues
+
+            QMessageBox.warning(self, "流程时间线检查", format_issues(new_issues))
         # 如果是新动作则保存配置信息
         if new_item.is_new_action == 1:
             self.new_action_hex_list.append(new_item.config_hex)
@@ -387,38 +280,56 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         # --------------生成动作表.bin文件---------------
         self.generate_action_bin()
 
+    def check_timeline(self):
+        """
+        检查实验流程表的时间线，结果显示在状态栏中
+        :return:
+        """
+        store = self.flow_model.store
+        if len(store) == 0:
+            self.timeline_issues = []
+            self.statusbar.clearMessage()
+            return
+        # 电机运动时间的估计依赖numpy，第一次检查时才导入，不影响程序启动时间
+        from utils.timeline_check import check_timeline, format_issues
+
+        actions = {}
+        for index in range(len(store)):
+            config = store.config(index)
+            if config:
+                actions.setdefault(store.action_id(index), config)
+        self.timeline_issues = check_timeline(store.action_info(), actions, self.MAX_ACTION_NUM)
+        if self.timeline_issues:
+            print(f"流程时间线检查发现{len(self.timeline_issues)}个问题：\n{format_issues(self.timeline_issues)}")
+            self.statusbar.showMessage(f"流程时间线检查：{self.timeline_issues[0]['message']}"
+                                       f"（共{len(self.timeline_issues)}个问题）")
+        else:
+            self.statusbar.clearMessage()
+
     def delete_action_item(self):
         """
         删除实验流程表中的一行实验流程项
         :return:
         """
         # 获取选中的行索引
-        selected_row_index = self.flowTableWidget.currentRow()
+        selected_row_index = self.flowTableView.currentIndex().row()
 
         # 如果没有选中行，selected_row_index 会是 -1，防止误删除
         if selected_row_index < 0:
             return
-        # 删除该行数据
-        self.flowTableWidget.removeRow(selected_row_index)
-        # 更新行索引
-        self.rowCount = self.rowCount - 1
-        # 重新设置行索引
-        for i in range(selected_row_index, self.rowCount):
-            index_item = QTableWidgetItem(str(i + 1))
-            self.flowTableWidget.setItem(i, 0, index_item)  # 更新索引
-        # 删除self.new_action_hex_list中的对应项self.temp_config_hex
-        hex_to_remove = self.temp_config_hex[selected_row_index]
+        # 删除 new_action_hex_list1 中的对应项
+        hex_to_remove = self.flow_model.config_hex(selected_row_index)
         if hex_to_remove in self.new_action_hex_list1:
             self.new_action_hex_list1.remove(hex_to_remove)
-            # 删除 action_info 中的对应项
-            del self.action_info[selected_row_index]
-            # 删除 temp_config_hex 中的对应项
-            del self.temp_config_hex[selected_row_index]
+        # 删除该行数据，后面各行的序号由模型更新
+        self.flow_model.remove_items(selected_row_index)
 
     def show_generate_static_dialog(self):
         """
         点击生成静态表按钮，弹出对话框
         """
+        from StaticTableDlg import StaticTableDlg
+
         dlg = StaticTableDlg()
         dlg.exec()
 
@@ -427,37 +338,40 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         生成动作表的.bin文件
         :return: void
         '''
-        # 去重
-        self.new_action_hex_list = list(set(self.new_action_hex_list))
         if len(self.new_action_hex_list) == 0:
             if self.is_new_action == 0:
                 print(">>>>>>>生成的动作不是新动作！")
                 return
         print(f"新动作的参数配置:{self.new_action_hex_list}")
-        # 文件夹不存在则创建
+        # --------------先把新建动作存入.txt文件中（每个类别只写入一次）-----------------
+        results = store_new_actions(self.new_action_hex_list)
+        stored = []
+        failed = []
+        new_counts = {}
+        for config_hex, (action_id, result) in results.items():
+            requested_id = config_hex[2:4] + config_hex[0:2]
+            if result == "new":
+                action_code = action_code_of(requested_id)
+                new_counts[action_code] = new_counts.get(action_code, 0) + 1
+            if result in ("new", "exists"):
+                stored.append(config_hex)
+            elif result == "duplicate":
+                failed.append(f"{requested_id}：该参数配置已保存为动作 {action_id}")
+            else:
+                failed.append(f"{requested_id}：动作ID已被其他参数配置占用")
+        for action_code, count in new_counts.items():
+            print(f">>>>>>更新动作表.txt文件:{data_dict[action_code]} 写入{count}条")
+
+        # 只为保存成功的动作生成.bin文件；文件夹不存在则创建，按添加顺序生成，内容没变的文件不再重写
         base_path = os.path.abspath('./action_bin')
-        if not os.path.exists(base_path):
-            os.makedirs(base_path)
-        for hex_str in self.new_action_hex_list:
-            output_file_path = base_path + os.path.sep + 'AT_' + hex_str[2:4] + hex_str[0:2] + '.bin'
-            hex_string_to_binary_file(hex_str, output_file_path)
-
-        # --------------同时把新建动作存入.txt文件中-----------------
-        for data in self.new_action_hex_list:
-            # 获取前四个字符
-            original_prefix = data[:4].upper()
-            # 动作ID
-            action_id = original_prefix[2:4] + original_prefix[0:2]
-            # 参数编码
-            config_code = data[4:].upper()
-            # 打印输出
-            print(f">>>>>>更新动作表.txt文件:{action_id} -> {config_code}")
-            # 保存到.txt文件
-            action_code = action_id[0:1]
-            if action_code.isdigit():
-                action_code = int(action_code)
-            store_data(action_id + " " + config_code, action_code)
-        QMessageBox.information(None, "Success", f"新动作ID生成成功！\n文件所在目录：{base_path}")
+        written, unchanged = write_action_bins(stored, base_path, self.action_bin_digests)
+        print(f"++++++写入动作表{len(written)}个，未改动{len(unchanged)}个")
+        if failed:
+            QMessageBox.warning(None, "动作ID冲突", "以下动作没有保存，也没有生成动作表文件，"
+                                "请删除对应的流程项后重新生成动作ID：\n" + "\n".join(failed) +
+                                f"\n\n其余{len(stored)}个动作的文件所在目录：{base_path}")
+        else:
+            QMessageBox.information(None, "Success", f"新动作ID生成成功！\n文件所在目录：{base_path}")
 
         # 清空new_action_hex_list
         self.new_action_hex_list = []
@@ -488,49 +402,30 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         #     QMessageBox.information(None, "Success", "最后一个动作时间请填65535！")
         #     return
         print(f"动态表配置序号ID：{dynamicId}")
-        # 先清空temp_dynamic_info 列表中的所有数据
-        self.temp_dynamic_info = []
-        # 取出列表中的最后一个元组
-        last_tuple = self.action_info[-1]
-        # 创建一个新的元组，修改其中的 action_duration 为 65535
-        new_tuple = (last_tuple[0], last_tuple[1], 65535)
-        # 将新的元组替换回列表的最后一个位置
-        self.action_info[-1] = new_tuple
-        for item in self.action_info:
-            start_time, action_id, duration = item
-            # 插入数据
-            self.insert_temp_dynamic_info(start_time, action_id, duration)
-
+        if self.flow_model.rowCount() == 0:
+            QMessageBox.warning(None, "错误", "没有动态表需要生成，请先添加流程项！")
+            return
         # 动态配置序号
         self.dynamic_id = int(dynamicId)
         # 将 dynamic_id 格式化为四位数字
         format_id = format_four_digits(self.dynamic_id)
-        # 将 dynamic_id 字符串反转
-        reversed_dynamic_id = format_dynamic_id(format_id)
-        # 将最大动作数转换为十六进制并反转
-        max_action_hex = format_max_action(self.MAX_ACTION_NUM)
-        # 将动态配置序号id和最大动作数存放动态表的16进制编码
-        self.dynamic_hex_list.append(reversed_dynamic_id)
-        self.dynamic_hex_list.append(max_action_hex)
-
-        # 查询并处理所有记录
-        processed_records = process_dynamic_info_records(self.temp_dynamic_info)
-        for record in processed_records:
-            formatted_start_time, formatted_action_id, formatted_action_time = record
-            dynamic_hex = formatted_start_time + formatted_action_id + formatted_action_time
-            self.dynamic_hex_list.append(dynamic_hex)
-
-        # 将所有十六进制字符串拼接成一个大的十六进制字符串
-        combined_hex_string = ''.join(self.dynamic_hex_list)
+        # 动态配置序号id + 最大动作数 + 所有记录（不足最大动作数的部分为空动作，最后一个动作的动作时间为65535）
+        builder = table_utils.DynamicTableBuilder(self.dynamic_id, self.MAX_ACTION_NUM)
+        try:
+            builder.extend(self.flow_model.action_info())
+        except ValueError as e:
+            QMessageBox.warning(None, "错误", str(e))
+            return
+        dynamic_table = builder.to_bytes()
+        self.temp_dynamic_info = builder.records()
         # 文件夹不存在则创建
         base_path = os.path.abspath('./dynamic_bin')
         if not os.path.exists(base_path):
             os.makedirs(base_path)
         # 生成动态表的.bin文件
         output_file_path = base_path + os.path.sep + 'DT_' + format_id + '.bin'
-        hex_string_to_binary_file(combined_hex_string, output_file_path)
+        table_utils.write_table_file(dynamic_table, output_file_path)
         print(f"动态表生成成功！\n文件所在目录：{base_path}")
-        self.dynamic_hex_list = []
 
         # ------------------------生成动态表的Excel文件-------------------------
         excel_records = []
@@ -548,56 +443,35 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         self.temp_dynamic_info = []
         self.new_action_hex_list = []
         self.new_action_hex_list1 = []
-        self.action_info = []
 
         # ---------------清空表格信息---------------
-        # 获取表格中的行数和列数
-        row_count = self.flowTableWidget.rowCount()
-        column_count = self.flowTableWidget.columnCount()
-        # 迭代每个单元格并将其内容设置为空
-        for row in range(row_count):
-            for col in range(column_count):
-                self.flowTableWidget.setItem(row, col, QTableWidgetItem(""))
-        # 设置表格的行数为 0，这样新数据将从第一行开始显示
-        # self.flowTableWidget.setRowCount(0)
-        # 更新行索引, 重新置为0
-        self.rowCount = 0
+        self.flow_model.reset()
         # 动作时间重新为0
         self.finally_action_duration = 0
         QMessageBox.information(None, "Success", f"动态表生成成功！\n文件所在目录：{base_path}")
 
-    def insert_temp_dynamic_info(self, start_time, action_id, action_time):
-        """
-        插入临时动态表信息
-        :param start_time: 动作开始时间
-        :param action_id: 动作ID
-        :param action_time: 动作持续时间
-        :return: void
-        """
-        action_id = action_id.upper()
-        self.temp_dynamic_info.append((start_time, action_id, action_time))
-
-        # 检查是否需要插入额外的记录
-        if action_time == 65535:
-            # 计算当前已插入的记录数
-            count = len(self.temp_dynamic_info)
-
-            # 计算需要插入的额外记录数
-            if count < 128:
-                records_to_insert = 128 - count
-                for _ in range(records_to_insert):
-                    self.temp_dynamic_info.append((4294967295, 'FFFF', 65535))
-
-        print(f"当前的动态信息列表: {self.temp_dynamic_info}")
-
     def show_total_table_dialog(self):
         """
         点击生成总表按钮，弹出对话框
         :return:
         """
+        from TotalTableDlg import TotalTableDlg
+
         dlg = TotalTableDlg()
         dlg.exec()
 
+    def show_flow_curve_dialog(self):
+        """
+        点击流程曲线按钮，显示流程的电机行程曲线和温度爬升曲线
+        :return:
+        """
+        from flow_curve_view import FlowCurveDlg
+
+        if self.flow_curve_dlg is None:
+            self.flow_curve_dlg = FlowCurveDlg(self.flow_model, self)
+        self.flow_curve_dlg.show()
+        self.flow_curve_dlg.raise_()
+
     def open_excel_file(self):
         # 打开文件选择对话框，选择 Excel 文件（支持 .xls 和 .xlsx）
         file_dialog = QFileDialog(self)
@@ -0,0 +1,454 @@
+"""
+无界面的实验流程表编译工具
+
+读取声明式的流程描述文件（YAML/JSON），不经过主窗口、静态表、总表对话框，一次生成
+action_bin/AT_*.bin、dynamic_bin/DT_*.bin、static_bin/ST_静态表*.bin 以及 total_bin 下的总表文件。
+
+流程描述文件格式：
+
+    action_dir: 动作表文件夹（可选，默认为 输出目录/action_bin，按参数配置描述的动作都写入该文件夹）
+    dynamic_dir: 动态表文件夹（可选，默认为 输出目录/dynamic_bin）
+    monitoring_table: 监控表 zt*.bin 文件（可选）
+    flows:
+      - dynamic_id: 1           # 动态表配置序号ID
+        rows:
+          - start_time: 0       # 动作起始时刻
+            category: 0         # 动作类别 0~9、A~F
+            config_hex: "..."   # 动作参数的16进制编码（与参数配置对话框中生成的一致）
+          - start_time: 60
+            action_id: "B001"   # 也可以直接引用已存在的动作ID
+            duration: 0         # 动作时间（可选，默认为0）
+
+只有一个流程时可以省略 flows，直接在顶层写 dynamic_id 和 rows。
+
+批量编译时传入存放流程描述文件的文件夹：先按文件名顺序统一分配动作ID，再用多个进程并行生成动态表，
+最后只拼接一次总表，并输出每个流程的耗时和生成文件的大小。
+
+生成动态表前检查每个流程的时间线（同一设备的动作重叠、动作起始时刻顺序、流程项数，见 utils/timeline_check.py），
+发现的问题作为警告输出；流程项数超过最大动作数时停止编译，加 --strict 时任何问题都停止编译。
+直接引用动作ID的动作在动作表文件夹中没有AT文件时按注册表中保存的参数配置生成，注册表中也没有时同样停止编译，
+退出码为1。所有流程都检查通过后才把新动作写入注册表并写出文件，编译失败时注册表和输出文件夹都不会改变。
+
+用法：
+    python flow_compiler.py flow.yaml -o build
+    python flow_compiler.py flows/ -o build -j 8 --monitoring-table zt_监控表.bin
+    python flow_compiler.py flow.yaml -o build --strict
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import yaml
+
+from utils import action_specs
+from utils import table_utils
+from utils import data_utils
+from utils.flow_store import FlowStore
+from utils.timeline_check import ISSUE_CAPACITY, check_timeline, format_issues
+from utils.total_table_cache import TotalTableCache
+from utils.field_spec import ENCODE_ERRORS
+
+# 流程描述文件的扩展名
+SPEC_EXTENSIONS = ('.yaml', '.yml', '.json')
+
+
+def load_flow_spec(spec_path):
+    """
+    读取流程描述文件（.json 按JSON解析，其他按YAML解析）
+    :return: 流程描述字典，单个流程的写法会被统一成 flows 列表
+    """
+    with open(spec_path, 'r', encoding='utf-8') as file:
+        if spec_path.lower().endswith('.json'):
+            spec = json.load(file)
+        else:
+            spec = yaml.safe_load(file)
+    if "flows" not in spec:
+        spec = dict(spec, flows=[{"dynamic_id": spec.get("dynamic_id"), "rows": spec.get("rows", [])}])
+    return spec
+
+
+def normalize_action_code(category):
+    """
+    动作类别统一为 data_utils.data_dict 中的键（0~9 为整数，A~F 为大写字母）
+    """
+    action_code = str(category).strip().upper()
+    if action_code.isdigit() and int(action_code) in data_utils.data_dict:
+        return int(action_code)
+    if action_code not in data_utils.data_dict:
+        raise ValueError(f"未知的动作类别：{category}")
+    return action_code
+
+
+def encode_params(action_code, params, label):
+    """
+    按参数声明编码，与参数配置界面生成的编码一致
+    :param label: 流程项的说明（出错时写入异常信息）
+    :return: 参数编码的16进制字符串
+    :raise ValueError: 参数名不存在或参数值无法编码
+    """
+    record = action_specs.build_spec(action_code).new_record()
+    for name, value in (params or {}).items():
+        try:
+            record.set(name, value)
+        except KeyError:
+            raise ValueError(f"{label}：动作类别{action_code}没有参数 {name}") from None
+        except ENCODE_ERRORS as error:
+            raise ValueError(f"{label}：参数 {name}={value!r} 无法编码（{error}）") from None
+    return record.hex()
+
+
+class ActionPlan:
+    """
+    一次编译中用到的动作ID
+
+    编译时先只查询注册表，新的参数配置从该类别下一个可用ID起依次分配临时ID；全部流程检查通过后再调用commit
+    把新动作写入注册表，检查失败时注册表不会改变。
+    """
+
+    def __init__(self):
+        # {(动作类别, 比对键): 动作ID}，部分匹配的参数配置（见 data_utils.action_match_key）使用同一个ID
+        self.ids = {}
+        # 新动作 [(临时动作ID, 参数编码)]，按分配顺序
+        self.new_actions = []
+        self.new_ids = set()
+        # 按参数配置描述的动作 {动作ID: 动作表字节串}
+        self.action_tables = {}
+        # 每个类别下一个临时ID（整数）
+        self._next_ids = {}
+
+    def resolve(self, config_hex, action_code):
+        """
+        查询参数配置对应的动作ID，不存在时分配临时ID
+        :return: (动作ID, 是否是新动作)
+        """
+        config_hex = str(config_hex).upper()
+        key = (action_code, data_utils.action_match_key(config_hex, action_code))
+        action_id = self.ids.get(key)
+        if action_id is None:
+            action_id = data_utils.lookup_action_id(config_hex, action_code)
+            if action_id is None:
+                next_id = self._next_ids.get(action_code)
+                if next_id is None:
+                    next_id = int(data_utils.next_action_id(action_code), 16)
+                action_id = format(next_id, '04X')
+                if data_utils.action_code_of(action_id) != action_code:
+                    raise ValueError(f"动作类别{action_code}的动作ID已用完")
+                self._next_ids[action_code] = next_id + 1
+                self.new_actions.append((action_id, config_hex))
+                self.new_ids.add(action_id)
+            self.ids[key] = action_id
+        self.action_tables.setdefault(action_id, table_utils.build_action_table(action_id, bytes.fromhex(config_hex)))
+        return action_id, int(action_id in self.new_ids)
+
+    def commit(self):
+        """
+        把新动作写入注册表（查询和写入在一次操作中完成）
+        :raise ValueError: 编译期间临时ID或参数配置已被其他程序写入注册表
+        """
+        results = data_utils.store_new_actions(
+            [action_id[2:] + action_id[0:2] + config_hex for action_id, config_hex in self.new_actions])
+        conflicts = [config_hex[2:4] + config_hex[0:2]
+                     for config_hex, (_, result) in results.items() if result != "new"]
+        if conflicts:
+            raise ValueError(f"编译期间注册表被其他程序修改，动作 {'、'.join(conflicts)} 未能写入，请重新编译")
+
+
+def resolve_action(row, plan, label):
+    """
+    解析一行流程项的动作：查询注册表或分配临时动作ID
+    :param plan: 本次编译的动作ID（ActionPlan）
+    :param label: 流程项的说明（出错时写入异常信息）
+    :return: (动作ID, 是否是新动作)
+    """
+    if "config_hex" not in row and "params" not in row:
+        action_id = str(row.get("action_id", "")).upper()
+        if len(action_id) != 4 or data_utils.action_code_of(action_id) not in data_utils.data_dict:
+            raise ValueError(f"{label}：动作ID格式错误：{action_id}")
+        try:
+            int(action_id, 16)
+        except ValueError:
+            raise ValueError(f"{label}：动作ID格式错误：{action_id}") from None
+        return action_id, 0
+    if "category" not in row:
+        raise ValueError(f"{label}：缺少动作类别（category）")
+    try:
+        action_code = normalize_action_code(row["category"])
+    except ValueError as error:
+        raise ValueError(f"{label}：{error}") from None
+    if "config_hex" in row:
+        config_hex = str(row["config_hex"]).upper()
+        try:
+            bytes.fromhex(config_hex)
+        except ValueError:
+            raise ValueError(f"{label}：config_hex 不是16进制编码：{row['config_hex']}") from None
+    else:
+        config_hex = encode_params(action_code, row["params"], label)
+    # 同一次编译中后面相同配置的流程项直接复用该ID
+    return plan.resolve(config_hex, action_code)
+
+
+def resolve_flow(flow, plan):
+    """
+    为一个流程的每行查询或分配动作ID（不写入注册表）
+    :return: (动态表配置序号ID, 流程项（FlowStore）)
+    """
+    if flow.get("dynamic_id") is None:
+        raise ValueError("流程缺少动态表配置序号ID（dynamic_id）")
+    rows = flow.get("rows") or []
+    if len(rows) == 0:
+        raise ValueError(f"动态表{flow['dynamic_id']}没有流程项")
+    dynamic_id = int(flow["dynamic_id"])
+    items = []
+    for index, row in enumerate(rows):
+        label = f"动态表{dynamic_id}第{index + 1}项"
+        action_id, is_new_action = resolve_action(row, plan, label)
+        try:
+            start_time, duration = int(row["start_time"]), int(row.get("duration", 0))
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"{label}：动作起始时刻（start_time）或动作时间（duration）缺失或不是整数") from None
+        try:
+            table_utils.dynamic_row_values(start_time, action_id, duration)
+        except ValueError as e:
+            raise ValueError(f"{label}：{e}") from None
+        items.append((start_time, action_id, duration, "", is_new_action))
+    store = FlowStore()
+    store.insert_rows(0, items)
+    return dynamic_id, store
+
+
+def collect_action_tables(plan, used_action_ids, action_dir):
+    """
+    流程引用的每个动作的动作表：按参数配置描述的动作使用本次的编码；直接引用动作ID的动作使用动作表文件夹中
+    已有的AT文件，没有时按注册表中保存的参数配置生成
+    :return: ({动作ID: 动作表字节串}, 需要写入动作表文件夹的 {动作ID: 动作表字节串})
+    :raise ValueError: 有动作既没有AT文件也不在注册表中
+    """
+    tables = {}
+    changed = {}
+    missing = []
+    for action_id in sorted(used_action_ids):
+        path = os.path.join(action_dir, table_utils.action_table_file_name(action_id))
+        on_disk = data_utils.read_bin_file(path) if os.path.exists(path) else None
+        table = plan.action_tables.get(action_id)
+        if table is None and on_disk is None:
+            config_hex = data_utils.get_action_config(action_id)
+            if config_hex is None:
+                missing.append(action_id)
+                continue
+            table = table_utils.build_action_table(action_id, bytes.fromhex(config_hex))
+        if table is not None and table != on_disk:
+            changed[action_id] = table
+        tables[action_id] = table if table is not None else on_disk
+    if missing:
+        raise ValueError(f"动作表文件夹 {action_dir} 和注册表中都没有流程引用的动作：" +
+                         "、".join(f"AT_{action_id}.bin" for action_id in missing))
+    return tables, changed
+
+
+def check_flow(dynamic_id, store, actions, strict=False):
+    """
+    检查流程的时间线（见 utils/timeline_check.py），问题作为警告输出；
+    流程项数超过最大动作数时无法生成动态表，strict为True时任何问题都视为错误
+    """
+    issues = check_timeline(store.action_info(), actions)
+    for issue in issues:
+        print(f"警告：动态表{dynamic_id}：{issue['message']}")
+    if issues and (strict or any(issue["kind"] == ISSUE_CAPACITY for issue in issues)):
+        raise ValueError(f"动态表{dynamic_id}的时间线检查未通过：\n{format_issues(issues)}")
+
+
+def encode_dynamic_table(dynamic_id, store, output_file_path):
+    """
+    生成一个动态表.bin文件（可在工作进程中执行）
+    :param store: 流程项（FlowStore，按列存放，传给工作进程时只需序列化几个数组）
+    :return: (文件路径, 编码耗时秒数)
+    """
+    start = time.perf_counter()
+    builder = table_utils.DynamicTableBuilder(dynamic_id)
+    builder.extend(store.action_info())
+    table_utils.write_table_file(builder.to_bytes(), output_file_path)
+    return output_file_path, time.perf_counter() - start
+
+
+def compile_flows(flows, action_dir, dynamic_dir, jobs=1, strict=False):
+    """
+    编译多个流程：先在当前进程中按顺序统一分配动作ID（保证ID分配确定）并检查全部流程，
+    检查通过后才写入注册表和AT文件，再并行生成各动态表；检查失败时注册表和输出文件夹都不会改变
+    :param flows: 流程列表
+    :param action_dir: 动作表文件夹，流程引用的动作（按参数配置描述的动作，以及注册表中已有而文件夹中没有的动作）
+                       的AT文件都写入该文件夹
+    :param dynamic_dir: 动态表文件夹
+    :param jobs: 并行生成动态表的进程数，为1时在当前进程中依次生成
+    :param strict: 时间线检查发现任何问题时都停止编译
+    :return: (生成的文件路径列表, 每个流程的报告 [(动态表ID, 流程项数, 分配ID耗时, 编码耗时, 文件路径)])
+    """
+    plan = ActionPlan()
+    resolved = []
+    for flow in flows:
+        start = time.perf_counter()
+        dynamic_id, store = resolve_flow(flow, plan)
+        if any(dynamic_id == item[0] for item in resolved):
+            raise ValueError(f"动态表配置序号ID重复：{dynamic_id}")
+        output_file_path = os.path.join(dynamic_dir, table_utils.dynamic_table_file_name(dynamic_id))
+        resolved.append((dynamic_id, store, output_file_path, time.perf_counter() - start))
+
+    # 流程中引用的动作必须都有动作表，否则总表中缺少该动作
+    used_action_ids = {f"{action_id:04X}" for _, store, _, _ in resolved for action_id in set(store.action_ids)}
+    action_tables, changed_tables = collect_action_tables(plan, used_action_ids, action_dir)
+    actions = {action_id: table[2:] for action_id, table in action_tables.items()}
+    for dynamic_id, store, _, _ in resolved:
+        check_flow(dynamic_id, store, actions, strict)
+
+    # 全部检查通过后才写入注册表和文件；内容相同的AT文件不再重写
+    plan.commit()
+    artifacts = []
+    for action_id, table in changed_tables.items():
+        output_file_path = os.path.join(action_dir, table_utils.action_table_file_name(action_id))
+        artifacts.append(table_utils.write_table_file(table, output_file_path))
+
+    if jobs == 1 or len(resolved) <= 1:
+        encoded = [encode_dynamic_table(dynamic_id, store, path) for dynamic_id, store, path, _ in resolved]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(encode_dynamic_table, dynamic_id, store, path)
+                       for dynamic_id, store, path, _ in resolved]
+            encoded = [future.result() for future in futures]
+
+    report = []
+    for (dynamic_id, store, _, resolve_time), (path, encode_time) in zip(resolved, encoded):
+        artifacts.append(path)
+        report.append((dynamic_id, len(store), resolve_time, encode_time, path))
+    return artifacts, report
+
+
+def build_total_tables(action_dir, dynamic_dir, static_file, monitoring_file, total_dir):
+    """
+    拼接静态表、总动作表、总动态表、总监控表，生成总动作表、总动态表、表头、总表、表头+3总表
+    未改动的表文件从 total_dir 中上一次生成的总表截取（见 TotalTableCache）
+    :return: 生成的文件路径列表
+    """
+    table_cache = TotalTableCache(total_dir)
+    static_content = table_cache.read_segment('static', [static_file])
+    action_content = table_cache.read_segment(
+        'action', table_utils.list_table_files(action_dir, table_utils.ACTION_FILE_PATTERN))
+    dynamic_content = table_cache.read_segment(
+        'dynamic', table_utils.list_table_files(dynamic_dir, table_utils.DYNAMIC_FILE_PATTERN))
+    monitoring_content = table_cache.read_segment('monitoring', [monitoring_file] if monitoring_file else [])
+    static_length, action_length, dynamic_length, monitoring_length = (
+        len(static_content), len(action_content), len(dynamic_content), len(monitoring_content))
+
+    artifacts = []
+    for base_name, content in (("总动作表", action_content), ("总动态表", dynamic_content)):
+        if content:
+            artifacts.append(table_utils.stream_table_file([content], total_dir, base_name)[0])
+
+    table_head = table_utils.build_table_head(static_length, action_length, dynamic_length, monitoring_length)
+    head_file_name = table_utils.table_head_file_name(static_length, action_length, dynamic_length, monitoring_length)
+    artifacts.append(table_utils.write_table_file(table_head, os.path.join(total_dir, head_file_name)))
+
+    # 总表 = 静态表 + 总动作表 + 总动态表 + 总监控表
+    segments = [static_content, action_content, dynamic_content, monitoring_content]
+    total_table_path = table_utils.stream_table_file(segments, total_dir, "总表")[0]
+    table_cache.save(total_table_path)
+    artifacts.append(total_table_path)
+    # 最终总表 = 表头 + 总表*3
+    artifacts.append(table_utils.stream_table_file([table_head] + segments * 3, total_dir, "总表+3总表")[0])
+    return artifacts
+
+
+def compile_spec(spec, output_dir, spec_dir=".", jobs=1, strict=False):
+    """
+    编译流程描述，写出全部动作表、动态表、静态表和总表文件
+    :param spec: load_flow_spec 读取的流程描述
+    :param output_dir: 输出目录
+    :param spec_dir: 流程描述文件所在目录，描述中的相对路径以此为准
+    :param jobs: 并行生成动态表的进程数
+    :param strict: 时间线检查发现任何问题时都停止编译
+    :return: (生成的文件路径列表, 每个流程的报告)
+    """
+    def spec_path(key, default):
+        path = spec.get(key)
+        return os.path.join(spec_dir, path) if path else default
+
+    action_dir = spec_path("action_dir", os.path.join(output_dir, "action_bin"))
+    dynamic_dir = spec_path("dynamic_dir", os.path.join(output_dir, "dynamic_bin"))
+    monitoring_file = spec_path("monitoring_table", None)
+    os.makedirs(action_dir, exist_ok=True)
+    os.makedirs(dynamic_dir, exist_ok=True)
+
+    artifacts, report = compile_flows(spec["flows"], action_dir, dynamic_dir, jobs, strict)
+
+    # 静态表
+    static_table = table_utils.build_static_table(table_utils.count_dynamic_tables(dynamic_dir),
+                                                  table_utils.build_actions_bytes(table_utils.count_actions(action_dir)))
+    static_file = table_utils.write_table_file(
+        static_table, os.path.join(output_dir, "static_bin", table_utils.static_table_file_name()))
+    artifacts.append(static_file)
+
+    # 总表
+    artifacts.extend(build_total_tables(action_dir, dynamic_dir, static_file, monitoring_file,
+                                        os.path.join(output_dir, "total_bin")))
+    return artifacts, report
+
+
+def load_batch_spec(spec_folder, action_dir=None, dynamic_dir=None, monitoring_table=None):
+    """
+    读取文件夹中所有流程描述文件（按文件名排序），合并成一个流程描述
+    """
+    flows = []
+    for file_name in sorted(os.listdir(spec_folder)):
+        if os.path.splitext(file_name)[1].lower() in SPEC_EXTENSIONS:
+            flows.extend(load_flow_spec(os.path.join(spec_folder, file_name))["flows"])
+    return {"action_dir": action_dir, "dynamic_dir": dynamic_dir, "monitoring_table": monitoring_table,
+            "flows": flows}
+
+
+def print_report(artifacts, report, elapsed):
+    """
+    打印每个流程的耗时和生成文件的大小
+    """
+    print("动态表ID  流程项数  分配ID(ms)  编码(ms)  文件")
+    for dynamic_id, row_count, resolve_time, encode_time, path in report:
+        print(f"{dynamic_id:>8}  {row_count:>8}  {resolve_time * 1000:>10.1f}  {encode_time * 1000:>8.1f}  "
+              f"{os.path.basename(path)}")
+    print("生成的文件：")
+    for path in artifacts:
+        print(f"  {path}  ({os.path.getsize(path)} 字节)")
+    print(f"共{len(report)}个流程，{len(artifacts)}个文件，总耗时{elapsed:.2f}秒")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="根据流程描述文件生成动作表、动态表、静态表和总表")
+    parser.add_argument("spec", help="流程描述文件（.yaml/.yml/.json），或存放多个流程描述文件的文件夹（批量编译）")
+    parser.add_argument("-o", "--output-dir", default=".", help="输出目录（默认当前目录）")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="并行生成动态表的进程数")
+    parser.add_argument("--registry-db", help="使用SQLite动作注册表代替data/*.txt")
+    parser.add_argument("--action-dir", help="批量编译时的动作表文件夹")
+    parser.add_argument("--dynamic-dir", help="批量编译时的动态表文件夹")
+    parser.add_argument("--monitoring-table", help="批量编译时的监控表 zt*.bin 文件")
+    parser.add_argument("--strict", action="store_true", help="时间线检查（动作重叠、起始时刻顺序）发现问题时停止编译")
+    args = parser.parse_args(argv)
+
+    if args.registry_db:
+        data_utils.use_sqlite_registry(args.registry_db)
+    start = time.perf_counter()
+    if os.path.isdir(args.spec):
+        spec = load_batch_spec(args.spec, args.action_dir, args.dynamic_dir, args.monitoring_table)
+        spec_dir = os.getcwd()
+    else:
+        spec = load_flow_spec(args.spec)
+        spec_dir = os.path.dirname(os.path.abspath(args.spec))
+    try:
+        artifacts, report = compile_spec(spec, args.output_dir, spec_dir, max(1, args.jobs), args.strict)
+    except ValueError as error:
+        print(f"编译失败：{error}")
+        return 1
+    print_report(artifacts, report, time.perf_counter() - start)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,364 @@
+"""
+流程曲线窗口
+
+显示主窗口流程表中流程的电机行程曲线和温度爬升曲线（见 utils/flow_curves.py）。曲线的计算和绘制都在后台线程中
+完成：后台线程按视口的像素宽度从降采样金字塔中取出每列的最小值和最大值，画成图片后交给界面显示，界面线程只
+负责显示图片，跨越数天的流程也不会卡住界面。
+
+流程表修改后（插入、删除、移动、修改流程项）稍等片刻再更新曲线，只重新计算修改的流程项影响到的时间窗口。
+滚轮缩放时间轴，按住左键拖动平移，双击显示整个流程。
+"""
+import numpy as np
+from PySide6.QtCore import QObject, QPointF, QRunnable, QThreadPool, QTimer, Qt, Signal
+from PySide6.QtGui import QColor, QImage, QPainter, QPen, QPolygonF
+from PySide6.QtWidgets import QDialog, QLabel, QVBoxLayout, QWidget
+
+from utils.flow_curves import CURVE_GROUPS, FlowCurves
+
+# 曲线区域四周的留白（左、上、右、下），右侧显示图例
+PLOT_MARGINS = (70, 12, 120, 28)
+# 各曲线的颜色
+CURVE_COLORS = ("#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f")
+# 流程表修改后等待该时间(ms)再更新曲线，连续修改只更新一次
+UPDATE_DELAY = 200
+# 放大时视口最少包含的采样点数
+MIN_VIEW_SAMPLES = 10
+# 时间轴可用的刻度间隔(s)
+TIME_STEPS = (1, 2, 5, 10, 15, 30, 60, 120, 300, 600, 900, 1800, 3600, 7200, 10800, 21600, 43200, 86400,
+              2 * 86400, 7 * 86400)
+
+
+def format_time(seconds):
+    """
+    时间轴刻度：超过一天时显示为 天d 时:分，否则为 时:分:秒
+    """
+    seconds = int(round(seconds))
+    days, rest = divmod(seconds, 86400)
+    hours, rest = divmod(rest, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if days:
+        return f"{days}d {hours:02d}:{minutes:02d}"
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def nice_step(span, count):
+    """
+    把 span 大约分成 count 段的刻度间隔（1、2、5 乘以10的整数次幂）
+    """
+    raw = span / max(count, 1)
+    if raw <= 0:
+        return 1.0
+    magnitude = 10 ** np.floor(np.log10(raw))
+    for factor in (1, 2, 5, 10):
+        if raw <= factor * magnitude:
+            return float(factor * magnitude)
+    return float(10 * magnitude)
+
+
+def time_step(span, count):
+    """
+    把时长 span 大约分成 count 段的时间刻度间隔（取 TIME_STEPS 中的值）
+    """
+    raw = span / max(count, 1)
+    for step in TIME_STEPS:
+        if raw <= step:
+            return step
+    return TIME_STEPS[-1] * int(np.ceil(raw / TIME_STEPS[-1]))
+
+
+def draw_envelope(painter, xs, lows, highs):
+    """
+    把每列的最小值和最大值画成一条折线（同一列内从最小值画到最大值），没有值的地方断开
+    """
+    points_x = np.repeat(xs, 2)
+    points_y = np.column_stack((lows, highs)).ravel()
+    valid = ~np.isnan(points_y)
+    # 连续有值的各段
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], valid.astype(np.int8), [0]))))
+    for start, stop in zip(edges[::2], edges[1::2]):
+        if stop - start < 2:
+            continue
+        painter.drawPolyline(QPolygonF([QPointF(x, y) for x, y in zip(points_x[start:stop], points_y[start:stop])]))
+
+
+def render_curves(curves, start_time, end_time, width, height):
+    """
+    把 [start_time, end_time] 内的曲线画成图片
+    :param curves: FlowCurves
+    :return: QImage
+    """
+    image = QImage(max(width, 1), max(height, 1), QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.white)
+    left, top, right, bottom = PLOT_MARGINS
+    plot_width = width - left - right
+    lane_height = (height - top - bottom) // len(CURVE_GROUPS)
+    if plot_width <= 10 or lane_height <= 20 or end_time <= start_time:
+        return image
+    span = end_time - start_time
+
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing, False)
+    grid_pen = QPen(QColor("#e0e0e0"))
+    text_pen = QPen(QColor("#404040"))
+    # 时间轴刻度
+    step = time_step(span, plot_width / 120)
+    ticks = np.arange(np.ceil(start_time / step) * step, end_time + 1e-9, step)
+    for tick in ticks:
+        x = left + (tick - start_time) / span * plot_width
+        painter.setPen(grid_pen)
+        painter.drawLine(QPointF(x, top), QPointF(x, top + lane_height * len(CURVE_GROUPS)))
+        painter.setPen(text_pen)
+        painter.drawText(QPointF(x - 30, height - 8), format_time(tick))
+
+    color_index = 0
+    for lane, (group, unit, names) in enumerate(CURVE_GROUPS):
+        lane_top = top + lane * lane_height
+        plot_height = lane_height - 16
+        painter.setPen(text_pen)
+        painter.drawText(QPointF(8, lane_top + 12), f"{group}({unit})")
+        painter.drawRect(left, lane_top + 16, plot_width, plot_height)
+        value_range = curves.value_range(names, start_time, end_time, plot_width)
+        if value_range is None:
+            color_index += len(names)
+            continue
+        low, high = value_range
+        if high - low < 1e-9:
+            low, high = low - 1, high + 1
+        padding = (high - low) * 0.05
+        low, high = low - padding, high + padding
+        # 数值刻度
+        value_step = nice_step(high - low, plot_height / 40)
+        for tick in np.arange(np.ceil(low / value_step), high / value_step) * value_step:
+            # 避免显示 -0
+            tick = round(tick, 9) + 0.0
+            y = lane_top + 16 + (high - tick) / (high - low) * plot_height
+            painter.setPen(grid_pen)
+            painter.drawLine(QPointF(left + 1, y), QPointF(left + plot_width - 1, y))
+            painter.setPen(text_pen)
+            painter.drawText(QPointF(8, y + 4), f"{tick:g}")
+
+        painter.setClipRect(left, lane_top + 16, plot_width, plot_height)
+        for order, name in enumerate(names):
+            color = QColor(CURVE_COLORS[color_index % len(CURVE_COLORS)])
+            color_index += 1
+            pen = QPen(color)
+            if name.endswith("设定值"):
+                pen.setStyle(Qt.DashLine)
+            painter.setPen(pen)
+            times, lows, highs = curves.envelope(name, start_time, end_time, plot_width)
+            xs = left + (times - start_time) / span * plot_width
+            draw_envelope(painter, xs,
+                          lane_top + 16 + (high - lows) / (high - low) * plot_height,
+                          lane_top + 16 + (high - highs) / (high - low) * plot_height)
+            # 图例
+            painter.setClipping(False)
+            legend_y = lane_top + 28 + order * 16
+            painter.drawLine(QPointF(width - right + 8, legend_y - 4), QPointF(width - right + 28, legend_y - 4))
+            painter.setPen(text_pen)
+            painter.drawText(QPointF(width - right + 32, legend_y), name)
+            painter.setClipRect(left, lane_top + 16, plot_width, plot_height)
+        painter.setClipping(False)
+    painter.end()
+    return image
+
+
+class CurveSignals(QObject):
+    # (请求序号, 图片, 视口起始时刻, 视口结束时刻, 流程曲线总时长)
+    rendered = Signal(int, QImage, float, float, float)
+    # 曲线改变的时间窗口 (起始时刻, 结束时刻)
+    updated = Signal(float, float)
+
+
+class CurveTask(QRunnable):
+    """
+    后台线程中的一次曲线更新和绘制
+
+    所有任务在同一个单线程的线程池中依次执行，FlowCurves 只在该线程中使用；执行时已经有更新的请求时跳过绘制。
+    """
+
+    def __init__(self, curves, generation, latest, flow, view_range, size, signals):
+        """
+        :param generation: 请求序号
+        :param latest: 返回最新请求序号的函数
+        :param flow: 流程项和动作参数 (rows, actions)，流程没有修改时为None
+        :param view_range: 视口 (起始时刻, 结束时刻)，None表示整个流程
+        :param size: 图片大小 (宽, 高)
+        """
+        super(CurveTask, self).__init__()
+        self.curves = curves
+        self.generation = generation
+        self.latest = latest
+        self.flow = flow
+        self.view_range = view_range
+        self.size = size
+        self.signals = signals
+
+    def run(self):
+        if self.flow is not None:
+            window = self.curves.update(*self.flow)
+            if window is not None:
+                self.signals.updated.emit(*window)
+        if self.generation != self.latest():
+            return
+        duration = self.curves.end_time
+        start_time, end_time = self.view_range or (0.0, duration)
+        end_time = min(end_time, duration)
+        image = render_curves(self.curves, start_time, end_time, *self.size)
+        self.signals.rendered.emit(self.generation, image, start_time, end_time, duration)
+
+
+class FlowCurveView(QWidget):
+    """
+    显示流程曲线的控件，跟随流程表模型（FlowTableModel）的修改更新
+    """
+
+    # 后台线程更新曲线后发出，参数为曲线改变的时间窗口 (起始时刻, 结束时刻)
+    curves_updated = Signal(float, float)
+
+    def __init__(self, flow_model, parent=None, dt=1.0):
+        """
+        :param flow_model: 主窗口的流程表模型
+        :param dt: 曲线的采样间隔(s)
+        """
+        super(FlowCurveView, self).__init__(parent)
+        self.flow_model = flow_model
+        self.curves = FlowCurves(dt)
+        # 单线程的线程池：曲线的更新和绘制依次执行
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.signals = CurveSignals()
+        self.signals.rendered.connect(self.on_rendered)
+        self.signals.updated.connect(self.curves_updated)
+        self.generation = 0
+        self.image = None
+        # 视口 (起始时刻, 结束时刻)，None表示整个流程；shown_range 为当前图片对应的视口
+        self.view_range = None
+        self.shown_range = (0.0, 0.0)
+        self.duration = 0.0
+        self.drag_x = None
+        self.setMinimumSize(600, 400)
+
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(UPDATE_DELAY)
+        self.update_timer.timeout.connect(lambda: self.request(True))
+        for signal in (flow_model.rowsInserted, flow_model.rowsRemoved, flow_model.rowsMoved,
+                       flow_model.dataChanged, flow_model.modelReset):
+            signal.connect(self.update_timer.start)
+        self.request(True)
+
+    def flow_snapshot(self):
+        """
+        当前流程项和动作参数的副本（后台线程只使用副本）
+        """
+        store = self.flow_model.store
+        actions = {}
+        for index in range(len(store)):
+            config = store.config(index)
+            if config:
+                actions.setdefault(store.action_id(index), config)
+        return store.action_info(), actions
+
+    def request(self, flow_changed=False):
+        """
+        请求后台线程重新绘制（flow_changed为True时先按流程表更新曲线）
+        """
+        self.generation += 1
+        task = CurveTask(self.curves, self.generation, lambda: self.generation,
+                         self.flow_snapshot() if flow_changed else None, self.view_range,
+                         (self.width(), self.height()), self.signals)
+        self.pool.start(task)
+
+    def on_rendered(self, generation, image, start_time, end_time, duration):
+        if generation != self.generation:
+            return
+        self.image = image
+        self.shown_range = (start_time, end_time)
+        self.duration = duration
+        self.update()
+
+    def time_at(self, x):
+        """
+        控件中横坐标x对应的时刻（按当前视口计算，连续缩放时不必等待重新绘制）
+        """
+        left, _, right, _ = PLOT_MARGINS
+        start_time, end_time = self.view_range or (0.0, self.duration)
+        plot_width = max(self.width() - left - right, 1)
+        return start_time + (x - left) / plot_width * (end_time - start_time)
+
+    def set_view(self, start_time, end_time):
+        """
+        设置视口（限制在流程范围内）
+        """
+        span = min(max(end_time - start_time, self.curves.dt * MIN_VIEW_SAMPLES), self.duration)
+        start_time = min(max(start_time, 0.0), self.duration - span)
+        self.view_range = None if span >= self.duration else (start_time, start_time + span)
+        self.request()
+
+    # ---------------- 事件 ----------------
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.white)
+        if self.image is None:
+            painter.drawText(self.rect(), Qt.AlignCenter, "正在计算流程曲线…")
+        else:
+            painter.drawImage(0, 0, self.image)
+        painter.end()
+
+    def resizeEvent(self, event):
+        super(FlowCurveView, self).resizeEvent(event)
+        self.request()
+
+    def wheelEvent(self, event):
+        if self.duration <= 0:
+            return
+        start_time, end_time = self.view_range or (0.0, self.duration)
+        center = self.time_at(event.position().x())
+        scale = 0.8 if event.angleDelta().y() > 0 else 1.25
+        self.set_view(center - (center - start_time) * scale, center + (end_time - center) * scale)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.drag_x = event.position().x()
+
+    def mouseMoveEvent(self, event):
+        if self.drag_x is None or self.duration <= 0:
+            return
+        offset = self.time_at(self.drag_x) - self.time_at(event.position().x())
+        self.drag_x = event.position().x()
+        start_time, end_time = self.view_range or (0.0, self.duration)
+        self.set_view(start_time + offset, end_time + offset)
+
+    def mouseReleaseEvent(self, event):
+        self.drag_x = None
+
+    def mouseDoubleClickEvent(self, event):
+        self.view_range = None
+        self.request()
+
+    def closeEvent(self, event):
+        self.update_timer.stop()
+        self.pool.clear()
+        super(FlowCurveView, self).closeEvent(event)
+
+
+class FlowCurveDlg(QDialog):
+    """
+    流程曲线对话框（非模态，编辑流程表时曲线随之更新）
+    """
+
+    def __init__(self, flow_model, parent=None):
+        super(FlowCurveDlg, self).__init__(parent)
+        self.setWindowTitle("流程曲线")
+        self.resize(1100, 700)
+        layout = QVBoxLayout(self)
+        self.view = FlowCurveView(flow_model, self)
+        layout.addWidget(self.view)
+        layout.addWidget(QLabel("滚轮缩放时间轴，按住左键拖动平移，双击显示整个流程"))
+        # 显示曲线改变的时间窗口
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+        self.view.curves_updated.connect(self.show_update)
+
+    def show_update(self, start_time, end_time):
+        self.status_label.setText(f"流程曲线更新：{format_time(start_time)} ~ {format_time(end_time)}")
@@ -0,0 +1,143 @@
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from utils.flow_store import FlowStore
+
+# 流程表的列标题
+FLOW_TABLE_HEADERS = ["序号", "动作起始时刻", "动作起始条件", "动作名称与描述", "动作结束判据",
+                      "本动作多长时间后下一个动作", "动作时间\n（s）", "备注", "动作ID", "是否是新动作"]
+# 有内容的列
+INDEX_COLUMN = 0
+START_TIME_COLUMN = 1
+ACTION_ID_COLUMN = 8
+NEW_ACTION_COLUMN = 9
+
+
+class FlowTableModel(QAbstractTableModel):
+    """
+    主窗口实验流程表的模型
+
+    数据存放在 FlowStore 中，界面只在需要显示时读取；插入、删除、移动、清空都以批量的模型信号通知视图，
+    不再逐个单元格创建 QTableWidgetItem。生成动态表时直接读取模型中的流程项。
+    """
+
+    def __init__(self, parent=None):
+        super(FlowTableModel, self).__init__(parent)
+        self.store = FlowStore()
+
+    # ---------------- 模型接口 ----------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.store)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(FLOW_TABLE_HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        row = index.row()
+        column = index.column()
+        if column == INDEX_COLUMN:
+            return str(row + 1)
+        if column == START_TIME_COLUMN:
+            return str(self.store.start_times[row])
+        if column == ACTION_ID_COLUMN:
+            return self.store.action_id(row)
+        if column == NEW_ACTION_COLUMN:
+            return "是" if self.store.new_flags[row] == 1 else "否"
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return FLOW_TABLE_HEADERS[section]
+        return str(section + 1)
+
+    # ---------------- 修改流程项 ----------------
+    def append_item(self, start_time, action_id, config_hex, is_new_action, duration=0):
+        """
+        在表尾添加一行流程项
+        """
+        self.insert_items(len(self.store), [(start_time, action_id, duration, config_hex, is_new_action)])
+
+    def insert_items(self, position, rows):
+        """
+        在position处批量插入流程项（只发送一次插入信号）
+        :param rows: [(动作起始时刻, 动作ID, 动作时间, 参数编码, 是否是新动作)]
+        """
+        rows = list(rows)
+        if not rows:
+            return
+        self.beginInsertRows(QModelIndex(), position, position + len(rows) - 1)
+        self.store.insert_rows(position, rows)
+        self.endInsertRows()
+        self.refresh_index_column(position + len(rows))
+
+    def remove_items(self, position, count=1):
+        """
+        删除从position开始的count行
+        """
+        if count <= 0 or not 0 <= position < len(self.store):
+            return
+        count = min(count, len(self.store) - position)
+        self.beginRemoveRows(QModelIndex(), position, position + count - 1)
+        self.store.remove_rows(position, count)
+        self.endRemoveRows()
+        self.refresh_index_column(position)
+
+    def move_item(self, source, destination):
+        """
+        把第source行移动到第destination行
+        """
+        if source == destination:
+            return
+        # beginMoveRows的目标位置是移动前插入点的行号，向下移动时要加1
+        if not self.beginMoveRows(QModelIndex(), source, source, QModelIndex(),
+                                  destination + 1 if destination > source else destination):
+            return
+        self.store.move_row(source, destination)
+        self.endMoveRows()
+        self.refresh_index_column(min(source, destination), max(source, destination) + 1)
+
+    def reset(self, rows=()):
+        """
+        清空流程表（或整体替换为rows），只发送一次重置信号
+        """
+        self.beginResetModel()
+        self.store.clear()
+        self.store.insert_rows(0, rows)
+        self.endResetModel()
+
+    def load_spec(self, flow):
+        """
+        用流程描述中的一个流程替换流程表（见 FlowStore.from_spec）
+        """
+        self.beginResetModel()
+        self.store = FlowStore.from_spec(flow)
+        self.endResetModel()
+
+    def refresh_index_column(self, first, last=None):
+        """
+        行号改变后刷新序号列
+        """
+        last = len(self.store) if last is None else last
+        if first < last:
+            self.dataChanged.emit(self.index(first, INDEX_COLUMN), self.index(last - 1, INDEX_COLUMN),
+                                  [Qt.DisplayRole])
+
+    # ---------------- 读取流程项 ----------------
+    def config_hex(self, row):
+        return self.store.config_hex(row)
+
+    def action_info(self):
+        """
+        动态表的流程项
+        :return: [(动作开始时间, 动作ID, 动作时间)]
+        """
+        return self.store.action_info()
+
+    def to_spec(self, dynamic_id):
+        """
+        流程表转为流程描述中的一个流程（见 FlowStore.to_spec）
+        """
+        return self.store.to_spec(dynamic_id)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 测试按仓库根目录导入模块（from utils import ...），与直接运行各脚本时一致
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
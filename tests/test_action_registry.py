@@ -0,0 +1,113 @@
+"""
+动作ID注册表（utils/action_registry.py、utils/sqlite_registry.py）的回归测试
+"""
+import sqlite3
+
+import pytest
+
+from utils import data_utils, table_utils
+from utils.action_registry import ActionRegistry
+from utils.sqlite_registry import SqliteActionRegistry
+
+# PID控温曲线：参数编码以"0000"开头时只比对前四个字符
+PID_CODE = "B"
+
+
+@pytest.fixture(params=["txt", "sqlite"])
+def registry(request, tmp_path):
+    if request.param == "txt":
+        registry = ActionRegistry(str(tmp_path), data_utils.data_dict)
+    else:
+        registry = SqliteActionRegistry(str(tmp_path / "registry.db"))
+    registry.register_partial_key(PID_CODE, data_utils.pid_temp_control_key)
+    yield registry
+    if request.param == "sqlite":
+        registry.close()
+
+
+def test_store_many_uses_partial_key(registry):
+    assert registry.store_many([("B000", "0000AAAA")], PID_CODE) == ["new"]
+    # 前四个字符相同，lookup视为已存在，批量写入时同样不再分配第二个ID
+    assert registry.lookup("0000BBBB", PID_CODE) == "B000"
+    assert registry.store_many([("B001", "0000BBBB"), ("B002", "1111CCCC")], PID_CODE) == ["duplicate", "new"]
+    assert registry.lookup("1111CCCC", PID_CODE) == "B002"
+    assert registry.lookup("1111DDDD", PID_CODE) is None
+
+
+def test_apply_changes_uses_partial_key(registry):
+    registry.store_many([("B000", "0000AAAA")], PID_CODE)
+    results = registry.apply_changes({}, {PID_CODE: [("B000", "0000AAAA"), ("B001", "0000BBBB"),
+                                                     ("B002", "2222CCCC")]})
+    assert results[PID_CODE] == ["exists", "duplicate", "new"]
+    assert registry.next_action_id(PID_CODE) == "B003"
+
+def test_allocate_many(registry):
+    assert registry.allocate("0000AAAA", PID_CODE) == ("B000", "new")
+    assert registry.allocate_many([("B000", "0000BBBB"), ("B005", "0000CCCC"), ("B000", "3333DDDD"),
+                                   (None, "4444EEEE")], PID_CODE) == [
+        ("B000", "exists"), ("B000", "duplicate"), ("B000", "collision"), ("B001", "new")]
+
+
+def test_sqlite_clear_rolls_back_on_error(tmp_path):
+    registry = SqliteActionRegistry(str(tmp_path / "registry.db"))
+    registry.store_many([("3000", "AA")], 3)
+    registry._conn.execute("DROP TABLE action_id_seq")
+    with pytest.raises(sqlite3.OperationalError):
+        registry.clear()
+    # 清空失败时已回滚，连接没有停留在写事务中，之后的调用正常执行
+    assert not registry._conn.in_transaction
+    assert registry.lookup("AA", 3) == "3000"
+    registry.close()
+
+
+@pytest.fixture(params=["txt", "sqlite"])
+def data_registry(request, tmp_path, monkeypatch):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    monkeypatch.setattr(data_utils, "data_file_path", str(data_dir))
+    if request.param == "txt":
+        registry = data_utils._init_registry(ActionRegistry(str(data_dir), data_utils.data_dict))
+    else:
+        registry = data_utils._init_registry(SqliteActionRegistry(str(tmp_path / "registry.db")))
+    monkeypatch.setattr(data_utils, "action_registry", registry)
+    yield registry
+    if request.param == "sqlite":
+        registry.close()
+
+
+def write_action_bins(folder, records):
+    folder.mkdir()
+    for action_id, config_hex in records:
+        (folder / f"AT_{action_id}.bin").write_bytes(
+            table_utils.build_action_table(action_id, bytes.fromhex(config_hex)))
+    return str(folder)
+
+
+def test_first_sync_rebuilds_registry(data_registry, tmp_path):
+    # 注册表中已有与文件夹中同ID、不同参数配置的记录，首次同步后注册表与文件夹完全一致
+    data_registry.store_many([("0000", "AA"), ("0001", "BB"), ("0002", "CC")], 0)
+    folder = write_action_bins(tmp_path / "at", [("0000", "DD"), ("0001", "EE")])
+    report = data_utils.sync_action_bins(folder, workers=1)
+    assert report["rebuilt"] and report["new"] == 2
+    assert report["collisions"] == [] and report["duplicates"] == []
+    assert data_registry.lookup_config("0000", 0) == "DD"
+    assert data_registry.lookup_config("0001", 0) == "EE"
+    assert data_registry.lookup_config("0002", 0) is None
+    assert data_registry.lookup("AA", 0) is None
+    assert data_registry.next_action_id(0) == "0002"
+
+    # 同一文件夹再次同步时只比对改动的文件
+    report = data_utils.sync_action_bins(folder, workers=1)
+    assert not report["rebuilt"] and report["unchanged"] == 2 and report["new"] == 0
+
+
+def test_sync_after_folder_change_rebuilds_registry(data_registry, tmp_path):
+    first = write_action_bins(tmp_path / "first", [("0000", "DD"), ("0001", "EE"), ("3000", "AB")])
+    data_utils.sync_action_bins(first, workers=1)
+    second = write_action_bins(tmp_path / "second", [("0000", "FF"), ("0001", "DD")])
+    report = data_utils.sync_action_bins(second, workers=1)
+    assert report["rebuilt"] and report["new"] == 2
+    assert report["collisions"] == [] and report["duplicates"] == []
+    assert data_registry.lookup("FF", 0) == "0000"
+    assert data_registry.lookup("DD", 0) == "0001"
+    assert data_registry.lookup_config("3000", 3) is None
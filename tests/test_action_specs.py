@@ -0,0 +1,244 @@
+"""
+动作参数声明（utils/field_spec.py、utils/action_specs.py）的回归测试
+
+每个动作类别记录按默认值编码的参数编码，以及两组非默认输入的参数编码和解码后改变的寄存器值。
+参数编码与配置界面、flow_compiler.py 生成的动作表一致，修改参数声明或config下的配置文件后编码改变时这里会失败，
+确认新的编码正确后再更新对应的向量。
+
+    python -m pytest tests
+"""
+import pytest
+
+from utils import action_specs
+from utils.total_table_reader import decode_config
+
+# 动作类别 -> (默认参数编码, [(非默认输入, 参数编码, 解码后与默认值不同的寄存器值)])
+GOLDEN = {
+    0: (
+        "FCCF3000190033001A00C0001B000F00FA00CC000201",
+        [
+            ({"led_switch": "00", "valve_enable": 3},
+             "F0CF3000190033001A0090001B000F00FA00CC000201",
+             {"switch_plate_selection": 53232, "valve_enable": 3}),
+            ({"ccd_switch": "00", "ccd_enable": 1, "acc": 1, "sample_box": 1},
+             "CCCF3000190030001A00C0001B000000FA0000000201",
+             {"switch_plate_selection": 53196, "ccd_enable": 1, "acc": 1, "sample_box": 1}),
+        ],
+    ),
+    1: (
+        "FCCF3B002F00000031008C2030003B00410000004300700242003B0053000000"
+        "5500F80C54003B00650000006700F80C66003B00770000007900F80C7800FF032C00",
+        [
+            ({"velocity_1": "5", "direction_1": 1},
+             "FCCF30002F0000003100871330003B00410000004300700242003B0053000000"
+             "5500F80C54003B00650000006700F80C66003B00770000007900F80C7800FF032C00",
+             {"zhuan_ji_1_subdivision_direction": (3, 1), "zhuan_ji_1_velocity": 4999}),
+            ({"motor_conf_3": "00", "subdivision_4": 1, "velocity_5": "20", "unit_5": 1},
+             "3CCF3B002F00000031008C2030003B00410000004300700242003B0053000000"
+             "5500F80C54001B00650000006700F80C66003B0077000000790089007800FF032C00",
+             {"motor_conf": 53052, "lu_zhong_ji_4_subdivision_direction": (1, 0), "lu_xia_ji_5_velocity": 137}),
+        ],
+    ),
+    2: (
+        "3C002D00000033001900320000003500190034000000370007003600070038001000390019002E00",
+        [
+            ({"run_mode": 0, "pulse_output": "100"},
+             "EB002D000000330019003200000035001900340000003700FA003600070038001000390019002E00",
+             {"run_mode": 0, "pulse_output_threshold": 250}),
+            ({"run_mode": 1, "limit_switch": 2, "limit_switch_type": 1},
+             "90002D00000033001900320000003500190034000000370007003600100038000400390019002E00",
+             {"run_mode": 1, "consecutive_steps": 16, "limit_switch": 2}),
+        ],
+    ),
+    3: (
+        "3C003F00000045004D0144000000470055014600000049004200480042004A0020004B004D014000",
+        [
+            ({"run_mode": 0, "pulse_output": "25"},
+             "EB003F00000045004D0144000000470055014600000049004103480042004A0020004B004D014000",
+             {"run_mode": 0, "pulse_output_threshold": 833}),
+            ({"out_of_step": "20", "open_loop_type": 1},
+             "3C003F0000004500050044000000470055014600000049004200480042004A0020004B009A024000",
+             {"run_loop": 5, "out_of_step_threshold": 666}),
+        ],
+    ),
+    4: (
+        "3C00510000005700EE345600000059000002580000005B004B055A004B055C0002005D00EE345200",
+        [
+            ({"run_mode": 0, "pulse_output": "7"},
+             "EB00510000005700EE345600000059000002580000005B000D255A004B055C0002005D00EE345200",
+             {"run_mode": 0, "pulse_output_threshold": 9485}),
+            ({"consecutive_steps": "3", "no_open_loop_type": 1},
+             "3C00510000005700EE345600000059000002580000005B0007005A00E10F5C0002005D004B005200",
+             {"pulse_output_threshold": 7, "consecutive_steps": 4065, "out_of_step_threshold": 75}),
+        ],
+    ),
+    5: (
+        "EB006300000069004B05680000006B0000026A0000006D004B056C00771A6E0000006F00EE346400",
+        [
+            ({"run_mode": 2, "run_loop": "3"},
+             "3C00630000006900E10F680000006B0000026A0000006D004B056C00771A6E0000006F00EE346400",
+             {"run_mode": 2, "run_loop": 4065}),
+            ({"limit_switch": 3, "run_encoder": "4"},
+             "EB006300000069004B05680000006B0000086A0000006D004B056C00771A6E0008006F00EE346400",
+             {"run_encoder": 2048, "limit_switch": 3}),
+        ],
+    ),
+    6: (
+        "EB00750000007B004B057A0000007D0000027C0000007F004B057E004B05800001008100EE347600",
+        [
+            ({"run_mode": 1, "pulse_output": "9"},
+             "9000750000007B004B057A0000007D0000027C0000007F00A32F7E004B05800001008100EE347600",
+             {"run_mode": 1, "pulse_output_threshold": 12195}),
+            ({"limit_switch": 6, "out_of_step": "2"},
+             "EB00750000007B004B057A0000007D0000027C0000007F004B057E004B05800040008100960A7600",
+             {"limit_switch": 6, "out_of_step_threshold": 2710}),
+        ],
+    ),
+    7: (
+        "FCCF00003A00FF004C00FF005E00FF007000FF008200",
+        [
+            ({"motor_2": "00", "status_1": 0},
+             "CCCFFF003A00FF004C00FF005E00FF007000FF008200",
+             {"motor_select": 53196, "motor1_status": 0}),
+            ({"status_3": 1, "status_5": 1},
+             "FCCF00003A00FF004C0000005E00FF00700000008200",
+             {"motor3_status": 1, "motor5_status": 1}),
+        ],
+    ),
+    8: (
+        "0300F300CC00F4000000F6009000F500FFFFEF00",
+        [
+            ({"xi_fen": 2, "velocity": "30"},
+             "3000F300CC00F4000000F6000901F500FFFFEF00",
+             {"xi_fen": 2, "velocity": 265}),
+            ({"direction": 0, "magnetic1": "A", "magnetic4": "3"},
+             "0300F3003300F4000000F6009000F500FA3FEF00",
+             {"direction": 0, "magnetic_enable": 16378}),
+        ],
+    ),
+    9: (
+        "FCC368010C01E0010D0158020E016801F800",
+        [
+            ({"val_1": "0.5"},
+             "FCC3B0040C01E0010D0158020E016801F800",
+             {"val_1": 1200}),
+            ({"current2": "00", "val_3": "1.2", "val_4": "0"},
+             "CCC368010C01E0010D01400B0E010000F800",
+             {"current_select": 50124, "val_3": 2880, "val_4": 0}),
+        ],
+    ),
+    "A": (
+        "FCC32221E900B33DEA00C300EB009204EC00",
+        [
+            ({"val_1": "60", "val_3": "8"},
+             "FCC34F24E900B33DEA004D03EB009204EC00",
+             {"val_1": 9295, "val_3": 845}),
+            ({"voltage2": "00", "val_2": "90", "val_4": "20"},
+             "CCC32221E9005A37EA00C300EB00EB0AEC00",
+             {"voltage_select": 50124, "val_2": 14170, "val_4": 2795}),
+        ],
+    ),
+    "B": (
+        "BAAA201CFFFFF4010000100EFFFF100E0500302AFFFF20030000D007FFFF32000000",
+        [
+            ({"PID1_val_1": "100", "PID1": 0},
+             "B7AA6400FFFFF4010000100EFFFF100E0500302AFFFF20030000D007FFFF32000000",
+             {"climb_enable": (0, 4, 3, 3), "PID1_val_1": 100}),
+            ({"PID2": 1, "PID3_val_3": "1200", "PID4_val_4": "7"},
+             "EAAA201CFFFFF4010000100EFFFF100E0500302AFFFFB0040000D007FFFF32000700",
+             {"climb_enable": (3, 1, 3, 3), "PID3_val_3": 1200, "PID4_val_4": 7}),
+        ],
+    ),
+    "C": (
+        "00FFF0F0F0F01A0000002A0000003A0000004A00000000FC00000000",
+        [
+            ({"val_1": "10", "judge_type": 0},
+             "0AFF0F0F0F0F1A0000002A0000003A0000004A00000000FC00000000",
+             {"judge_type": 0}),
+            ({"val_2": "128", "val_3": "FF", "process_identification": 0, "post_process": 1},
+             "007FF0F0F0F0FF0000002A0000003A0000004A00000000CAFC000000",
+             {"process_identification": 0, "post_process": 1}),
+        ],
+    ),
+    "D": (
+        "FCCF25002700250028002500290025002A0025002B00",
+        [
+            ({"val_1": "10"},
+             "FCCF10002700250028002500290025002A0025002B00",
+             {}),
+            ({"motor_3": "00", "val_4": "64", "val_5": "00"},
+             "3CCF25002700250028002500290064002A0000002B00",
+             {"motor_select": 53052}),
+        ],
+    ),
+    "E": (
+        "FF00FF000000",
+        [
+            ({"val_1": "0100"},
+             "0001FF000000",
+             {}),
+            ({"val_2": "1234", "val_3": "01", "val_4": "FF"},
+             "FF00341201FF",
+             {}),
+        ],
+    ),
+    "F": (
+        "640064006400640064006400640064006400640064006400",
+        [
+            ({"val_1": "0.5"},
+             "F40164006400640064006400640064006400640064006400",
+             {"val_1": 500}),
+            ({"val_6": "1.25", "val_12": "0"},
+             "64006400640064006400E204640064006400640064000000",
+             {"val_6": 1250, "val_12": 0}),
+        ],
+    ),
+}
+
+VARIANTS = [(code, values, expected_hex, expected_decoded)
+            for code, (_, variants) in GOLDEN.items() for values, expected_hex, expected_decoded in variants]
+
+
+def test_every_category_has_vectors():
+    assert set(GOLDEN) == set(action_specs.SPEC_BUILDERS)
+
+
+@pytest.mark.parametrize("code", list(GOLDEN))
+def test_default_record(code):
+    assert action_specs.build_spec(code).encode().hex().upper() == GOLDEN[code][0]
+
+
+@pytest.mark.parametrize("code, values, expected_hex, expected_decoded", VARIANTS)
+def test_non_default_record(code, values, expected_hex, expected_decoded):
+    spec = action_specs.build_spec(code)
+    assert spec.encode(values).hex().upper() == expected_hex
+    # 配置界面逐个修改输入时只重新计算依赖它的字段，结果与一次性编码相同
+    record = spec.new_record()
+    record.update(values)
+    assert record.hex() == expected_hex
+
+
+@pytest.mark.parametrize("code, values, expected_hex, expected_decoded", VARIANTS)
+def test_decode_changed_registers(code, values, expected_hex, expected_decoded):
+    default_decoded = decode_config(code, bytes.fromhex(GOLDEN[code][0]))
+    decoded = decode_config(code, bytes.fromhex(expected_hex))
+    assert set(decoded) == set(default_decoded)
+    assert {name: value for name, value in decoded.items() if value != default_decoded[name]} == expected_decoded
+
+
+@pytest.mark.parametrize("code", list(GOLDEN))
+def test_layout_round_trip(code):
+    spec = action_specs.build_spec(code)
+    layout, length = spec.layout()
+    assert [field for field, _, _ in layout] == list(spec.fields)
+    assert length == len(bytes.fromhex(GOLDEN[code][0]))
+    for values, expected_hex, _ in [({}, GOLDEN[code][0], {})] + GOLDEN[code][1]:
+        record = spec.new_record(values)
+        config = bytes.fromhex(expected_hex)
+        # 字段首尾相接，按布局切分后拼接回原来的参数编码
+        assert [start for _, start, _ in layout] == [0] + [stop for _, _, stop in layout[:-1]]
+        assert b"".join(config[start:stop] for _, start, stop in layout) == config
+        for field, start, stop in layout:
+            assert config[start:stop] == record.field_bytes(field.name)
+        assert decode_config(code, config) == {field.name: field.decode(config[start:stop])
+                                               for field, start, stop in layout if field.decode is not None}
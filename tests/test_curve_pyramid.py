@@ -0,0 +1,40 @@
+"""
+曲线降采样金字塔（utils/curve_pyramid.py）的回归测试
+"""
+import numpy as np
+import pytest
+
+from utils.curve_pyramid import CurvePyramid
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+
+def assert_same_pyramid(pyramid, expected):
+    assert pyramid.levels == expected.levels
+    for level in range(expected.levels):
+        np.testing.assert_array_equal(pyramid.mins[level], expected.mins[level])
+        np.testing.assert_array_equal(pyramid.maxs[level], expected.maxs[level])
+
+
+def test_incremental_growth_matches_fresh_pyramid():
+    # 恒为5的曲线每次增长一小时，直到5天；新增的层和旧层缺少的块都要计算
+    values = np.full(5 * DAY, 5.0)
+    pyramid = CurvePyramid()
+    for stop in range(HOUR, len(values) + 1, HOUR):
+        pyramid.set_values(values[stop - HOUR:stop], stop - HOUR)
+    expected = CurvePyramid(values)
+    assert_same_pyramid(pyramid, expected)
+    for width in (100, 800):
+        for actual, wanted in zip(pyramid.envelope(0, len(values), width), expected.envelope(0, len(values), width)):
+            np.testing.assert_array_equal(actual, wanted)
+
+
+@pytest.mark.parametrize("first, size", [(0, 90000), (1000, 90000), (49999, 100), (30000, 10)])
+def test_set_values_matches_fresh_pyramid(first, size):
+    # 曲线变长、变短，以及从中间开始替换
+    rng = np.random.default_rng(first)
+    pyramid = CurvePyramid(rng.normal(size=50000))
+    values = np.concatenate([pyramid.values[:first], rng.normal(size=size)])
+    pyramid.set_values(values[first:], first)
+    assert_same_pyramid(pyramid, CurvePyramid(values))
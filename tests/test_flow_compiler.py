@@ -0,0 +1,91 @@
+"""
+流程编译工具（flow_compiler.py）的回归测试，注册表换成临时的SQLite数据库，不改动data文件夹
+"""
+import os
+
+import pytest
+
+import flow_compiler
+from utils import data_utils, table_utils
+
+
+@pytest.fixture
+def registry(tmp_path):
+    previous = data_utils.action_registry
+    registry = data_utils.use_sqlite_registry(str(tmp_path / "registry.db"))
+    yield registry
+    registry.close()
+    data_utils.action_registry = previous
+
+
+def compile_rows(tmp_path, rows, dynamic_id=1):
+    return flow_compiler.compile_spec({"flows": [{"dynamic_id": dynamic_id, "rows": rows}]},
+                                      str(tmp_path / "build"), jobs=1)
+
+
+def output_files(tmp_path):
+    return [os.path.join(root, name) for root, _, names in os.walk(tmp_path / "build") for name in names]
+
+
+def test_failed_compile_leaves_registry_and_output_unchanged(registry, tmp_path):
+    # 流程项数超过最大动作数，时间线检查在分配ID和写文件之前失败
+    rows = [{"start_time": i * 10, "category": 0, "params": {"valve_enable": i % 8, "acc": i % 2,
+                                                             "sample_box": i // 2 % 2}} for i in range(130)]
+    with pytest.raises(ValueError, match="最大动作数"):
+        compile_rows(tmp_path, rows)
+    assert registry.next_action_id(0) == "0000"
+    assert output_files(tmp_path) == []
+
+
+def test_compile_allocates_after_checks(registry, tmp_path):
+    rows = [{"start_time": 0, "category": 0, "params": {"valve_enable": 2}},
+            {"start_time": 100, "category": 0, "params": {"valve_enable": 2}},
+            {"start_time": 200, "category": 0, "params": {"valve_enable": 3}}]
+    compile_rows(tmp_path, rows)
+    config = flow_compiler.encode_params(0, {"valve_enable": 2}, "")
+    assert registry.lookup(config, 0) == "0000"
+    assert registry.next_action_id(0) == "0002"
+    assert sorted(os.listdir(tmp_path / "build" / "action_bin")) == ["AT_0000.bin", "AT_0001.bin"]
+
+
+def test_registered_action_id_gets_at_file_from_registry(registry, tmp_path):
+    registry.store("3000", "ABCD", 3)
+    compile_rows(tmp_path, [{"start_time": 0, "action_id": "3000"}])
+    with open(tmp_path / "build" / "action_bin" / "AT_3000.bin", "rb") as file:
+        assert file.read() == bytes.fromhex("0030ABCD")
+
+
+def test_unknown_action_id_fails(registry, tmp_path):
+    with pytest.raises(ValueError, match="AT_3ABC.bin"):
+        compile_rows(tmp_path, [{"start_time": 0, "action_id": "3ABC"}])
+    assert output_files(tmp_path) == []
+
+
+@pytest.mark.parametrize("row, message", [
+    ({"start_time": 0, "category": 12, "params": {}}, "未知的动作类别：12"),
+    ({"start_time": 0, "category": "A", "params": {"val_3": "2"}}, "参数 val_3='2' 无法编码"),
+    ({"start_time": 0, "category": "A", "params": {"nope": "1"}}, "没有参数 nope"),
+    ({"start_time": 1 << 32, "category": 0, "params": {}}, "动作开始时间4294967296超出范围"),
+    ({"start_time": 0, "duration": 70000, "category": 0, "params": {}}, "动作时间70000超出范围"),
+])
+def test_invalid_rows_raise_value_error(registry, tmp_path, row, message):
+    with pytest.raises(ValueError, match=f"动态表1第1项：.*{message}"):
+        compile_rows(tmp_path, [row])
+    assert registry.next_action_id(0) == "0000"
+    assert output_files(tmp_path) == []
+
+
+@pytest.mark.parametrize("row, message", [
+    ((1 << 32, "0000", 0), "第2项：动作开始时间4294967296超出范围"),
+    ((0, "0000", 1 << 16), "第2项：动作时间65536超出范围"),
+    ((0, "10000", 0), "第2项：动作ID10000超出范围"),
+    ((0, "XYZ", 0), "第2项：动作ID'XYZ'不是16进制数"),
+])
+def test_dynamic_table_builder_rejects_out_of_range_rows(row, message):
+    builder = table_utils.DynamicTableBuilder(1)
+    empty = builder.to_bytes()
+    with pytest.raises(ValueError, match=message):
+        builder.extend([(0, "0000", 10), row])
+    # 检查在写入之前完成，缓冲区保持不变
+    assert builder.count == 0
+    assert builder.to_bytes() == empty
@@ -0,0 +1,167 @@
+"""
+总表检查工具
+
+用mmap打开 总表_*.bin 或 总表+3总表_*.bin，打印表头（总表配置、电机配置、各部分偏移、总表长度）、静态表中的
+实验总批数和每类动作数、每个动作表和动态表，并检查三份总表、校验和以及动作数是否一致；
+也可以与另一个总表按记录比较（见 utils/total_table_diff.py）。
+
+用法：
+    python total_table_inspector.py total_bin/总表+3总表_0x5A_20240101_120000.bin
+    python total_table_inspector.py 总表.bin --actions --fields --dynamic
+    python total_table_inspector.py 总表.bin --json > 总表.json
+    python total_table_inspector.py 新总表.bin --diff 旧总表.bin      # 按记录比较两个总表
+"""
+import argparse
+import json
+import sys
+
+from utils.total_table_diff import diff_images
+from utils.total_table_reader import SEGMENT_NAMES, TotalTableImage
+
+
+def describe(image, copy=0, actions=False, fields=False, dynamic=False):
+    """
+    总表的内容摘要（可转为JSON）
+    :param copy: 解析第几份总表
+    :param actions: 是否列出每个动作表
+    :param fields: 列出动作表时是否按参数声明解码字段
+    :param dynamic: 是否列出每个动态表的流程项
+    """
+    summary = {
+        "file": image.file_path,
+        "size": image.size,
+        "head": image.head,
+        "copies": image.copies,
+        "segments": {name: {"offset": image.segment_offset(name, copy), "length": len(image.segment(name, copy))}
+                     for name in SEGMENT_NAMES},
+        "batch_count": image.batch_count(copy),
+        "action_counts": {str(action_code): count for action_code, count in image.action_counts(copy).items()},
+        "checksum": f"0x{image.checksum():02X}",
+    }
+    if actions:
+        summary["actions"] = []
+        for action in image.iter_actions(copy):
+            item = {"offset": action.offset, "action_id": action.action_id, "config_hex": action.config_hex}
+            if fields:
+                item["fields"] = [{"name": name, "hex": hex_value, "value": value}
+                                  for name, hex_value, value in action.decode_fields()]
+            summary["actions"].append(item)
+    if dynamic:
+        summary["dynamic_tables"] = [{"offset": table.offset, "dynamic_id": table.dynamic_id,
+                                      "max_action_num": table.max_action_num, "rows": table.rows()}
+                                     for table in image.iter_dynamic_tables(copy)]
+    summary["problems"] = image.check()
+    return summary
+
+
+def print_summary(summary):
+    print(f"文件：{summary['file']}（{summary['size']}字节，校验和{summary['checksum']}）")
+    head = summary["head"]
+    if head is None:
+        print("没有表头（按 静态表 + 总动作表 + 总动态表 + 总监控表 解析）")
+    else:
+        print(f"表头：总表配置{head['table_config']} 电机配置{head['motor_config']} "
+              f"总表长度{head['total_length']}（{head['total_length_hex']}），共{summary['copies']}份总表")
+    for name, segment in summary["segments"].items():
+        offset_hex = f" {head['offsets_hex'][name]}" if head is not None else ""
+        print(f"  {name:<10} 位置{segment['offset']:>10} 长度{segment['length']:>10}{offset_hex}")
+    counts = " ".join(f"{action_code}:{count}" for action_code, count in summary["action_counts"].items() if count)
+    print(f"实验总批数：{summary['batch_count']}，每类动作数：{counts or '无'}")
+    for action in summary.get("actions", []):
+        print(f"  [{action['offset']:>8}] {action['action_id']} {action['config_hex']}")
+        for field in action.get("fields", []):
+            value = "" if field["value"] is None else f" = {field['value']}"
+            print(f"      {field['name']:<40} {field['hex']}{value}")
+    for table in summary.get("dynamic_tables", []):
+        print(f"  [{table['offset']:>8}] 动态表{table['dynamic_id']:04d}：{len(table['rows'])}个流程项"
+              f"（最大动作数{table['max_action_num']}）")
+        for start_time, action_id, action_time in table["rows"]:
+            print(f"      {start_time:>10} {action_id} {action_time}")
+    if summary["problems"]:
+        print("发现问题：")
+        for problem in summary["problems"]:
+            print(f"  {problem}")
+    else:
+        print("检查通过")
+
+
+def print_diff(diff, old_path, new_path):
+    print(f"旧总表：{old_path}")
+    print(f"新总表：{new_path}")
+    if diff["identical"]:
+        print("两个总表完全相同")
+        return
+    if not diff["head"]:
+        print("表头不同")
+    changed = [name for name, same in diff["segments"].items() if not same]
+    print(f"内容不同的部分：{', '.join(changed) or '无'}")
+    static = diff["static"]
+    if static is not None:
+        old_count, new_count = static["batch_count"]
+        if old_count != new_count:
+            print(f"  实验总批数：{old_count} -> {new_count}")
+        for action_code, (old_count, new_count) in static["action_counts"].items():
+            print(f"  类别{action_code}的动作数：{old_count} -> {new_count}")
+        print(f"  静态表第一个不同的位置：{static['first_difference']}")
+    actions = diff["actions"]
+    if actions is not None:
+        print(f"动作表：新增{len(actions['added'])}个，删除{len(actions['removed'])}个，修改{len(actions['modified'])}个")
+        for action_id in actions["added"]:
+            print(f"  + {action_id}")
+        for action_id in actions["removed"]:
+            print(f"  - {action_id}")
+        for action_id, changes in actions["modified"]:
+            print(f"  ~ {action_id}")
+            for name, old_value, new_value in changes:
+                print(f"      {name:<40} {old_value} -> {new_value}")
+    dynamic = diff["dynamic"]
+    if dynamic is not None:
+        print(f"动态表：新增{len(dynamic['added'])}个，删除{len(dynamic['removed'])}个，修改{len(dynamic['modified'])}个")
+        for dynamic_id in dynamic["added"]:
+            print(f"  + 动态表{dynamic_id}")
+        for dynamic_id in dynamic["removed"]:
+            print(f"  - 动态表{dynamic_id}")
+        for dynamic_id, changes in dynamic["modified"]:
+            print(f"  ~ 动态表{dynamic_id}")
+            for index, old_row, new_row in changes:
+                if index is None:
+                    print(f"      最大动作数 {old_row} -> {new_row}")
+                else:
+                    print(f"      第{index + 1}项 {old_row} -> {new_row}")
+    if diff["monitoring"] is not None:
+        print(f"监控表第一个不同的位置：{diff['monitoring']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="解析并检查总表（总表_*.bin、总表+3总表_*.bin）")
+    parser.add_argument("table", help="总表文件")
+    parser.add_argument("--copy", type=int, default=0, help="解析第几份总表（从0开始，默认0）")
+    parser.add_argument("--actions", action="store_true", help="列出每个动作表")
+    parser.add_argument("--fields", action="store_true", help="按参数声明解码动作表的字段（包含 --actions）")
+    parser.add_argument("--dynamic", action="store_true", help="列出每个动态表的流程项")
+    parser.add_argument("--json", action="store_true", help="以JSON格式输出")
+    parser.add_argument("--diff", metavar="OLD_TABLE", help="与旧总表按记录比较（只输出差异）")
+    args = parser.parse_args(argv)
+
+    if args.diff:
+        with TotalTableImage(args.diff) as old_image, TotalTableImage(args.table) as new_image:
+            diff = diff_images(old_image, new_image, args.copy, args.copy)
+        if args.json:
+            print(json.dumps(diff, ensure_ascii=False, indent=2))
+        else:
+            print_diff(diff, args.diff, args.table)
+        return 0 if diff["identical"] else 1
+
+    with TotalTableImage(args.table) as image:
+        if not 0 <= args.copy < max(1, image.copies):
+            parser.error(f"--copy 超出范围（共{image.copies}份总表）")
+        summary = describe(image, args.copy, args.actions or args.fields, args.fields, args.dynamic)
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    else:
+        print_summary(summary)
+    return 1 if summary["problems"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
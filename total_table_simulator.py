@@ -0,0 +1,88 @@
+"""
+总表试运行工具
+
+用mmap打开总表，按实验流程序号（动态表配置序号）选出动态表，在模拟的设备上执行一遍（见 utils/flow_executor.py），
+打印事件记录，也可以输出设备状态轨迹。数天的流程也只需几秒。
+
+用法：
+    python total_table_simulator.py total_bin/总表+3总表_0x5A_20240101_120000.bin --flow 1
+    python total_table_simulator.py 总表.bin --flow 2 --trace --interval 600       # 每10分钟采样一次设备状态
+    python total_table_simulator.py 总表.bin --flow 2 --end 86400 --json > 试运行.json
+"""
+import argparse
+import json
+import sys
+import time
+
+from utils.flow_executor import FlowExecutor
+from utils.total_table_reader import TotalTableImage
+
+
+def format_seconds(seconds):
+    """
+    时刻显示为 天d 时:分:秒
+    """
+    seconds = int(seconds)
+    days, rest = divmod(seconds, 86400)
+    hours, rest = divmod(rest, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{days}d {hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def print_events(events):
+    for event in events:
+        device = event["device"] or "-"
+        action_id = event["action_id"] or "    "
+        detail = f"：{event['detail']}" if event["detail"] else ""
+        print(f"{format_seconds(event['time'])} {event['event']} {action_id} {device}{detail}")
+
+
+def print_trace(trace):
+    for moment, device, state in trace:
+        values = " ".join(f"{name}={value}" for name, value in state.items())
+        print(f"{format_seconds(moment)} [{device}] {values}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="在模拟的设备上试运行总表中的一个实验流程")
+    parser.add_argument("table", help="总表文件")
+    parser.add_argument("--flow", type=int, help="实验流程序号（动态表配置序号），默认为第一个动态表")
+    parser.add_argument("--copy", type=int, default=0, help="使用第几份总表（从0开始，默认0）")
+    parser.add_argument("--end", type=float, help="执行到该时刻(s)为止，默认执行完全部事件")
+    parser.add_argument("--interval", type=float, help="设备状态的采样间隔(s)，默认只在状态改变时记录")
+    parser.add_argument("--trace", action="store_true", help="打印设备状态轨迹")
+    parser.add_argument("--json", action="store_true", help="以JSON格式输出事件记录和设备状态轨迹")
+    args = parser.parse_args(argv)
+
+    with TotalTableImage(args.table) as image:
+        flow = args.flow
+        if flow is None:
+            first = next(image.iter_dynamic_tables(args.copy), None)
+            if first is None:
+                parser.error("总表中没有动态表")
+            flow = first.dynamic_id
+        try:
+            executor = FlowExecutor.from_image(image, flow, args.copy, trace_interval=args.interval,
+                                               end_time=args.end)
+        except ValueError as e:
+            parser.error(str(e))
+    started = time.perf_counter()
+    executor.run()
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        print(json.dumps({"flow": flow, "events": executor.events,
+                          "trace": [{"time": moment, "device": device, "state": state}
+                                    for moment, device, state in executor.trace]},
+                         ensure_ascii=False, indent=2))
+        return 0
+    print(f"实验流程{flow}：{len(executor.rows)}个流程项，执行到{format_seconds(executor.time)}，"
+          f"{len(executor.events)}个事件，{len(executor.trace)}条状态记录，用时{elapsed:.3f}s")
+    print_events(executor.events)
+    if args.trace:
+        print_trace(executor.trace)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,8 +18,7 @@ from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
     QTransform)
 from PySide6.QtWidgets import (QAbstractItemView, QApplication, QHeaderView, QLabel,
     QLineEdit, QMainWindow, QMenuBar, QPushButton,
-    QSizePolicy, QStatusBar, QTableWidget, QTableWidgetItem,
-    QWidget)
+    QSizePolicy, QStatusBar, QTableView, QWidget)
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -42,38 +41,14 @@ class Ui_MainWindow(object):
         self.lineEdit_2 = QLineEdit(self.centralwidget)
         self.lineEdit_2.setObjectName(u"lineEdit_2")
         self.lineEdit_2.setGeometry(QRect(650, 40, 113, 20))
-        self.flowTableWidget = QTableWidget(self.centralwidget)
-        if (self.flowTableWidget.columnCount() < 10):
-            self.flowTableWidget.setColumnCount(10)
-        __qtablewidgetitem = QTableWidgetItem()
-        self.flowTableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem)
-        __qtablewidgetitem1 = QTableWidgetItem()
-        self.flowTableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem1)
-        __qtablewidgetitem2 = QTableWidgetItem()
-        self.flowTableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem2)
-        __qtablewidgetitem3 = QTableWidgetItem()
-        self.flowTableWidget.setHorizontalHeaderItem(3, __qtablewidgetitem3)
-        __qtablewidgetitem4 = QTableWidgetItem()
-        self.flowTableWidget.setHorizontalHeaderItem(4, __qtablewidgetitem4)
-        __qtablewidgetitem5 = QTableWidgetItem()
-        self.flowTableWidget.setHorizontalHeaderItem(5, __qtablewidgetitem5)
-        __qtablewidgetitem6 = QTableWidgetItem()
-        self.flowTableWidget.setHorizontalHeaderItem(6, __qtablewidgetitem6)
-        __qtablewidgetitem7 = QTableWidgetItem()
-        self.flowTableWidget.setHorizontalHeaderItem(7, __qtablewidgetitem7)
-        __qtablewidgetitem8 = QTableWidgetItem()
-        self.flowTableWidget.setHorizontalHeaderItem(8, __qtablewidgetitem8)
-        __qtablewidgetitem9 = QTableWidgetItem()
-        self.flowTableWidget.setHorizontalHeaderItem(9, __qtablewidgetitem9)
-        if (self.flowTableWidget.rowCount() < 128):
-            self.flowTableWidget.setRowCount(128)
-        self.flowTableWidget.setObjectName(u"flowTableWidget")
-        self.flowTableWidget.setGeometry(QRect(40, 130, 1051, 501))
-        self.flowTableWidget.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.flowTableWidget.setShowGrid(True)
-        self.flowTableWidget.setWordWrap(True)
-        self.flowTableWidget.setRowCount(128)
-        self.flowTableWidget.setColumnCount(10)
+        self.flowTableView = QTableView(self.centralwidget)
+        self.flowTableView.setObjectName(u"flowTableView")
+        self.flowTableView.setGeometry(QRect(40, 130, 1051, 501))
+        self.flowTableView.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.flowTableView.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.flowTableView.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.flowTableView.setShowGrid(True)
+        self.flowTableView.setWordWrap(True)
         self.newItemButton = QPushButton(self.centralwidget)
         self.newItemButton.setObjectName(u"newItemButton")
         self.newItemButton.setGeometry(QRect(440, 80, 75, 24))
@@ -101,6 +76,9 @@ class Ui_MainWindow(object):
         self.open_excel_file_PushButton = QPushButton(self.centralwidget)
         self.open_excel_file_PushButton.setObjectName(u"open_excel_file_PushButton")
         self.open_excel_file_PushButton.setGeometry(QRect(820, 80, 75, 24))
+        self.flowCurvePushButton = QPushButton(self.centralwidget)
+        self.flowCurvePushButton.setObjectName(u"flowCurvePushButton")
+        self.flowCurvePushButton.setGeometry(QRect(900, 690, 75, 24))
         MainWindow.setCentralWidget(self.centralwidget)
         self.menubar = QMenuBar(MainWindow)
         self.menubar.setObjectName(u"menubar")
@@ -121,27 +99,6 @@ class Ui_MainWindow(object):
         self.label.setText(QCoreApplication.translate("MainWindow", u"\u5b9e\u9a8c\u540d\u79f0\uff1a", None))
         self.label_2.setText(QCoreApplication.translate("MainWindow", u"\u8f7d\u8377\u540d\u79f0\uff1a", None))
         self.lineEdit_2.setText(QCoreApplication.translate("MainWindow", u"\u9ad8\u6e29\u67dc", None))
-        ___qtablewidgetitem = self.flowTableWidget.horizontalHeaderItem(0)
-        ___qtablewidgetitem.setText(QCoreApplication.translate("MainWindow", u"\u5e8f\u53f7", None));
-        ___qtablewidgetitem1 = self.flowTableWidget.horizontalHeaderItem(1)
-        ___qtablewidgetitem1.setText(QCoreApplication.translate("MainWindow", u"\u52a8\u4f5c\u8d77\u59cb\u65f6\u523b", None));
-        ___qtablewidgetitem2 = self.flowTableWidget.horizontalHeaderItem(2)
-        ___qtablewidgetitem2.setText(QCoreApplication.translate("MainWindow", u"\u52a8\u4f5c\u8d77\u59cb\u6761\u4ef6", None));
-        ___qtablewidgetitem3 = self.flowTableWidget.horizontalHeaderItem(3)
-        ___qtablewidgetitem3.setText(QCoreApplication.translate("MainWindow", u"\u52a8\u4f5c\u540d\u79f0\u4e0e\u63cf\u8ff0", None));
-        ___qtablewidgetitem4 = self.flowTableWidget.horizontalHeaderItem(4)
-        ___qtablewidgetitem4.setText(QCoreApplication.translate("MainWindow", u"\u52a8\u4f5c\u7ed3\u675f\u5224\u636e", None));
-        ___qtablewidgetitem5 = self.flowTableWidget.horizontalHeaderItem(5)
-        ___qtablewidgetitem5.setText(QCoreApplication.translate("MainWindow", u"\u672c\u52a8\u4f5c\u591a\u957f\u65f6\u95f4\u540e\u4e0b\u4e00\u4e2a\u52a8\u4f5c", None));
-        ___qtablewidgetitem6 = self.flowTableWidget.horizontalHeaderItem(6)
-        ___qtablewidgetitem6.setText(QCoreApplication.translate("MainWindow", u"\u52a8\u4f5c\u65f6\u95f4\n"
-"\uff08s\uff09", None));
-        ___qtablewidgetitem7 = self.flowTableWidget.horizontalHeaderItem(7)
-        ___qtablewidgetitem7.setText(QCoreApplication.translate("MainWindow", u"\u5907\u6ce8", None));
-        ___qtablewidgetitem8 = self.flowTableWidget.horizontalHeaderItem(8)
-        ___qtablewidgetitem8.setText(QCoreApplication.translate("MainWindow", u"\u52a8\u4f5cID", None));
-        ___qtablewidgetitem9 = self.flowTableWidget.horizontalHeaderItem(9)
-        ___qtablewidgetitem9.setText(QCoreApplication.translate("MainWindow", u"\u662f\u5426\u662f\u65b0\u52a8\u4f5c", None));
         self.newItemButton.setText(QCoreApplication.translate("MainWindow", u"\u65b0\u5efa\u6d41\u7a0b\u9879", None))
         self.pushButton_1.setText(QCoreApplication.translate("MainWindow", u"\u751f\u6210\u52a8\u4f5c\u8868", None))
         self.pushButton_2.setText(QCoreApplication.translate("MainWindow", u"\u751f\u6210\u52a8\u6001\u8868", None))
@@ -151,5 +108,6 @@ class Ui_MainWindow(object):
         self.deleteItemPushButton.setText(QCoreApplication.translate("MainWindow", u"\u5220\u9664\u6d41\u7a0b\u9879", None))
         self.loadDataPushButton.setText(QCoreApplication.translate("MainWindow", u"\u5bfc\u5165\u6570\u636e", None))
         self.open_excel_file_PushButton.setText(QCoreApplication.translate("MainWindow", u"\u6253\u5f00\u6d41\u7a0b\u8868", None))
+        self.flowCurvePushButton.setText(QCoreApplication.translate("MainWindow", u"\u6d41\u7a0b\u66f2\u7ebf", None))
     # retranslateUi
 
@@ -0,0 +1,384 @@
+import os
+import threading
+
+from utils.action_sync import replace_files
+
+
+class ActionRegistry:
+    """
+    进程级的动作ID注册表
+
+    每个动作类别的data/*.txt文件只读取一次，建立 参数编码 -> 动作ID 的哈希索引，同时记录该类别的最大动作ID，
+    查询已存在的动作和分配新动作ID都是O(1)。文件被修改（store_data追加、clear_data清空、
+    load_action_bin_to_data导入，或者被其他程序改动）后，索引会自动失效并在下次查询时重新加载。
+
+    某些类别允许部分匹配（例如PID控温曲线以"0000"开头时只比对前四个字符），可以通过register_partial_key
+    为该类别注册一个部分匹配键函数，注册表会在完整编码索引之外再建立一个部分匹配键的索引。
+    """
+
+    def __init__(self, data_dir, file_names):
+        """
+        :param data_dir: 存放动作表.txt文件的目录
+        :param file_names: 动作类别 -> .txt文件名 的字典（即data_utils.data_dict）
+        """
+        self.data_dir = data_dir
+        self.file_names = file_names
+        self._lock = threading.RLock()
+        # 每个类别的参数编码索引 {action_code: {config_hex: action_id}}
+        self._index = {}
+        # 每个类别已使用的动作ID {action_code: {action_id: config_hex}}
+        self._ids = {}
+        # 每个类别当前最大的动作ID（整数），类别为空时为None
+        self._max_id = {}
+        # 加载索引时文件的(修改时间, 大小)，用于判断文件是否被改动
+        self._stamp = {}
+        # 部分匹配键函数 {action_code: key_func}
+        self._partial_keys = {}
+        # 部分匹配键索引 {action_code: {partial_key: action_id}}
+        self._partial_index = {}
+
+    def file_path(self, action_code):
+        """
+        动作类别对应的.txt文件路径
+        """
+        return os.path.join(self.data_dir, self.file_names[action_code])
+
+    def register_partial_key(self, action_code, key_func):
+        """
+        为动作类别注册部分匹配键
+        :param action_code: 动作类别
+        :param key_func: 参数编码 -> 部分匹配键 的函数；返回None表示该编码按完整编码比对，
+                         返回键值时只按键值比对（查询的编码和已存的编码使用同一个函数计算键值）
+        """
+        with self._lock:
+            self._partial_keys[action_code] = key_func
+            self.invalidate(action_code)
+
+    def _file_stamp(self, action_code):
+        try:
+            stat = os.stat(self.file_path(action_code))
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self, action_code):
+        """
+        读取一个类别的.txt文件并建立索引
+        """
+        index = {}
+        ids = {}
+        partial_index = {}
+        key_func = self._partial_keys.get(action_code)
+        max_id = None
+        stamp = self._file_stamp(action_code)
+        if stamp is not None:
+            with open(self.file_path(action_code), 'r', encoding='utf-8') as data_file:
+                for line in data_file:
+                    line = line.strip()
+                    # 读取到空行跳过
+                    if line == '':
+                        continue
+                    parts = line.split(" ")
+                    if len(parts) != 2:
+                        print(f"动作表数据格式错误，已跳过：{line}")
+                        continue
+                    action_id, config = parts
+                    # 相同的参数配置只保留第一次出现的ID
+                    index.setdefault(config, action_id)
+                    ids.setdefault(action_id, config)
+                    if key_func is not None:
+                        partial_key = key_func(config)
+                        if partial_key is not None:
+                            partial_index.setdefault(partial_key, action_id)
+                    id_val = int(action_id, 16)
+                    if max_id is None or id_val > max_id:
+                        max_id = id_val
+        self._index[action_code] = index
+        self._ids[action_code] = ids
+        self._partial_index[action_code] = partial_index
+        self._max_id[action_code] = max_id
+        self._stamp[action_code] = stamp
+
+    def _ensure_loaded(self, action_code):
+        if action_code not in self._index or self._stamp[action_code] != self._file_stamp(action_code):
+            self._load(action_code)
+
+    def lookup(self, config_hex, action_code):
+        """
+        查询参数配置对应的已有动作ID
+        :param config_hex: 参数配置的16进制编码
+        :param action_code: 动作类别
+        :return: 已存在的动作ID，不存在返回None
+        """
+        config_hex = str(config_hex).upper()
+        with self._lock:
+            self._ensure_loaded(action_code)
+            return self._match(config_hex, action_code)
+
+    def _match(self, config_hex, action_code):
+        """
+        在已加载的索引中查询参数配置（有部分匹配键时按键值比对）
+        """
+        key_func = self._partial_keys.get(action_code)
+        if key_func is not None:
+            partial_key = key_func(config_hex)
+            if partial_key is not None:
+                return self._partial_index[action_code].get(partial_key)
+        return self._index[action_code].get(config_hex)
+
+    def lookup_config(self, action_id, action_code):
+        """
+        查询动作ID对应的参数配置
+        :return: 参数配置的16进制编码，不存在返回None
+        """
+        with self._lock:
+            self._ensure_loaded(action_code)
+            return self._ids[action_code].get(str(action_id).upper())
+
+    def next_action_id(self, action_code):
+        """
+        该类别下一个可用的新动作ID（最大ID+1，类别为空时为 类别+"000"）
+        """
+        with self._lock:
+            self._ensure_loaded(action_code)
+            max_id = self._max_id[action_code]
+            if max_id is None:
+                return str(action_code) + "000"
+            return format(max_id + 1, '04X')
+
+    def get_action_id(self, config_hex, action_code):
+        """
+        根据配置参数编码查询动作ID，若存在则返回已存在的ID，不存在返回一个新ID
+        :param config_hex: 参数配置的16进制编码
+        :param action_code: 动作类别
+        :return: 返回一个Tuple，(动作id, 是否是新动作：是 = 1，否 = 0)
+        """
+        with self._lock:
+            action_id = self.lookup(config_hex, action_code)
+            if action_id is not None:
+                return action_id, 0
+            return self.next_action_id(action_code), 1
+
+    def allocate(self, config_hex, action_code, action_id=None):
+        """
+        查询参数配置对应的动作ID，不存在时分配新ID并写入（见allocate_many）
+        :return: (动作ID, 结果)
+        """
+        return self.allocate_many([(action_id, config_hex)], action_code)[0]
+
+    def allocate_many(self, records, action_code):
+        """
+        批量查询参数配置、分配新动作ID并写入，在同一次加锁中完成，新记录只打开一次.txt文件写入
+        :param records: [(指定的动作ID或None, 参数编码)]，为None时分配该类别最大ID+1
+        :return: 每条记录的 (动作ID, 结果)，结果为 "new" 新记录，"exists" 参数配置已使用指定的动作ID，
+                 "duplicate" 参数配置已使用其他动作ID（返回已有的ID），"collision" 指定的动作ID已被其他参数配置占用
+        """
+        results = []
+        with self._lock:
+            lines = []
+            for action_id, config_hex in records:
+                config_hex = str(config_hex).upper()
+                existing = self.lookup(config_hex, action_code)
+                if existing is not None:
+                    same = action_id is not None and existing == action_id.upper()
+                    results.append((existing, "exists" if same else "duplicate"))
+                    continue
+                action_id = self.next_action_id(action_code) if action_id is None else action_id.upper()
+                if action_id in self._ids[action_code]:
+                    results.append((action_id, "collision"))
+                    continue
+                lines.append(action_id + " " + config_hex + '\n')
+                self._add(action_id, config_hex, action_code)
+                results.append((action_id, "new"))
+            if lines:
+                with open(self.file_path(action_code), 'a') as file:
+                    file.write(''.join(lines))
+                self._stamp[action_code] = self._file_stamp(action_code)
+        return results
+
+    def store(self, action_id, config_hex, action_code):
+        """
+        向类别的.txt文件追加一条动作记录，并同步更新内存中的索引
+        :return: 是否写入成功
+        """
+        with self._lock:
+            with open(self.file_path(action_code), 'a') as file:
+                file.write(action_id + " " + config_hex + '\n')
+            self.record(action_id, config_hex, action_code)
+        return True
+
+    def store_many(self, records, action_code):
+        """
+        批量保存一个类别的动作记录：只打开一次.txt文件，一次写入全部新记录
+        参数配置已存在（文件中或本批前面的记录中，与lookup一样按部分匹配键比对）的记录不再写入；
+        动作ID已被其他参数配置占用的记录拒绝写入
+        :param records: [(动作ID, 参数编码)]
+        :return: 每条记录的写入结果，"new" 新记录，"duplicate" 参数配置已存在，"collision" 动作ID已被其他参数配置占用
+        """
+        results = []
+        with self._lock:
+            self._ensure_loaded(action_code)
+            ids = self._ids[action_code]
+            lines = []
+            for action_id, config_hex in records:
+                if self._match(config_hex, action_code) is not None:
+                    results.append("duplicate")
+                elif action_id in ids:
+                    results.append("collision")
+                else:
+                    lines.append(action_id + " " + config_hex + '\n')
+                    self._add(action_id, config_hex, action_code)
+                    results.append("new")
+            if lines:
+                with open(self.file_path(action_code), 'a') as file:
+                    file.write(''.join(lines))
+                self._stamp[action_code] = self._file_stamp(action_code)
+        return results
+
+    def apply_changes(self, removed, added):
+        """
+        同步动作表文件夹时批量删除和添加记录：每个受影响类别的.txt文件在内存中生成新内容后原子地整体替换
+        :param removed: 要删除的记录 {动作类别: [(动作ID, 参数编码)]}
+        :param added: 要添加的记录 {动作类别: [(动作ID, 参数编码)]}
+        :return: 添加记录的结果 {动作类别: [结果]}，结果为 "new" 新记录，"exists" 相同记录已存在，
+                 "duplicate" 参数配置已存在，"collision" 动作ID已被其他参数配置占用
+        """
+        results = {}
+        texts = {}
+        with self._lock:
+            for action_code in set(removed) | set(added):
+                drop = {}
+                for action_id, config_hex in removed.get(action_code, ()):
+                    key = action_id + " " + config_hex
+                    drop[key] = drop.get(key, 0) + 1
+                lines = []
+                file_path = self.file_path(action_code)
+                if os.path.exists(file_path):
+                    with open(file_path, 'r', encoding='utf-8') as data_file:
+                        for line in data_file:
+                            line = line.strip()
+                            if line == '':
+                                continue
+                            if drop.get(line):
+                                drop[line] -= 1
+                                continue
+                            lines.append(line)
+                texts[file_path], results[action_code] = self._merge(lines, added.get(action_code, ()), action_code)
+            replace_files(texts)
+            for action_code in results:
+                self.invalidate(action_code)
+        return results
+
+    def replace_all(self, records):
+        """
+        用给定的记录整体重建注册表（全量同步动作表文件夹时使用）：所有类别的.txt文件在内存中生成新内容后原子地替换，
+        不在records中的类别被清空
+        :param records: {动作类别: [(动作ID, 参数编码)]}
+        :return: 每条记录的结果 {动作类别: [结果]}，结果同apply_changes
+        """
+        results = {}
+        texts = {}
+        with self._lock:
+            for action_code in self.file_names:
+                texts[self.file_path(action_code)], code_results = self._merge([], records.get(action_code, ()),
+                                                                               action_code)
+                if action_code in records:
+                    results[action_code] = code_results
+            replace_files(texts)
+            self.invalidate()
+        return results
+
+    def _merge(self, lines, added, action_code):
+        """
+        把新记录合并到一个类别已有的记录行后面（与lookup一样，有部分匹配键的参数配置按键值比对）
+        :param lines: 已有的记录行 ["动作ID 参数编码"]
+        :param added: 要添加的记录 [(动作ID, 参数编码)]
+        :return: (新的文件内容, 每条添加记录的结果)
+        """
+        lines = list(lines)
+        configs = {}
+        ids = set()
+        # 部分匹配键 -> 动作ID
+        key_func = self._partial_keys.get(action_code) or (lambda config_hex: None)
+        partials = {}
+        for line in lines:
+            parts = line.split(" ")
+            if len(parts) == 2:
+                configs.setdefault(parts[1], parts[0])
+                ids.add(parts[0])
+                partial_key = key_func(parts[1])
+                if partial_key is not None:
+                    partials.setdefault(partial_key, parts[0])
+        results = []
+        for action_id, config_hex in added:
+            partial_key = key_func(config_hex)
+            existing = configs.get(config_hex) if partial_key is None else partials.get(partial_key)
+            if config_hex in configs and configs[config_hex] == action_id:
+                results.append("exists")
+            elif existing is not None:
+                results.append("exists" if existing == action_id else "duplicate")
+            elif action_id in ids:
+                results.append("collision")
+            else:
+                lines.append(action_id + " " + config_hex)
+                configs[config_hex] = action_id
+                ids.add(action_id)
+                if partial_key is not None:
+                    partials[partial_key] = action_id
+                results.append("new")
+        return ''.join(line + '\n' for line in lines), results
+
+    def clear(self):
+        """
+        清空data文件夹下的所有数据文件
+        """
+        with self._lock:
+            for file_name in os.listdir(self.data_dir):
+                with open(os.path.join(self.data_dir, file_name), "w") as file:
+                    file.write("")
+            self.invalidate()
+
+    def record(self, action_id, config_hex, action_code):
+        """
+        .txt文件追加一条记录后调用，直接更新内存中的索引，避免重新读取整个文件
+        """
+        with self._lock:
+            if action_code not in self._index:
+                return
+            self._add(action_id, config_hex, action_code)
+            self._stamp[action_code] = self._file_stamp(action_code)
+
+    def _add(self, action_id, config_hex, action_code):
+        """
+        把一条记录加入已加载的索引
+        """
+        self._index[action_code].setdefault(config_hex, action_id)
+        self._ids[action_code].setdefault(action_id, config_hex)
+        key_func = self._partial_keys.get(action_code)
+        if key_func is not None:
+            partial_key = key_func(config_hex)
+            if partial_key is not None:
+                self._partial_index[action_code].setdefault(partial_key, action_id)
+        id_val = int(action_id, 16)
+        max_id = self._max_id[action_code]
+        if max_id is None or id_val > max_id:
+            self._max_id[action_code] = id_val
+
+    def invalidate(self, action_code=None):
+        """
+        使索引失效，下次查询时重新读取文件
+        :param action_code: 动作类别，为None时全部失效
+        """
+        with self._lock:
+            if action_code is None:
+                self._index.clear()
+                self._ids.clear()
+                self._partial_index.clear()
+                self._max_id.clear()
+                self._stamp.clear()
+            else:
+                self._index.pop(action_code, None)
+                self._ids.pop(action_code, None)
+                self._partial_index.pop(action_code, None)
+                self._max_id.pop(action_code, None)
+                self._stamp.pop(action_code, None)
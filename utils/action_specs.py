@@ -0,0 +1,460 @@
+"""
+16类动作参数的声明
+
+每类动作声明界面上的输入（默认值与配置界面一致）以及参数编码中按写入顺序排列的字段，
+配置界面（action_config_dlg.ActionConfigDlg）和无界面的工具（flow_compiler.py）都通过这里的声明编码，
+保证两边生成的参数编码完全一致。
+
+    spec = action_specs.build_spec(4)
+    config_bytes = spec.encode({"run_loop": "20", "limit_switch": 3})
+"""
+from utils import encoder
+from utils.data_utils import get_config
+from utils.field_spec import (ActionSpec, Field, addressed_u16_field, addressed_u32_field, const_field, enum_field,
+                              hex_field, omit_hex, omit_reversed, packed_field, u16_field)
+
+
+# ---------------------- 单位换算 ----------------------
+def motor_pulses(val, conf, type_index):
+    """
+    电机运动距离（角度）换算为脉冲数
+    :param val: 直线运动的距离(mm)或圆周运动的角度
+    :param conf: 电机参数 (丝杠螺距P, 减速比i, 主动齿轮齿数z1, 传动齿轮齿数z2)
+    :param type_index: 运动类别 0=直线运动 1=圆周运动
+    """
+    P, i, z1, z2 = conf
+    if type_index == 0:
+        # 直线运动计算方式
+        return ((val / (z1 / z2)) / (P / i)) * 200
+    # 圆周运动计算方式
+    return ((val / (z1 / z2)) / (1 / i)) / 1.8
+
+
+def motor_velocity_count(velocity, conf, type_index, unit_index, steps=200):
+    """
+    炉丝电机速度换算为速度寄存器的计数值
+    :param velocity: 速度
+    :param conf: 电机参数 (丝杠螺距P, 减速比i, 主动齿轮齿数z1, 传动齿轮齿数z2)
+    :param type_index: 运动类别 0=直线运动 1=圆周运动
+    :param unit_index: 直线运动的速度单位 0=mm/s 1=mm/min 2=mm/h
+    :param steps: 直线运动每转的脉冲数
+    """
+    P, i, z1, z2 = conf
+    if type_index == 0:
+        if unit_index == 1:
+            velocity = velocity / 60
+        elif unit_index == 2:
+            velocity = velocity / 3600
+        F = ((velocity / (P / i)) / (z1 / z2)) * steps
+    else:
+        F = (velocity / (z1 / z2)) / (1 / i) / 1.8
+    return round((((1024 * 1000) / F) / 2) - 1, 8)
+
+
+def motor_conf(section):
+    """
+    配置文件中的电机参数 (P, i, z1, z2)
+    """
+    return section["P"], section["i"], section["z1"], section["z2"]
+
+
+def const_list(section, keys):
+    """
+    按顺序读取配置中的一组16进制常量
+    """
+    return [encoder.const(section[key]) for key in keys]
+
+
+# ---------------------- 0 炉子开关 ----------------------
+# 各下拉框的选项（配置文件中的键名），下拉框索引即选项在列表中的位置
+FURNACE_SWITCH_KEYS = {
+    "led_enable": ["LED1_enable", "LED1_close", "LED2_enable", "LED2_close"],
+    "ccd_enable": ["CCD1_enable", "CCD1_close", "CCD2_enable", "CCD2_close"],
+    "valve_enable": ["nitrogen_valve_open", "nitrogen_valve_close", "re-pressing_open", "re-pressing_close",
+                     "exhaust_switching", "vacuum_control", "exhaust_vacuum_open", "exhaust_vacuum_close"],
+    "acc": ["open", "close"],
+    "sample_box": ["open", "close"],
+}
+
+
+def furnace_switch_spec():
+    config = get_config(0)
+    switch = config["switch_plate_selection"]
+    led = config["LED_enable_settings"]
+    ccd = config["CCD_enable_settings"]
+    valve = config["valve_enable_settings"]
+    acc = config["acceleration_settings"]
+    sample_box = config["sample_box_settings"]
+    led_options = const_list(led, FURNACE_SWITCH_KEYS["led_enable"])
+    valve_options = const_list(valve, FURNACE_SWITCH_KEYS["valve_enable"])
+    inputs = {
+        # 开关量片选
+        "led_switch": switch["LED"], "ccd_switch": switch["CCD"], "valve_switch": switch["valve"],
+        "acc_switch": switch["acceleration"], "sample_box_switch": switch["sample_box"],
+        # 下拉框索引
+        "led_enable": 1, "ccd_enable": 0, "valve_enable": 7, "acc": 0, "sample_box": 0,
+    }
+    fields = [
+        packed_field("switch_plate_selection",
+                     ["sample_box_switch", "acc_switch", "valve_switch", "ccd_switch", "led_switch"],
+                     head="1100", end="00"),
+        enum_field("led_enable", "led_enable", led_options, encoder.const(led["tail"]), default=led_options[1]),
+        enum_field("ccd_enable", "ccd_enable", const_list(ccd, FURNACE_SWITCH_KEYS["ccd_enable"]),
+                   encoder.const(ccd["tail"])),
+        enum_field("valve_enable", "valve_enable", valve_options, encoder.const(valve["tail"]),
+                   default=valve_options[7]),
+        enum_field("acc", "acc", const_list(acc, FURNACE_SWITCH_KEYS["acc"]), encoder.const(acc["tail"]),
+                   omit=omit_reversed(2)),
+        enum_field("sample_box", "sample_box", const_list(sample_box, FURNACE_SWITCH_KEYS["sample_box"]),
+                   encoder.const(sample_box["tail"])),
+    ]
+    return ActionSpec(0, inputs, fields)
+
+
+# ---------------------- 1 炉丝电机 ----------------------
+HEARTH_MOTORS = ["zhuan_ji_1", "yang_ti_ji_2", "lu_shang_ji_3", "lu_zhong_ji_4", "lu_xia_ji_5"]
+# 各电机速度输入框的默认值和默认速度单位
+HEARTH_VELOCITY_DEFAULTS = ["3", "3", "50", "50", "50"]
+HEARTH_UNIT_DEFAULTS = [0, 0, 2, 2, 2]
+# 各电机直线运动每转的脉冲数
+HEARTH_VELOCITY_STEPS = [200, 200, 1600, 1600, 1600]
+
+
+def subdivision_direction_field(name, n, section):
+    """
+    炉丝电机细分和方向：细分(半字节) + 方向(半字节) + 尾部
+    """
+    subdivisions = [section["two_four"], section["two"], section["four"], section["eight"]]
+
+    def encode(subdivision_index, direction_index):
+        subdivision = subdivisions[subdivision_index] if 0 <= subdivision_index < 4 else section["eight"]
+        rotation = section["backward_rotation"] if direction_index == 1 else section["forward_rotation"]
+        data = encoder.const(subdivision + rotation + section["tail"])
+        return encoder.hex_text(data[0:1]), data
+
+    def decode(data):
+        # (细分下拉框索引, 方向 0=正转 1=反转)，细分与选项都不符时索引为None
+        subdivision, rotation = encoder.hex_text(data[0:1])
+        codes = [option.upper() for option in subdivisions]
+        return (codes.index(subdivision) if subdivision in codes else None,
+                1 if rotation == section["backward_rotation"].upper() else 0)
+
+    return Field(name, (f"subdivision_{n}", f"direction_{n}"), encode, decode)
+
+
+def hearth_wire_motor_spec():
+    config = get_config(1)
+    conf_select = config["motor_conf_select"]
+    enable = config["motor_enable_settings"]
+    inputs = {}
+    for n, motor in enumerate(HEARTH_MOTORS, 1):
+        inputs[f"motor_conf_{n}"] = conf_select[motor]
+    fields = [packed_field("motor_conf", [f"motor_conf_{n}" for n in range(5, 0, -1)], head="1100", end="00")]
+    for n, motor in enumerate(HEARTH_MOTORS, 1):
+        settings = config[f"{motor}_settings"]
+        velocity = settings["velocity"]
+        conf = motor_conf(velocity)
+        inputs.update({f"subdivision_{n}": 3, f"direction_{n}": 0, f"velocity_{n}": HEARTH_VELOCITY_DEFAULTS[n - 1],
+                       f"type_{n}": 0, f"unit_{n}": HEARTH_UNIT_DEFAULTS[n - 1]})
+        fields.append(subdivision_direction_field(f"{motor}_subdivision_direction", n,
+                                                  settings["subdivision_direction"]))
+        fields.append(addressed_u32_field(
+            f"{motor}_velocity", [f"velocity_{n}", f"type_{n}", f"unit_{n}"],
+            lambda text, type_index, unit_index, conf=conf, steps=HEARTH_VELOCITY_STEPS[n - 1]:
+            motor_velocity_count(float(text), conf, type_index, unit_index, steps),
+            encoder.const(velocity["address_head"]), encoder.const(velocity["address_tail"])))
+    for n, motor in enumerate(HEARTH_MOTORS, 1):
+        inputs[f"motor_enable_{n}"] = enable[motor]
+    fields.append(packed_field("motor_enable", [f"motor_enable_{n}" for n in range(5, 0, -1)], head="000000",
+                               tail=encoder.const(enable["tail"])))
+    return ActionSpec(1, inputs, fields)
+
+
+# ---------------------- 2~6 转机1、样提机2、炉上机3、炉中机4、炉下机5 ----------------------
+# 各类动作运行编码器设置值的换算除数
+MOTOR_ENCODER_DIVISORS = {2: 400, 3: 3, 4: 2, 5: 2, 6: 2}
+LIMIT_SWITCH_KEYS = ["ti_ji_2_shang", "ti_ji_2_xia", "zhuan_ji_1_0", "zhuan_ji_1_ji", "wu_hao", "liu_hao",
+                     "lu_shang_ji_3_shang", "lu_shang_ji_3_xia", "lu_xia_ji_5_shang", "lu_xia_ji_5_xia", "no_use"]
+
+
+def motor_spec(action_code, text_defaults, run_mode_index, limit_switch_index,
+               run_mode_fallback="encoder", limit_switch_keys=LIMIT_SWITCH_KEYS):
+    """
+    转机、样提机、炉上机、炉中机、炉下机的参数声明（五类动作的参数格式相同）
+    :param text_defaults: 开环设置、编码器设置、脉冲输出阈值、续转步数、失步阈值输入框的默认值
+    :param run_mode_index: 运行方式下拉框的默认索引
+    :param limit_switch_index: 限位开关下拉框的默认索引
+    :param run_mode_fallback: 运行方式索引超出范围时使用的选项
+    :param limit_switch_keys: 限位开关下拉框各选项在配置文件中的键
+    """
+    config = get_config(action_code)
+    encoder_divisor = MOTOR_ENCODER_DIVISORS[action_code]
+    open_loop = motor_conf(config["open_loop_config"])
+    no_open_loop = motor_conf(config["no_open_loop_config"])
+    limit_switch = motor_conf(config["limit_switch_config"])
+    run_mode = config["zhuan_ji_1_run_mode"]
+    run_loop = config["run_loop_settings"]
+    run_encoder = config["run_encoder_settings"]
+    pulse = config["pulse_output_threshold"]
+    limit_switch_settings = config["limit_switch_settings"]
+    limit_switch_address = encoder.const(limit_switch_settings["address"])
+    inputs = {
+        "run_mode": run_mode_index,
+        "run_loop": text_defaults[0],
+        "run_encoder": text_defaults[1],
+        "pulse_output": text_defaults[2],
+        "consecutive_steps": text_defaults[3],
+        "limit_switch": limit_switch_index,
+        "out_of_step": text_defaults[4],
+        # 运动类别 0=直线运动 1=圆周运动
+        "open_loop_type": 0,
+        "no_open_loop_type": 0,
+        "limit_switch_type": 0,
+    }
+    fields = [
+        enum_field("run_mode", "run_mode", const_list(run_mode, ["open_loop", "limit_switch", "encoder"]),
+                   encoder.const(run_mode["tail"]), default=encoder.const(run_mode[run_mode_fallback]),
+                   omit=omit_reversed(2)),
+        addressed_u32_field("run_loop", ["run_loop", "open_loop_type"],
+                            lambda text, type_index: motor_pulses(float(text), open_loop, type_index),
+                            encoder.const(run_loop["high_address"]), encoder.const(run_loop["low_address"])),
+        addressed_u32_field("run_encoder", ["run_encoder"], lambda text: (float(text) * 1024) / encoder_divisor,
+                            encoder.const(run_encoder["high_address"]), encoder.const(run_encoder["low_address"])),
+        addressed_u32_field("pulse_output_threshold", ["pulse_output", "no_open_loop_type"],
+                            lambda text, type_index: motor_pulses(float(text), no_open_loop, type_index),
+                            encoder.const(pulse["high_address"]), encoder.const(pulse["low_address"])),
+        addressed_u16_field("consecutive_steps", ["consecutive_steps", "limit_switch_type"],
+                            lambda text, type_index: motor_pulses(float(text), limit_switch, type_index),
+                            encoder.const(config["consecutive_steps"]["address"])),
+        enum_field("limit_switch", "limit_switch",
+                   [value + limit_switch_address for value in const_list(limit_switch_settings, limit_switch_keys)],
+                   default=encoder.const(limit_switch_settings["no_use"]) + limit_switch_address,
+                   omit=omit_reversed(2)),
+        # 失步阈值只写入低16位
+        addressed_u16_field("out_of_step_threshold", ["out_of_step", "no_open_loop_type"],
+                            lambda text, type_index: motor_pulses(float(text), no_open_loop, type_index),
+                            encoder.const(config["out_of_step_threshold"]["address"]), omit_size=4, low_word=True),
+    ]
+    return ActionSpec(action_code, inputs, fields)
+
+
+def transfer1_spec():
+    keys = list(LIMIT_SWITCH_KEYS)
+    keys[4] = "zhuan_ji_1_0_bei"
+    return motor_spec(2, ["10", "10", "3", "3", "10"], 2, 4, limit_switch_keys=keys)
+
+
+def sample2_spec():
+    return motor_spec(3, ["10", "1", "2", "2", "10"], 2, 5)
+
+
+def stove3_spec():
+    return motor_spec(4, ["10", "1", "1", "1", "10"], 2, 1)
+
+
+def stove4_spec():
+    return motor_spec(5, ["1", "1", "1", "5", "10"], 0, 10, run_mode_fallback="open_loop")
+
+
+def stove5_spec():
+    return motor_spec(6, ["1", "1", "1", "1", "10"], 0, 0, run_mode_fallback="open_loop")
+
+
+# ---------------------- 7 电机状态查询 ----------------------
+def motor_status_inquiry_spec():
+    config = get_config(7)
+    select = config["motor_status_select"]
+    inputs = {f"motor_{n}": select[f"motor_{n}"] for n in range(1, 6)}
+    fields = [packed_field("motor_select", [f"motor_{n}" for n in range(5, 0, -1)], head="1100", end="00")]
+    for n in range(1, 6):
+        status = config[f"motor{n}_status"]
+        # 下拉框选项：0=时间条件 1=到位条件
+        options = [encoder.u16(int(status["time_condition"], 16)), encoder.u16(int(status["in_place_condition"], 16))]
+        # 电机1默认到位条件，其他电机默认时间条件
+        inputs[f"status_{n}"] = 1 if n == 1 else 0
+        fields.append(enum_field(f"motor{n}_status", f"status_{n}", options, encoder.const(status["tail"]),
+                                 default=options[1] if n == 1 else options[0], omit=omit_reversed(2)))
+    return ActionSpec(7, inputs, fields)
+
+
+# ---------------------- 8 磁场 ----------------------
+def magnetic_field_spec():
+    config = get_config(8)
+    xi_fen = config["magnetic_xi_fen"]
+    direction = config["magnetic_direction"]
+    velocity = config["magnetic_velocity"]
+    enable = config["magnetic_enable"]
+    inputs = {"xi_fen": 0, "direction": 1, "velocity": "55"}
+    inputs.update({f"magnetic{n}": enable[f"magnetic{n}"] for n in range(1, 5)})
+    direction_options = const_list(direction, ["forward", "backward"])
+    fields = [
+        enum_field("xi_fen", "xi_fen", const_list(xi_fen, ["xi_fen_1", "xi_fen_2", "xi_fen_4", "xi_fen_16"]),
+                   encoder.const(xi_fen["tail"]), omit=omit_reversed(2)),
+        enum_field("direction", "direction", direction_options, encoder.const(direction["tail"]),
+                   default=direction_options[1], omit=omit_reversed(2)),
+        addressed_u32_field("velocity", ["velocity"], lambda text: ((1024 * 1000) / (float(text) * 64) / 2) - 1,
+                            encoder.const(velocity["high_address"]), encoder.const(velocity["low_address"])),
+        # 驱动使能每个磁场占16进制的一位
+        packed_field("magnetic_enable", [f"magnetic{n}" for n in range(4, 0, -1)], base=16,
+                     tail=encoder.const(enable["tail"])),
+    ]
+    return ActionSpec(8, inputs, fields)
+
+
+# ---------------------- 9 电机磁场电流 ----------------------
+def motor_magnetic_field_current_spec():
+    config = get_config(9)
+    select = config["motor_current_select"]
+    inputs = {"current1": select["current1"], "current2": select["current2"], "current3": select["current3"],
+              "magnetic_current": select["magnetic_current"],
+              "val_1": "0.15", "val_2": "0.2", "val_3": "0.25", "val_4": "0.3"}
+    fields = [packed_field("current_select", ["magnetic_current", "current3", "current2", "current1"],
+                           head="110000", end="00")]
+    sections = ["current1_settings", "current2_settings", "current3_settings", "magnetic_current_settings"]
+    for n, section in enumerate(sections, 1):
+        # 磁场电流的采样电阻放大倍数为8，电机电流为16
+        gain = 8 if n == 4 else 16
+        fields.append(addressed_u16_field(f"val_{n}", [f"val_{n}"],
+                                          lambda text, gain=gain: float(text) * (0.15 * gain) * 4096 / 4.096,
+                                          encoder.const(config[section]["tail"])))
+    return ActionSpec(9, inputs, fields)
+
+
+# ---------------------- A 炉丝加热电压 ----------------------
+def furnace_wire_heating_spec():
+    config = get_config("A")
+    select = config["furnace_wire_heating_select"]
+    inputs = {f"voltage{n}": select[f"voltage{n}"] for n in range(1, 5)}
+    inputs.update({"val_1": "55", "val_2": "100", "val_3": "4", "val_4": "10"})
+    fields = [packed_field("voltage_select", [f"voltage{n}" for n in range(4, 0, -1)], head="110000", end="00")]
+    for n in range(1, 5):
+        fields.append(addressed_u16_field(f"val_{n}", [f"val_{n}"],
+                                          lambda text: ((float(text) - 2.8) / (28 - 2.8)) * 4095,
+                                          encoder.const(config[f"voltage{n}_settings"]["tail"])))
+    return ActionSpec("A", inputs, fields)
+
+
+# ---------------------- B PID控温曲线 ----------------------
+PID_CLIMB_KEYS = ["PID_up", "PID_open", "PID_close", "PID_none", "PID_down"]
+# 各PID爬升率使能下拉框的默认选项
+PID_CLIMB_DEFAULTS = [3, 4, 3, 3]
+# PID参数输入框的默认值 [PID1~4][参数1~4]
+PID_VALUE_DEFAULTS = [["7200", "65535", "500", "0"], ["3600", "65535", "3600", "5"],
+                      ["10800", "65535", "800", "0"], ["2000", "65535", "50", "0"]]
+
+
+def pid_temperature_control_spec():
+    config = get_config("B")
+    climb = config["rate_of_climb_enable"]
+    options = [climb[key] for key in PID_CLIMB_KEYS]
+    fallbacks = [options[index] for index in PID_CLIMB_DEFAULTS]
+
+    def encode_climb(*indexes):
+        # 每个PID占16进制的一位，PID4在最高位
+        hex_val = "".join(options[index] if 0 <= index < len(options) else fallbacks[n - 1]
+                          for n, index in zip(range(4, 0, -1), indexes))
+        value = int(hex_val, 16)
+        return encoder.display_hex(value, 2), encoder.u16(value)
+
+    def decode_climb(data):
+        # (PID1~4爬升率使能下拉框索引)，与选项都不符时为None
+        hex_val = encoder.display_hex(encoder.U16.unpack_from(data)[0], 2)[-4:]
+        codes = [option.upper() for option in options]
+        return tuple(codes.index(digit) if digit in codes else None for digit in reversed(hex_val))
+
+    inputs = {f"PID{n}": PID_CLIMB_DEFAULTS[n - 1] for n in range(1, 5)}
+    fields = [Field("climb_enable", [f"PID{n}" for n in range(4, 0, -1)], encode_climb, decode_climb)]
+    for n in range(1, 5):
+        for k in range(1, 5):
+            inputs[f"PID{n}_val_{k}"] = PID_VALUE_DEFAULTS[n - 1][k - 1]
+            fields.append(u16_field(f"PID{n}_val_{k}", f"PID{n}_val_{k}"))
+    return ActionSpec("B", inputs, fields)
+
+
+# ---------------------- C 在线监控状态查询 ----------------------
+def monitoring_u32_field(name, input_name):
+    """
+    监控量地址：输入框中为16进制值，写成32位整数，缩写显示低16位
+    """
+
+    def encode(text):
+        value = int(text, 16)
+        return encoder.display_hex(value, 4)[4:], encoder.u32(value)
+
+    return Field(name, (input_name,), encode)
+
+
+def online_monitoring_status_spec():
+    config = get_config("C")
+    judge_type = const_list(config["judge_type"], ["type1", "type2", "type3", "type4"])
+    inputs = {"val_1": "0", "val_2": "256", "judge_type": 1, "val_3": "1A", "val_4": "2A", "val_5": "3A",
+              "val_6": "4A", "process_identification": 1, "post_process": 2}
+    fields = [
+        Field("val_1", ["val_1"], lambda text: (encoder.hex_text(encoder.u8(int(text))), encoder.u8(int(text)))),
+        # 界面上从1开始计数，写入时减1
+        Field("val_2", ["val_2"],
+              lambda text: (encoder.hex_text(encoder.u8(int(text) - 1)), encoder.u8(int(text) - 1))),
+        enum_field("judge_type", "judge_type", judge_type, default=judge_type[3], omit=omit_hex(0, None)),
+        monitoring_u32_field("val_3", "val_3"),
+        monitoring_u32_field("val_4", "val_4"),
+        monitoring_u32_field("val_5", "val_5"),
+        monitoring_u32_field("val_6", "val_6"),
+        enum_field("process_identification", "process_identification",
+                   const_list(config["process_identification"], ["id1", "id2"]), omit=omit_hex(1, None)),
+        enum_field("post_process", "post_process",
+                   const_list(config["post_process"], ["process1", "process2", "process3"])),
+        # 预留
+        const_field("backup", encoder.u16(0)),
+    ]
+    return ActionSpec("C", inputs, fields)
+
+
+# ---------------------- D 电机关闭设置 ----------------------
+def motor_closing_spec():
+    config = get_config("D")
+    select = config["motor_conf_select"]
+    inputs = {f"motor_{n}": select[f"dian_ji_{n}"] for n in range(1, 6)}
+    inputs.update({f"val_{n}": "25" for n in range(1, 6)})
+    fields = [packed_field("motor_select", [f"motor_{n}" for n in range(5, 0, -1)], head="1100", end="00")]
+    for n in range(1, 6):
+        # 输入框中为16进制的关闭设置值
+        fields.append(hex_field(f"val_{n}", f"val_{n}", encoder.const(config[f"dian_ji_{n}_closing"]["tail"])))
+    return ActionSpec("D", inputs, fields)
+
+
+# ---------------------- E 在线监控表头设置 ----------------------
+def online_monitoring_head_spec():
+    inputs = {"val_1": "00FF", "val_2": "00FF", "val_3": "00", "val_4": "00"}
+    fields = [
+        Field("val_1", ["val_1"], lambda text: (text, encoder.u16(int(text, 16)))),
+        Field("val_2", ["val_2"], lambda text: (text, encoder.u16(int(text, 16)))),
+        Field("val_3", ["val_3"], lambda text: (text, encoder.const(text))),
+        Field("val_4", ["val_4"], lambda text: (text, encoder.const(text))),
+    ]
+    return ActionSpec("E", inputs, fields)
+
+
+# ---------------------- F PID参数设置 ----------------------
+def pid_config_settings_spec():
+    inputs = {f"val_{n}": "0.1" for n in range(1, 13)}
+    fields = [u16_field(f"val_{n}", f"val_{n}", lambda text: float(text) * 1000) for n in range(1, 13)]
+    return ActionSpec("F", inputs, fields)
+
+
+# 动作类别 -> 参数声明
+SPEC_BUILDERS = {
+    0: furnace_switch_spec, 1: hearth_wire_motor_spec, 2: transfer1_spec, 3: sample2_spec, 4: stove3_spec,
+    5: stove4_spec, 6: stove5_spec, 7: motor_status_inquiry_spec, 8: magnetic_field_spec,
+    9: motor_magnetic_field_current_spec, "A": furnace_wire_heating_spec, "B": pid_temperature_control_spec,
+    "C": online_monitoring_status_spec, "D": motor_closing_spec, "E": online_monitoring_head_spec,
+    "F": pid_config_settings_spec,
+}
+
+
+def build_spec(action_code):
+    """
+    按当前的配置文件生成动作类别的参数声明
+    :param action_code: 动作类别（0~9 为整数，A~F 为大写字母）
+    :return: ActionSpec
+    """
+    return SPEC_BUILDERS[action_code]()
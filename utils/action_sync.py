@@ -0,0 +1,126 @@
+import hashlib
+import json
+import os
+import tempfile
+
+# 同步清单格式版本，格式改变后旧清单自动失效（下次同步时全部重新导入）
+SYNC_MANIFEST_VERSION = 1
+
+
+def file_digest(content):
+    """文件内容的哈希值（动作表同步清单、总表构建缓存共用）"""
+    return hashlib.sha256(content).hexdigest()
+
+
+def write_atomic(file_path, text):
+    """
+    先写入同一目录下的临时文件再替换原文件，写入中断时原文件保持不变
+    """
+    replace_files({file_path: text})
+
+
+def replace_files(texts):
+    """
+    原子地替换一组文本文件：先把所有新内容写入各自目录下的临时文件，全部写完后再依次替换
+    写入中断时每个文件要么是原内容，要么是新内容，不会出现写了一半或被清空的文件
+    :param texts: {文件路径: 新内容}
+    """
+    staged = []
+    try:
+        for file_path, text in texts.items():
+            directory = os.path.dirname(os.path.abspath(file_path))
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=directory)
+            staged.append((temp_path, file_path))
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as file:
+                file.write(text)
+                file.flush()
+                os.fsync(file.fileno())
+    except BaseException:
+        for temp_path, _ in staged:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        raise
+    for temp_path, file_path in staged:
+        os.replace(temp_path, file_path)
+
+
+class SyncManifest:
+    """
+    动作表文件夹的同步清单
+
+    记录上一次同步时文件夹中每个AT*.bin文件的 大小、修改时间、内容哈希、其中的 (动作ID, 参数编码)
+    以及该记录是否已导入注册表（参数配置重复或动作ID冲突时未导入）。
+    再次同步时大小和修改时间都没变的文件直接视为未改动；变了的文件重新计算哈希，内容相同的也视为未改动。
+    """
+
+    def __init__(self, manifest_path):
+        """
+        :param manifest_path: 清单文件路径
+        """
+        self.manifest_path = manifest_path
+        # {文件名: {"size", "mtime_ns", "sha256", "action_id", "config", "imported"}}
+        self.entries = {}
+        self.folder = None
+        self.load()
+
+    def load(self):
+        """
+        读取清单，文件不存在、内容损坏或版本不一致时视为空清单
+        """
+        self.entries = {}
+        self.folder = None
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as file:
+                manifest = json.load(file)
+            if manifest["version"] == SYNC_MANIFEST_VERSION:
+                self.entries = manifest["files"]
+                self.folder = manifest.get("folder")
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def save(self, folder, entries):
+        """
+        原子地写入新的清单
+        """
+        self.folder = os.path.abspath(folder)
+        self.entries = entries
+        write_atomic(self.manifest_path, json.dumps(
+            {"version": SYNC_MANIFEST_VERSION, "folder": self.folder, "files": entries}, ensure_ascii=False))
+
+    def diff(self, folder, file_names, read_files):
+        """
+        比对文件夹中的动作表与清单
+        :param file_names: 文件夹中的AT*.bin文件名
+        :param read_files: 批量读取文件的函数 read_files([文件路径]) -> [字节串]
+        :return: (新的清单条目 {文件名: 条目}, 新增或改动的文件 {文件名: 内容}, 删除或改动前的条目 {文件名: 旧条目})
+        """
+        entries = {}
+        candidates = []
+        for file_name in file_names:
+            stat = os.stat(os.path.join(folder, file_name))
+            previous = self.entries.get(file_name)
+            if previous is not None and previous["size"] == stat.st_size and \
+                    previous["mtime_ns"] == stat.st_mtime_ns:
+                entries[file_name] = previous
+            else:
+                candidates.append((file_name, stat))
+
+        changed = {}
+        removed = {}
+        contents = read_files([os.path.join(folder, file_name) for file_name, _ in candidates])
+        for (file_name, stat), content in zip(candidates, contents):
+            previous = self.entries.get(file_name)
+            digest = file_digest(content)
+            if previous is not None and previous["sha256"] == digest:
+                # 只是修改时间变了，内容相同
+                entries[file_name] = dict(previous, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                continue
+            entries[file_name] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+            changed[file_name] = content
+            if previous is not None:
+                removed[file_name] = previous
+        for file_name, previous in self.entries.items():
+            if file_name not in entries:
+                removed[file_name] = previous
+        return entries, changed, removed
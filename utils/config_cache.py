@@ -0,0 +1,163 @@
+import os
+import pickle
+import re
+import tempfile
+import threading
+from types import MappingProxyType
+
+# 快照文件格式版本，格式改变后旧快照自动失效
+SNAPSHOT_VERSION = 1
+# 配置中的字符串都是16进制常量（地址、枚举值、半字节、二进制位串）
+HEX_PATTERN = re.compile(r'[0-9A-Fa-f]+')
+
+
+def freeze(value):
+    """
+    把解析得到的配置转为只读对象：字典 -> MappingProxyType，列表 -> tuple
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def validate_config(conf, file_name):
+    """
+    校验配置文件内容：顶层为键值映射，字符串都是16进制常量，其余叶子节点为数字
+    :raise ValueError: 配置内容不合法
+    """
+    if not isinstance(conf, dict):
+        raise ValueError(f"配置文件{file_name}的内容不是键值映射")
+
+    def check(value, path):
+        if isinstance(value, dict):
+            for key, item in value.items():
+                check(item, path + [str(key)])
+        elif isinstance(value, list):
+            for i, item in enumerate(value):
+                check(item, path + [str(i)])
+        elif isinstance(value, str):
+            if not HEX_PATTERN.fullmatch(value):
+                raise ValueError(f"配置文件{file_name}中 {'.'.join(path)} 不是16进制常量：{value!r}")
+        elif isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"配置文件{file_name}中 {'.'.join(path)} 的值类型不支持：{value!r}")
+
+    check(conf, [])
+
+
+class ConfigCache:
+    """
+    进程级的参数配置缓存
+
+    config文件夹中的每个.yaml文件只解析一次，校验后转为只读对象缓存，之后构造配置界面时直接返回缓存对象。
+    每次读取都会比对文件的(修改时间, 大小)，文件被改动后自动重新解析。
+
+    指定快照文件时，解析结果连同文件的(修改时间, 大小)一起用pickle保存到快照中；冷启动时先读快照，
+    文件未改动就直接使用快照中的内容，不需要导入和调用PyYAML。
+    """
+
+    def __init__(self, config_dir, snapshot_path=None):
+        """
+        :param config_dir: 存放.yaml配置文件的目录
+        :param snapshot_path: 预编译快照文件路径，为None时不使用快照
+        """
+        self.config_dir = config_dir
+        self.snapshot_path = snapshot_path
+        self._lock = threading.RLock()
+        # {文件名: ((修改时间, 大小), 只读配置)}
+        self._cache = {}
+        # 快照中的内容 {文件名: ((修改时间, 大小), 解析结果)}，第一次读取时加载
+        self._snapshot = None
+
+    def _file_stamp(self, file_name):
+        stat = os.stat(os.path.join(self.config_dir, file_name))
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load_snapshot(self):
+        """
+        读取快照文件，文件不存在、版本不一致或内容损坏时视为空快照
+        """
+        if self._snapshot is not None:
+            return self._snapshot
+        self._snapshot = {}
+        if self.snapshot_path is None:
+            return self._snapshot
+        try:
+            with open(self.snapshot_path, 'rb') as snapshot_file:
+                snapshot = pickle.load(snapshot_file)
+            if snapshot["version"] == SNAPSHOT_VERSION:
+                self._snapshot = snapshot["entries"]
+        except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError):
+            pass
+        return self._snapshot
+
+    def _parse(self, file_name):
+        """
+        用PyYAML解析配置文件并校验
+        """
+        import yaml
+
+        with open(os.path.join(self.config_dir, file_name), 'r', encoding='utf-8') as file:
+            conf = yaml.safe_load(file)
+        validate_config(conf, file_name)
+        return conf
+
+    def get(self, file_name):
+        """
+        获取配置文件的只读内容
+        :param file_name: config文件夹中的文件名
+        :return: 只读的配置（MappingProxyType）
+        """
+        with self._lock:
+            stamp = self._file_stamp(file_name)
+            cached = self._cache.get(file_name)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+            snapshot = self._load_snapshot()
+            entry = snapshot.get(file_name)
+            if entry is not None and entry[0] == stamp:
+                conf = entry[1]
+            else:
+                conf = self._parse(file_name)
+                snapshot[file_name] = (stamp, conf)
+                if self.snapshot_path is not None:
+                    self.save_snapshot()
+            frozen = freeze(conf)
+            self._cache[file_name] = (stamp, frozen)
+            return frozen
+
+    def preload(self, file_names):
+        """
+        预先解析一组配置文件（例如生成快照前读取全部配置）
+        """
+        for file_name in file_names:
+            self.get(file_name)
+
+    def save_snapshot(self, snapshot_path=None):
+        """
+        把已解析的配置写入快照文件（先写临时文件再替换，写入中断不会损坏旧快照）
+        :param snapshot_path: 快照文件路径，默认使用构造时指定的路径
+        """
+        snapshot_path = snapshot_path or self.snapshot_path
+        if snapshot_path is None:
+            raise ValueError("没有指定快照文件路径")
+        with self._lock:
+            snapshot = {"version": SNAPSHOT_VERSION, "entries": dict(self._load_snapshot())}
+            snapshot_dir = os.path.dirname(os.path.abspath(snapshot_path))
+            os.makedirs(snapshot_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=snapshot_dir)
+            with os.fdopen(fd, 'wb') as snapshot_file:
+                pickle.dump(snapshot, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, snapshot_path)
+
+    def invalidate(self, file_name=None):
+        """
+        清除缓存，下次读取时重新检查文件
+        :param file_name: 文件名，为None时清除全部
+        """
+        with self._lock:
+            if file_name is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(file_name, None)
@@ -0,0 +1,179 @@
+"""
+长时间曲线的降采样金字塔
+
+跨越数天的流程按秒采样时每条曲线有几十万到上百万个点，直接绘制会让界面卡住。这里为每条曲线预先计算
+min/max 金字塔：第k层的每个块是原始曲线中连续 4**k 个点的最小值和最大值。显示时按视口的像素宽度选择
+每个像素至少包含一个块的那一层，再把块合并到每个像素列，得到该列的最小值和最大值，曲线的尖峰不会因为
+降采样而丢失。
+
+流程项修改后只有部分时间窗口内的曲线改变，set_values 只重新计算该窗口覆盖的块；各层按视口取出的包络
+也会缓存，窗口内的曲线改变时只丢弃与之重叠的缓存。
+
+    pyramid = CurvePyramid(values)
+    positions, lows, highs = pyramid.envelope(first, stop, width=800)
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+# 相邻两层之间每个块包含的点数
+PYRAMID_FACTOR = 4
+# 最上层的块数不超过该值
+PYRAMID_TOP_BLOCKS = 64
+# 缓存的视口包络个数
+ENVELOPE_CACHE_SIZE = 64
+
+
+def block_reduce(lows, highs, factor=PYRAMID_FACTOR):
+    """
+    每factor个点合并为一个块（不足factor个点的最后一块按实际点数计算）
+    :return: (每块的最小值, 每块的最大值)，nan不参与比较，全是nan的块为nan
+    """
+    count = len(lows)
+    starts = np.arange(0, count, factor)
+    if not count:
+        return lows[:0].copy(), highs[:0].copy()
+    return np.fmin.reduceat(lows, starts), np.fmax.reduceat(highs, starts)
+
+
+class CurvePyramid:
+    """
+    一条等间隔采样曲线的 min/max 金字塔
+    """
+
+    def __init__(self, values=(), factor=PYRAMID_FACTOR):
+        self.factor = factor
+        self.values = np.asarray(values, dtype=np.float64).copy()
+        # 第0层为原始曲线，mins[k]、maxs[k] 为第k层
+        self.mins = []
+        self.maxs = []
+        # 视口包络缓存 {(层, 起始块, 结束块, 像素宽度): (点位置, 最小值, 最大值)}
+        self._envelopes = OrderedDict()
+        self._rebuild_levels(0, len(self.values))
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def levels(self):
+        return len(self.mins)
+
+    def _rebuild_levels(self, first, stop):
+        """
+        重新计算原始曲线 [first, stop) 覆盖的各层的块
+        """
+        factor = self.factor
+        count = len(self.values)
+        # 长度改变时各层从哪个块开始重算
+        starts = None
+        if not self.mins or len(self.mins[0]) != count:
+            # 长度改变（或首次计算）：各层重新分配，只保留下一层仍然有效的旧块，其余的重算
+            # （新增的层、旧层比 first 对应的块少时缺少的块都要计算）
+            old_mins, old_maxs = self.mins, self.maxs
+            self.mins, self.maxs = [self.values], [self.values]
+            starts = [first]
+            size = count
+            level = 1
+            while size > PYRAMID_TOP_BLOCKS:
+                size = -(-size // factor)
+                mins = np.empty(size, dtype=np.float64)
+                maxs = np.empty(size, dtype=np.float64)
+                keep = min(size, len(old_mins[level]) if level < len(old_mins) else 0, starts[-1] // factor)
+                if keep:
+                    mins[:keep] = old_mins[level][:keep]
+                    maxs[:keep] = old_maxs[level][:keep]
+                starts.append(keep)
+                self.mins.append(mins)
+                self.maxs.append(maxs)
+                level += 1
+            stop = count
+        self.mins[0] = self.maxs[0] = self.values
+        for level in range(1, len(self.mins)):
+            first = starts[level] if starts else first // factor
+            stop = -(-stop // factor)
+            below_mins, below_maxs = self.mins[level - 1], self.maxs[level - 1]
+            lows, highs = block_reduce(below_mins[first * factor:stop * factor],
+                                       below_maxs[first * factor:stop * factor], factor)
+            self.mins[level][first:stop] = lows
+            self.maxs[level][first:stop] = highs
+
+    def set_values(self, values, first=0):
+        """
+        用values替换从first开始的曲线（之后的部分被截断），只重新计算实际改变的时间窗口
+        :return: 改变的点范围 (起始, 结束)，没有改变时返回None
+        """
+        values = np.asarray(values, dtype=np.float64)
+        count = first + len(values)
+        old = self.values
+        overlap = max(0, min(len(old), count) - first)
+        # 与原曲线逐点比较（nan与nan视为相同），缩小到实际改变的范围
+        changed = np.flatnonzero(~((old[first:first + overlap] == values[:overlap]) |
+                                   (np.isnan(old[first:first + overlap]) & np.isnan(values[:overlap]))))
+        if count != len(old):
+            window = (first + (int(changed[0]) if len(changed) else overlap), count)
+        elif len(changed):
+            window = (first + int(changed[0]), first + int(changed[-1]) + 1)
+        else:
+            return None
+        if count != len(old):
+            self.values = np.concatenate([old[:first], values])
+        else:
+            self.values = old.copy()
+            self.values[window[0]:window[1]] = values[window[0] - first:window[1] - first]
+        self._rebuild_levels(*window)
+        self._drop_envelopes(*window)
+        return window
+
+    def _drop_envelopes(self, first, stop):
+        """
+        丢弃与原始曲线 [first, stop) 重叠的包络缓存
+        """
+        for key in list(self._envelopes):
+            level, first_block, stop_block, _ = key
+            scale = self.factor ** level
+            if first_block * scale < stop and first < stop_block * scale:
+                del self._envelopes[key]
+
+    def level_for(self, count, width):
+        """
+        count个点显示在width个像素中时使用的层：每个像素至少包含一个块的最高层
+        """
+        level = 0
+        while level + 1 < self.levels and count // self.factor ** (level + 1) >= width:
+            level += 1
+        return level
+
+    def envelope(self, first, stop, width):
+        """
+        原始曲线 [first, stop) 显示在width个像素中时每列的最小值和最大值
+        :return: (各列起点在原始曲线中的位置, 最小值, 最大值)；点数不超过宽度时直接返回原始的点（最小值与最大值相同）
+        """
+        first = max(0, int(first))
+        stop = min(len(self.values), int(stop))
+        if stop <= first or width <= 0:
+            empty = np.empty(0, dtype=np.float64)
+            return empty, empty, empty
+        level = self.level_for(stop - first, width)
+        scale = self.factor ** level
+        first_block = first // scale
+        stop_block = -(-stop // scale)
+        key = (level, first_block, stop_block, int(width))
+        cached = self._envelopes.get(key)
+        if cached is not None:
+            self._envelopes.move_to_end(key)
+            return cached
+        lows = self.mins[level][first_block:stop_block]
+        highs = self.maxs[level][first_block:stop_block]
+        blocks = stop_block - first_block
+        if blocks <= width:
+            positions = np.arange(first_block, stop_block, dtype=np.float64) * scale
+            result = (positions, lows, highs)
+        else:
+            # 块再按像素列合并
+            starts = np.unique((np.arange(width) * blocks) // width)
+            positions = (first_block + starts).astype(np.float64) * scale
+            result = (positions, np.fmin.reduceat(lows, starts), np.fmax.reduceat(highs, starts))
+        self._envelopes[key] = result
+        if len(self._envelopes) > ENVELOPE_CACHE_SIZE:
+            self._envelopes.popitem(last=False)
+        return result
@@ -1,5 +1,11 @@
+import mmap
 import os
-import yaml
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.action_registry import ActionRegistry
+from utils.action_sync import SyncManifest, file_digest
+from utils.config_cache import ConfigCache
+from utils.sqlite_registry import SqliteActionRegistry
 
 data_dict = {0: "0炉子开关.txt", 1: "1炉丝电机.txt", 2: "2转机1.txt", 3: "3样提机2.txt", 4: "4炉上机3.txt",
              5: "5炉中机4.txt", 6: "6炉下机5.txt", 7: "7电机状态查询.txt", 8: "8磁场.txt", 9: "9电机磁场电流.txt",
@@ -11,8 +17,108 @@ conf_dict = {0: "FurnaceSwitch.yaml", 1: "HearthWireMotor.yaml", 2: "Transfer1.y
              "C": "OnlineMonitoringStatus.yaml", "D": "MotorClosing.yaml"}
 
 base_path = os.path.abspath(os.path.dirname(os.path.abspath(__file__)) + os.path.sep + "..")
-data_file_path = base_path + "\\data\\"
-config_file_path = base_path + "\\config\\"
+data_file_path = os.path.join(base_path, "data", "")
+config_file_path = os.path.join(base_path, "config", "")
+# 导入动作表时读取文件的线程数
+IMPORT_WORKERS = 8
+# 不小于该大小的动作表文件用mmap读取
+MMAP_THRESHOLD = 1 << 20
+# 动作表文件夹的同步清单（data文件夹中的文件名；使用SQLite时为数据库路径加后缀）
+SYNC_MANIFEST_FILE = "at_sync_manifest.json"
+SYNC_MANIFEST_SUFFIX = ".at_sync.json"
+
+
+def pid_temp_control_key(config_hex):
+    """
+    PID控温曲线的部分匹配键：参数编码前四个字符为"0000"时只比对前四个字符
+    :param config_hex: 参数配置的16进制编码
+    :return: 部分匹配键，按完整编码比对时返回None
+    """
+    if config_hex[:4] == "0000":
+        return config_hex[:4]
+    return None
+
+
+# 各动作类别的部分匹配键函数
+PARTIAL_KEYS = {"B": pid_temp_control_key}
+
+
+def _init_registry(registry):
+    """
+    注册各动作类别的部分匹配键
+    """
+    for action_code, key_func in PARTIAL_KEYS.items():
+        registry.register_partial_key(action_code, key_func)
+    return registry
+
+
+def action_match_key(config_hex, action_code):
+    """
+    比对参数配置时使用的键：有部分匹配键时为键值，否则为完整编码（两个参数编码的键相同时视为同一个动作）
+    """
+    config_hex = str(config_hex).upper()
+    key_func = PARTIAL_KEYS.get(action_code)
+    partial_key = key_func(config_hex) if key_func is not None else None
+    return config_hex if partial_key is None else partial_key
+
+
+# 进程级的动作ID注册表（参数编码 -> 动作ID 的哈希索引）
+# 设置环境变量 ACTION_REGISTRY_DB 时使用SQLite数据库代替data/*.txt文件
+if os.environ.get("ACTION_REGISTRY_DB"):
+    action_registry = _init_registry(SqliteActionRegistry(os.environ["ACTION_REGISTRY_DB"]))
+else:
+    action_registry = _init_registry(ActionRegistry(data_file_path, data_dict))
+
+
+# 进程级的参数配置缓存，每个.yaml文件只解析一次，文件修改后自动重新解析
+# 设置环境变量 CONFIG_SNAPSHOT 时把解析结果保存到该快照文件，冷启动时不再调用PyYAML
+config_cache = ConfigCache(config_file_path, os.environ.get("CONFIG_SNAPSHOT"))
+
+
+def use_config_snapshot(snapshot_path):
+    """
+    切换为使用预编译快照的参数配置缓存
+    :param snapshot_path: 快照文件路径
+    """
+    global config_cache
+    config_cache = ConfigCache(config_file_path, snapshot_path)
+    return config_cache
+
+
+def build_config_snapshot(snapshot_path):
+    """
+    解析config文件夹中全部动作类别的配置文件并生成快照
+    :param snapshot_path: 快照文件路径
+    """
+    cache = ConfigCache(config_file_path, snapshot_path)
+    cache.preload(conf_dict.values())
+    cache.save_snapshot()
+    print(f"参数配置快照已生成：{snapshot_path}")
+    return cache
+
+
+def use_sqlite_registry(db_path):
+    """
+    切换到SQLite数据库保存动作记录（get_action_id、store_data、clear_data、load_action_bin_to_data都会使用该数据库）
+    :param db_path: SQLite数据库文件路径
+    """
+    global action_registry
+    action_registry = _init_registry(SqliteActionRegistry(db_path))
+    return action_registry
+
+
+def migrate_data_to_sqlite(db_path):
+    """
+    一次性把data文件夹下的.txt动作记录迁移到SQLite数据库
+    :param db_path: SQLite数据库文件路径
+    :return: {动作类别: (新写入数, 重复的参数配置数, 冲突的动作ID数)}
+    """
+    registry = _init_registry(SqliteActionRegistry(db_path))
+    report = registry.import_txt(data_file_path, data_dict)
+    registry.close()
+    for action_code, (new_count, duplicate_count, collision_count) in report.items():
+        print(f"{data_dict[action_code]}：写入{new_count}条，重复配置{duplicate_count}条，ID冲突{collision_count}条")
+    return report
 
 
 # 存储数据到文件
@@ -24,11 +130,9 @@ def store_data(hex_data, action_code):
     :param action_code: 动作类别的标识（总共16个动作）
     :return:
     """
-    # 写入文件路径
-    file_path = os.path.join(data_file_path, data_dict[action_code])
-    # 打开文件并写入数据
-    with open(file_path, 'a') as file:
-        file.write(hex_data + '\n')
+    action_id, config = hex_data.split(" ")
+    # 写入.txt文件（或SQLite数据库）并同步更新动作ID索引
+    return action_registry.store(action_id, config, action_code)
 
 
 # 获取动作配置参数信息
@@ -36,12 +140,9 @@ def get_config(action_code):
     """
     获取动作配置参数信息（不同设置对应的16进制值）
     :param action_code: 动作类别编码
-    :return: action_code动作类别对应的参数配置信息
+    :return: action_code动作类别对应的参数配置信息（只读，多次调用返回同一个缓存对象）
     """
-    conf_path = os.path.join(config_file_path, conf_dict[action_code])
-    with open(conf_path, 'r', encoding='utf-8') as file:
-        conf = yaml.safe_load(file)
-    return conf
+    return config_cache.get(conf_dict[action_code])
 
 
 def get_action_id(config_hex, action_code):
@@ -51,88 +152,44 @@ def get_action_id(config_hex, action_code):
     :param action_code:
     :return: 返回一个Tuple，(动作id, 是否是新动作：是 = 1，否 = 0)
     """
-    config_hex = str(config_hex).upper()
-    final_id = str(action_code) + "000"
-    # 读取文件
-    # data_file = QFile(":/data/" + data_dict[action_code])
-    # data_file.open(QIODevice.ReadOnly | QIODevice.Text)
-    # all_data = str(data_file.readAll(), encoding='utf-8')
-    with open(data_file_path + data_dict[action_code], 'r', encoding='utf-8') as data_file:
-        all_data = data_file.read()
-
-    # 为空直接返回
-    if len(all_data) == 0:
-        return final_id, 1
-
-    list_all = all_data.split("\n")
     print(">>>>>>开始比对配置生成动作ID>>>>>")
-    for line in list_all:
-        # 读取到空行跳过
-        if line == '':
-            continue
-        action_id, config = tuple(line.split(" "))
-        final_id = action_id
-        # 找到相同的参数配置则返回相同的ID
-        print(f"比对:\n>>{config}\n>>{config_hex}")
-        if config_hex == config:
-            data_file.close()
-            print(f">>>>>>比对结束，生成的动作ID为：{final_id}，是否为新ID：否>>>>>")
-            return final_id, 0
-    data_file.close()
-    # 没找到相同的ID, 在最后一个ID号的基础上+1
-    final_id = format(int(final_id, 16) + 1, '04X')
-    print(f">>>>>>比对结束，生成的动作ID为：{final_id}，是否为新ID：是>>>>>")
-    return final_id, 1
+    final_id, is_new_action = action_registry.get_action_id(config_hex, action_code)
+    print(f">>>>>>比对结束，生成的动作ID为：{final_id}，是否为新ID：{'是' if is_new_action else '否'}>>>>>")
+    return final_id, is_new_action
+
+
+def lookup_action_id(config_hex, action_code):
+    """
+    查询参数配置对应的已有动作ID（不分配新ID）
+    :return: 已存在的动作ID，不存在返回None
+    """
+    return action_registry.lookup(config_hex, action_code)
+
+
+def next_action_id(action_code):
+    """
+    动作类别下一个可用的新动作ID（不写入注册表）
+    """
+    return action_registry.next_action_id(action_code)
+
+
+def get_action_config(action_id):
+    """
+    查询动作ID在注册表中保存的参数配置
+    :return: 参数配置的16进制编码，不存在返回None
+    """
+    return action_registry.lookup_config(action_id, action_code_of(action_id))
 
 
 def get_action_id_pid_temp_control(config_hex, action_code):
     """
     PID温度控制动作ID生成规则: 根据配置参数编码查询动作ID，若存在则返回已存在的ID，不存在递增生成一个新ID返回
+    特殊情况：config_hex 的前四个字符为 "0000" 时只对比前四个字符（见 pid_temp_control_key）
     :param config_hex: 配置参数编码
     :param action_code: 动作代码
     :return: 返回一个Tuple，(动作id, 是否是新动作：是 = 1，否 = 0)
     """
-    config_hex = str(config_hex).upper()  # 配置参数编码转换为大写
-    final_id = str(action_code) + "000"  # 初始动作ID
-
-    # 读取文件内容
-    try:
-        with open(data_file_path + data_dict[action_code], 'r', encoding='utf-8') as data_file:
-            all_data = data_file.read()
-    except FileNotFoundError:
-        print(f"文件未找到：{data_file_path + data_dict[action_code]}")
-        return final_id, 1
-
-    # 如果文件为空，直接返回初始ID
-    if len(all_data) == 0:
-        return final_id, 1
-
-    list_all = all_data.strip().split("\n")
-    print(">>>>>>开始比对配置生成动作ID>>>>>")
-
-    for line in list_all:
-        if line.strip() == '':  # 跳过空行
-            continue
-        action_id, config = tuple(line.split(" "))
-        final_id = action_id  # 获取文件中的最后一个ID
-
-        # 特殊情况：config_hex 的前四个字符为 "0000"，只对比前四个字符
-        if config_hex[:4] == "0000":
-            print(f"特殊情况比对前四个字符:\n>>{config[:4]}\n>>{config_hex[:4]}")
-            if config[:4] == config_hex[:4]:
-                print(f">>>>>>比对结束，生成的动作ID为：{final_id}，是否为新ID：否>>>>>")
-                return final_id, 0
-        else:
-            # 正常情况下比对整个 config_hex
-            print(f"比对:\n>>{config}\n>>{config_hex}")
-            if config_hex == config:
-                print(f">>>>>>比对结束，生成的动作ID为：{final_id}，是否为新ID：否>>>>>")
-                return final_id, 0
-
-    # 没有找到匹配的配置参数，生成新的动作ID
-    final_id = format(int(final_id, 16) + 1, '04X')
-    print(f">>>>>>比对结束，生成的动作ID为：{final_id}，是否为新ID：是>>>>>")
-    return final_id, 1
+    return get_action_id(config_hex, action_code)
 
 
 def hex_string_to_binary_file(hex_string, output_file_path):
@@ -145,42 +202,269 @@ def hex_string_to_binary_file(hex_string, output_file_path):
     print("++++++写入完成：", hex_string)
 
 
+def action_bin_name(config_hex):
+    """
+    配置界面发送的16进制编码（动作ID低字节在前 + 参数编码）对应的动作表文件名
+    """
+    return 'AT_' + config_hex[2:4].upper() + config_hex[0:2].upper() + '.bin'
+
+
+def write_action_bins(config_hex_list, output_folder, digests):
+    """
+    生成新动作的动作表.bin文件：只写入新增或内容改变的文件，重复调用不会重写已生成的文件
+    :param config_hex_list: 配置界面发送的16进制编码，按生成顺序（重复的只保留第一个）
+    :param output_folder: 动作表文件夹
+    :param digests: 已生成文件的内容哈希 {文件路径: sha256}，调用后更新；不在其中的文件与磁盘上的内容比对
+    :return: (写入的文件路径, 未改动的文件路径)，均按生成顺序
+    """
+    os.makedirs(output_folder, exist_ok=True)
+    written = []
+    unchanged = []
+    for config_hex in dict.fromkeys(config_hex.upper() for config_hex in config_hex_list):
+        output_file_path = os.path.join(output_folder, action_bin_name(config_hex))
+        content = bytes.fromhex(config_hex)
+        digest = file_digest(content)
+        if output_file_path not in digests and os.path.exists(output_file_path):
+            digests[output_file_path] = file_digest(read_bin_file(output_file_path))
+        if digests.get(output_file_path) == digest:
+            unchanged.append(output_file_path)
+            continue
+        with open(output_file_path, 'wb') as binary_file:
+            binary_file.write(content)
+        digests[output_file_path] = digest
+        written.append(output_file_path)
+    return written, unchanged
+
+
+def store_new_actions(config_hex_list):
+    """
+    把新动作批量保存到注册表：按动作类别分组，每个类别只写入一次
+    :param config_hex_list: 配置界面发送的16进制编码（动作ID低字节在前 + 参数编码）
+    :return: {16进制编码（大写）: (动作ID, 写入结果)}，按添加顺序（重复的只保留第一个），结果见 ActionRegistry.allocate_many
+    """
+    config_hex_list = list(dict.fromkeys(config_hex.upper() for config_hex in config_hex_list))
+    groups = {}
+    for config_hex in config_hex_list:
+        action_id = config_hex[2:4] + config_hex[0:2]
+        groups.setdefault(action_code_of(action_id), []).append(config_hex)
+    results = {}
+    # 参数配置的查询和写入在一次操作中完成，界面生成ID之后被其他操作员占用时返回 "collision"
+    for action_code, group in groups.items():
+        records = [(config_hex[2:4] + config_hex[0:2], config_hex[4:]) for config_hex in group]
+        results.update(zip(group, action_registry.allocate_many(records, action_code)))
+    return {config_hex: results[config_hex] for config_hex in config_hex_list}
+
+
+def read_bin_file(file_path):
+    """
+    读取一个.bin文件的全部内容（较大的文件用mmap映射后读取）
+    """
+    with open(file_path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return data[:]
+        return file.read()
+
+
+def parse_action_bin(content):
+    """
+    解析动作表.bin文件的内容
+    :return: (动作ID, 参数编码)，内容不足一个动作ID时返回None
+    """
+    if len(content) < 2:
+        return None
+    hex_representation = content.hex().upper()
+    # 动作ID（前两个字节，低字节在前） + 参数编码
+    return hex_representation[2:4] + hex_representation[0:2], hex_representation[4:]
+
+
+def read_action_bin(file_path):
+    """
+    读取一个动作表.bin文件
+    :return: (动作ID, 参数编码)，文件内容不足一个动作ID时返回None
+    """
+    return parse_action_bin(read_bin_file(file_path))
+
+
+def list_action_bins(action_bin_file_folder):
+    """
+    文件夹中的动作表文件名（AT*.bin），按文件名排序
+    """
+    return sorted(file for file in os.listdir(action_bin_file_folder)
+                  if file.endswith('.bin') and file.startswith("AT"))
+
+
+def action_code_of(action_id):
+    """
+    动作ID的第一位即动作类别（0~9为整数，A~F为字符串）
+    """
+    action_code = action_id[0:1]
+    return int(action_code) if action_code.isdigit() else action_code
+
+
+def import_action_bins(action_bin_file_folder, workers=IMPORT_WORKERS):
+    """
+    批量导入文件夹中的动作表（AT*.bin）：多线程读取文件，按动作类别分组后每个类别只写入一次
+    参数配置已存在的动作和动作ID被其他参数配置占用的动作不会写入，而是记录在返回的报告中
+    :param action_bin_file_folder: 动作表文件夹
+    :param workers: 读取文件的线程数
+    :return: {动作类别: (新写入数, 重复的动作 [(文件名, 动作ID)], 冲突的动作 [(文件名, 动作ID)])}
+    """
+    bin_files = list_action_bins(action_bin_file_folder)
+    paths = [os.path.join(action_bin_file_folder, file) for file in bin_files]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        contents = list(executor.map(read_action_bin, paths))
+
+    # 按动作类别分组 {动作类别: [(文件名, 动作ID, 参数编码)]}
+    groups = {}
+    for bin_file, content in zip(bin_files, contents):
+        if content is None:
+            print(f"动作表文件内容不完整，已跳过：{bin_file}")
+            continue
+        action_id, config_code = content
+        groups.setdefault(action_code_of(action_id), []).append((bin_file, action_id, config_code))
+
+    report = {}
+    for action_code, records in groups.items():
+        results = action_registry.store_many([(action_id, config) for _, action_id, config in records], action_code)
+        duplicates = [(bin_file, action_id) for (bin_file, action_id, _), result in zip(records, results)
+                      if result == "duplicate"]
+        collisions = [(bin_file, action_id) for (bin_file, action_id, _), result in zip(records, results)
+                      if result == "collision"]
+        report[action_code] = (results.count("new"), duplicates, collisions)
+    return report
+
+
 def load_action_bin_to_data(action_bin_file_folder):
-    # 获取文件夹中所有文件的列表
-    file_list = os.listdir(action_bin_file_folder)
-    # 筛选出文件名带有 '.bin' 的文件
-    bin_files = [file for file in file_list if file.endswith('.bin') and file.startswith("AT")]
-    # 遍历所有文件
-    for bin_file in bin_files:
-        bin_file_path = action_bin_file_folder + bin_file
-        with open(bin_file_path, "rb") as file:
-            # 读取文件内容
-            binary_data = file.read()
-            # 将二进制数据转换为十六进制字符串
-            hex_representation = binary_data.hex().upper()
-            # 动作ID
-            action_id = hex_representation[2:4] + hex_representation[0:2]
-            # 参数编码
-            config_code = hex_representation[4:]
-            # 打印输出
-            print(f"{action_id} -> {config_code}")
-            # 保存到.txt文件
-            action_code = action_id[0:1]
-            if action_code.isdigit():
-                action_code = int(action_code)
-            store_data(action_id + " " + config_code, action_code)
+    """
+    导入文件夹中的动作表到data文件夹（或SQLite数据库），并打印每个类别的导入结果
+    :return: import_action_bins 的报告
+    """
+    report = import_action_bins(action_bin_file_folder)
+    for action_code, (new_count, duplicates, collisions) in report.items():
+        print(f"{data_dict[action_code]}：写入{new_count}条，重复配置{len(duplicates)}条，ID冲突{len(collisions)}条")
+        for bin_file, action_id in duplicates:
+            print(f"  重复的参数配置：{bin_file}（{action_id}）")
+        for bin_file, action_id in collisions:
+            print(f"  动作ID已被其他参数配置占用：{bin_file}（{action_id}）")
+    return report
+
+
+def sync_manifest_path():
+    """
+    当前注册表的同步清单路径（data文件夹或SQLite数据库旁边）
+    """
+    db_path = getattr(action_registry, "db_path", None)
+    if db_path:
+        return db_path + SYNC_MANIFEST_SUFFIX
+    return os.path.join(data_file_path, SYNC_MANIFEST_FILE)
+
+
+def sync_action_bins(action_bin_file_folder, workers=IMPORT_WORKERS):
+    """
+    增量同步文件夹中的动作表（AT*.bin）到注册表，代替 清空 + 全部重新导入
+
+    用同步清单比对文件夹：大小和修改时间都没变的文件不读取；新增和改动的文件多线程读取，
+    内容哈希没变的视为未改动；已删除和改动前的文件导入的记录从注册表中删除。
+    注册表先原子地更新，清单最后写入，中途出错时下次同步会重新比对这些文件。
+    上次因参数配置重复或ID冲突没有导入的文件每次都会重试（占用它的文件可能已被删除）。
+    没有同步清单（首次同步或清空后）或动作表文件夹改变时全量重建：注册表整体替换为文件夹中的动作，
+    不保留注册表中原有的记录，避免与文件夹中的动作互相冲突。
+    :param action_bin_file_folder: 动作表文件夹
+    :param workers: 读取文件的线程数
+    :return: {"added": 新增文件数, "changed": 改动文件数, "removed": 删除文件数, "unchanged": 未改动文件数,
+              "new": 写入的记录数, "deleted": 删除的记录数, "rebuilt": 是否全量重建,
+              "duplicates": [(文件名, 动作ID)], "collisions": [(文件名, 动作ID)]}
+    """
+    manifest = SyncManifest(sync_manifest_path())
+    rebuild = manifest.folder != os.path.abspath(action_bin_file_folder)
+    if rebuild:
+        if manifest.folder is not None:
+            print(f"动作表文件夹改变（上次同步：{manifest.folder}），按新文件夹全量重建")
+        # 清单作废，文件夹中的每个文件都重新读取
+        manifest.entries = {}
+    bin_files = list_action_bins(action_bin_file_folder)
+
+    def read_files(paths):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(read_bin_file, paths))
+
+    entries, changed, removed = manifest.diff(action_bin_file_folder, bin_files, read_files)
+
+    # 删除已删除和改动前的文件导入的记录 {动作类别: [(动作ID, 参数编码)]}
+    removed_records = {}
+    for entry in removed.values():
+        if entry.get("imported"):
+            removed_records.setdefault(action_code_of(entry["action_id"]), []).append(
+                (entry["action_id"], entry["config"]))
+
+    # 新增和改动的文件，以及上次没有导入的文件 {动作类别: [文件名]}
+    pending = {}
+    for bin_file, content in changed.items():
+        parsed = parse_action_bin(content)
+        if parsed is None:
+            print(f"动作表文件内容不完整，已跳过：{bin_file}")
+            continue
+        entries[bin_file].update(action_id=parsed[0], config=parsed[1], imported=False)
+    for bin_file, entry in entries.items():
+        if "action_id" in entry and not entry.get("imported"):
+            pending.setdefault(action_code_of(entry["action_id"]), []).append(bin_file)
+    added_records = {action_code: [(entries[bin_file]["action_id"], entries[bin_file]["config"])
+                                   for bin_file in files]
+                     for action_code, files in pending.items()}
+
+    if rebuild:
+        results = action_registry.replace_all(added_records)
+    else:
+        results = action_registry.apply_changes(removed_records, added_records)
+
+    report = {"added": len([file for file in changed if file not in removed]),
+              "changed": len([file for file in changed if file in removed]),
+              "removed": len([file for file in removed if file not in entries]),
+              "unchanged": len(entries) - len(changed),
+              "new": 0, "deleted": sum(len(records) for records in removed_records.values()), "rebuilt": rebuild,
+              "duplicates": [], "collisions": []}
+    for action_code, files in pending.items():
+        for bin_file, result in zip(files, results[action_code]):
+            entry = entries[bin_file]
+            entry["imported"] = result in ("new", "exists")
+            if result == "new":
+                report["new"] += 1
+            elif result == "duplicate":
+                report["duplicates"].append((bin_file, entry["action_id"]))
+            elif result == "collision":
+                report["collisions"].append((bin_file, entry["action_id"]))
+    manifest.save(action_bin_file_folder, entries)
+    return report
+
+
+def sync_action_bin_to_data(action_bin_file_folder):
+    """
+    增量同步文件夹中的动作表到data文件夹（或SQLite数据库），并打印同步结果
+    :return: sync_action_bins 的报告
+    """
+    report = sync_action_bins(action_bin_file_folder)
+    if report["rebuilt"]:
+        print("没有同步记录或动作表文件夹已改变，已按文件夹全量重建")
+    print(f"新增文件{report['added']}个，改动{report['changed']}个，删除{report['removed']}个，"
+          f"未改动{report['unchanged']}个；写入{report['new']}条，删除{report['deleted']}条")
+    for bin_file, action_id in report["duplicates"]:
+        print(f"  重复的参数配置：{bin_file}（{action_id}）")
+    for bin_file, action_id in report["collisions"]:
+        print(f"  动作ID已被其他参数配置占用：{bin_file}（{action_id}）")
+    return report
 
 
 def clear_data():
     """
-    清空data文件夹下的数据
+    清空data文件夹下的数据（同时删除同步清单，下次同步时全部重新导入）
     :return:
     """
-    file_list = os.listdir(data_file_path)
-    for file_name in file_list:
-        bin_file_path = data_file_path + file_name
-        with open(bin_file_path, "w") as file:
-            file.write("")
+    action_registry.clear()
+    manifest_path = sync_manifest_path()
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
 
 
 if __name__ == "__main__":
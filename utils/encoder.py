@@ -0,0 +1,126 @@
+import struct
+
+# 预编译的小端整数格式
+U8 = struct.Struct('<B')
+U16 = struct.Struct('<H')
+U32 = struct.Struct('<I')
+# 48位整数按 低32位 + 高16位 打包
+U48 = struct.Struct('<IH')
+# 大端16位整数（动态表中的动作时间沿用原格式，不反转）
+U16_BE = struct.Struct('>H')
+# 带地址的32位参数：高16位 + 高位地址 + 低16位 + 低位地址（电机速度、脉冲输出阈值等）
+ADDRESSED_U32 = struct.Struct('<H2sH2s')
+# 带地址的16位参数：16位值 + 地址
+ADDRESSED_U16 = struct.Struct('<H2s')
+# 动态表的一条记录：动作开始时间(u32) + 动作ID(u16) + 动作时间(大端u16)
+DYNAMIC_RECORD = struct.Struct('<IH')
+# 总表表头中的偏移、长度（u32，重复三次）
+TRIPLE_U32 = struct.Struct('<III')
+# 总表表头中各表偏移的基础值
+TABLE_OFFSET_BASE = 0x82000000
+
+
+def u8(value):
+    return U8.pack(int(value))
+
+
+def u16(value):
+    return U16.pack(int(value))
+
+
+def u32(value):
+    return U32.pack(int(value))
+
+
+def u48(value):
+    value = int(value)
+    if not 0 <= value < 1 << 48:
+        raise struct.error(f"u48 超出范围：{value}")
+    return U48.pack(value & 0xFFFFFFFF, value >> 32)
+
+
+def const(hex_text):
+    """
+    配置文件中的16进制常量（地址、枚举值等已按写入顺序书写）转为字节串
+    """
+    return bytes.fromhex(hex_text)
+
+
+def addressed_u32(value, high_address, low_address):
+    """
+    带地址的32位参数：高16位(小端) + 高位地址 + 低16位(小端) + 低位地址
+    :param high_address: 高位地址字节串
+    :param low_address: 低位地址字节串
+    """
+    value = int(value)
+    if not 0 <= value <= 0xFFFFFFFF:
+        raise struct.error(f"u32 超出范围：{value}")
+    return ADDRESSED_U32.pack(value >> 16, high_address, value & 0xFFFF, low_address)
+
+
+def addressed_u16(value, address):
+    """
+    带地址的16位参数：16位值(小端) + 地址
+    """
+    return ADDRESSED_U16.pack(int(value), address)
+
+
+def bcd_u16(number):
+    """
+    四位十进制数按BCD码写成16位小端整数（动态表配置序号）
+    """
+    return U16.pack(int(f"{number:04d}", 16))
+
+
+def action_id_u16(action_id):
+    """
+    动作ID（4位16进制字符串）写成16位小端整数
+    """
+    return U16.pack(int(action_id, 16))
+
+
+def dynamic_record(start_time, action_id, action_time):
+    """
+    动态表的一条记录
+    :param start_time: 动作开始时间
+    :param action_id: 动作ID（4位16进制字符串）
+    :param action_time: 动作时间
+    """
+    return DYNAMIC_RECORD.pack(start_time, int(action_id, 16)) + U16_BE.pack(action_time)
+
+
+def table_offset(length):
+    """
+    总表表头中的表偏移：基础值 + 长度，重复三次
+    """
+    value = TABLE_OFFSET_BASE + length
+    return TRIPLE_U32.pack(value, value, value)
+
+
+def table_length(length):
+    """
+    总表表头中的总表长度，重复三次
+    """
+    return TRIPLE_U32.pack(length, length, length)
+
+
+def hex_text(data):
+    """
+    字节串转为界面显示、注册表保存用的大写16进制字符串
+    """
+    return data.hex().upper()
+
+
+def reversed_hex(data):
+    """
+    小端字节串按大端显示的16进制缩写
+    """
+    return data[::-1].hex().upper()
+
+
+def display_hex(value, size):
+    """
+    参数值按大端显示的16进制缩写
+    :param size: 字节数
+    """
+    return format(int(value), f'0{size * 2}X')
@@ -0,0 +1,309 @@
+import struct
+
+from utils import encoder
+
+# 输入值无法编码时字段编码函数抛出的异常（非数字、超出范围、选项序号无效等）
+ENCODE_ERRORS = (ValueError, TypeError, IndexError, OverflowError, struct.error)
+
+
+class Field:
+    """
+    参数记录中的一个字段，编码后占用记录中连续的一段字节
+    """
+
+    def __init__(self, name, inputs, encode, decode=None):
+        """
+        :param name: 字段名
+        :param inputs: 字段依赖的输入名（按encode的参数顺序）
+        :param encode: 编码函数 encode(*输入值) -> (16进制缩写, 字节串)
+        :param decode: 解码函数 decode(字段字节串) -> 寄存器值（选项序号、整数），为None时只能显示16进制
+        """
+        self.name = name
+        self.inputs = tuple(inputs)
+        self.encode = encode
+        self.decode = decode
+
+
+class ActionSpec:
+    """
+    一类动作的参数声明
+
+    inputs是界面上每个输入框、下拉框、复选框对应的输入及其默认值，fields是按写入顺序排列的字段。
+    编译时建立 输入 -> 依赖它的字段 的索引，输入改变时只需要重新计算这几个字段。
+    配置界面和命令行工具使用同一份声明，生成的参数编码完全一致。
+    """
+
+    def __init__(self, action_code, inputs, fields):
+        """
+        :param action_code: 动作类别
+        :param inputs: {输入名: 默认值}
+        :param fields: 按写入顺序排列的字段
+        """
+        self.action_code = action_code
+        self.defaults = dict(inputs)
+        self.fields = tuple(fields)
+        self.field_index = {}
+        # {输入名: (依赖该输入的字段序号, ...)}，按字段顺序排列
+        self.dependents = {name: () for name in self.defaults}
+        for i, field in enumerate(self.fields):
+            if field.name in self.field_index:
+                raise ValueError(f"字段名重复：{field.name}")
+            self.field_index[field.name] = i
+            for name in field.inputs:
+                if name not in self.defaults:
+                    raise ValueError(f"字段{field.name}依赖的输入{name}没有声明")
+                self.dependents[name] += (i,)
+
+    def new_record(self, values=None):
+        """
+        按默认值（以及values中给出的输入值）创建参数记录
+        :param values: {输入名: 值}
+        """
+        return ActionRecord(self, values)
+
+    def encode(self, values=None):
+        """
+        一次性得到参数编码的字节串（命令行工具使用）
+        :param values: {输入名: 值}，没有给出的输入使用默认值
+        """
+        return self.new_record(values).to_bytes()
+
+    def layout(self):
+        """
+        按默认值编码时每个字段在记录中的位置（读取动作表时按此切分字段）
+        :return: ([(字段, 起始位置, 结束位置)], 记录长度)
+        """
+        record = self.new_record()
+        return [(field, *record.field_span(field.name)) for field in self.fields], len(record.to_bytes())
+
+
+class ActionRecord:
+    """
+    编码后的参数记录
+
+    记录缓存每个字段的字节串和16进制缩写，输入改变时只重新计算依赖它的字段，
+    并且只替换记录中该字段对应的那一段字节，其他字段不需要重新编码。
+    """
+
+    def __init__(self, spec, values=None):
+        self.spec = spec
+        self.values = dict(spec.defaults)
+        if values:
+            for name, value in values.items():
+                self._check_input(name)
+                self.values[name] = value
+        count = len(spec.fields)
+        self._buffer = bytearray()
+        # 每个字段在记录中的起始位置、长度和16进制缩写
+        self._offsets = [0] * count
+        self._widths = [0] * count
+        self._omits = [""] * count
+        for i in range(count):
+            self._offsets[i] = len(self._buffer)
+            self._omits[i], data = self._encode(i)
+            self._buffer += data
+            self._widths[i] = len(data)
+
+    def _check_input(self, name):
+        if name not in self.spec.defaults:
+            raise KeyError(f"动作类别{self.spec.action_code}没有输入：{name}")
+
+    def _encode(self, i):
+        field = self.spec.fields[i]
+        return field.encode(*[self.values[name] for name in field.inputs])
+
+    def assign(self, name, value):
+        """
+        只修改输入值，不重新编码
+        :return: 依赖该输入的字段名（按字段顺序）
+        """
+        self._check_input(name)
+        self.values[name] = value
+        return [self.spec.fields[i].name for i in self.spec.dependents[name]]
+
+    def refresh(self, field_name):
+        """
+        重新计算一个字段并替换记录中对应的字节段
+        编码失败时抛出异常（ENCODE_ERRORS），记录中保留该字段原来的字节
+        """
+        i = self.spec.field_index[field_name]
+        omit, data = self._encode(i)
+        start = self._offsets[i]
+        width = self._widths[i]
+        self._buffer[start:start + width] = data
+        if len(data) != width:
+            # 可变长度的字段（例如直接输入的16进制值）长度改变，后面字段的起始位置随之移动
+            shift = len(data) - width
+            for j in range(i + 1, len(self._offsets)):
+                self._offsets[j] += shift
+            self._widths[i] = len(data)
+        self._omits[i] = omit
+
+    def set(self, name, value):
+        """
+        修改输入值并重新计算依赖它的字段
+        :return: 发生改变的字段名
+        """
+        changed = self.assign(name, value)
+        for field_name in changed:
+            self.refresh(field_name)
+        return changed
+
+    def update(self, values):
+        """
+        批量修改输入值
+        """
+        for name, value in values.items():
+            self.set(name, value)
+
+    def field_span(self, field_name):
+        """
+        字段在记录中的位置
+        :return: (起始位置, 结束位置)
+        """
+        i = self.spec.field_index[field_name]
+        return self._offsets[i], self._offsets[i] + self._widths[i]
+
+    def field_bytes(self, field_name):
+        start, stop = self.field_span(field_name)
+        return bytes(self._buffer[start:stop])
+
+    def field_hex(self, field_name):
+        return encoder.hex_text(self.field_bytes(field_name))
+
+    def field_omit(self, field_name):
+        return self._omits[self.spec.field_index[field_name]]
+
+    def to_bytes(self):
+        return bytes(self._buffer)
+
+    def hex(self):
+        return encoder.hex_text(self._buffer)
+
+
+# ---------------------- 常用字段 ----------------------
+def decode_u16(data):
+    """
+    字段开头的16位值（小端）
+    """
+    return encoder.U16.unpack_from(data)[0]
+
+
+def omit_hex(start, stop):
+    """
+    16进制缩写：字段中[start, stop)字节按写入顺序显示
+    """
+    return lambda data: encoder.hex_text(data[start:stop])
+
+
+def omit_reversed(stop):
+    """
+    16进制缩写：字段前stop个字节按大端显示
+    """
+    return lambda data: encoder.reversed_hex(data[0:stop])
+
+
+def enum_field(name, input_name, options, tail=b"", default=None, omit=None):
+    """
+    下拉框选项字段：选项对应的16进制常量 + 尾部
+    :param options: 下拉框每个选项对应的字节串
+    :param tail: 尾部（地址）
+    :param default: 索引超出选项范围时使用的字节串，默认为第一个选项
+    :param omit: 16进制缩写函数 omit(字段字节串)，默认显示第一个字节
+    """
+    options = tuple(options)
+    default = options[0] if default is None else default
+    omit = omit or omit_hex(0, 1)
+
+    def encode(index):
+        data = (options[index] if 0 <= index < len(options) else default) + tail
+        return omit(data), data
+
+    def decode(data):
+        # 选项序号，没有匹配的选项时为None
+        for index, option in enumerate(options):
+            if bytes(data[:len(option)]) == option:
+                return index
+        return None
+
+    return Field(name, (input_name,), encode, decode)
+
+
+def packed_field(name, input_names, head="", end="", base=2, tail=b""):
+    """
+    片选/使能字段：多个复选框的位串（或16进制位）按 head + 各输入 + end 拼接后写成16位整数 + 尾部
+    :param input_names: 按从高位到低位排列的输入名
+    :param head: 拼接在最高位前面的固定位
+    :param end: 拼接在最低位后面的固定位
+    :param base: 位串的进制（2或16）
+    """
+
+    def encode(*parts):
+        value = int(head + "".join(parts) + end, base)
+        return encoder.display_hex(value, 2), encoder.u16(value) + tail
+
+    return Field(name, input_names, encode, decode_u16)
+
+
+def addressed_u32_field(name, input_names, convert, high_address, low_address):
+    """
+    带地址的32位参数字段：convert(*输入值)得到参数值，写成 高16位 + 高位地址 + 低16位 + 低位地址
+    """
+
+    def encode(*values):
+        data = convert(*values)
+        return encoder.display_hex(data, 4), encoder.addressed_u32(data, high_address, low_address)
+
+    def decode(data):
+        high, _, low, _ = encoder.ADDRESSED_U32.unpack_from(data)
+        return (high << 16) | low
+
+    return Field(name, input_names, encode, decode)
+
+
+def addressed_u16_field(name, input_names, convert, address, omit_size=2, low_word=False):
+    """
+    带地址的16位参数字段：convert(*输入值)得到参数值，写成 16位值 + 地址
+    :param omit_size: 16进制缩写的字节数
+    :param low_word: 只写入参数值的低16位
+    """
+
+    def encode(*values):
+        data = convert(*values)
+        value = int(data) & 0xFFFF if low_word else data
+        return encoder.display_hex(data, omit_size), encoder.addressed_u16(value, address)
+
+    return Field(name, input_names, encode, decode_u16)
+
+
+def u16_field(name, input_name, convert=float):
+    """
+    16位参数字段：convert(输入值)得到参数值
+    """
+
+    def encode(text):
+        data = convert(text)
+        return encoder.display_hex(data, 2), encoder.u16(data)
+
+    return Field(name, (input_name,), encode, decode_u16)
+
+
+def hex_field(name, input_name, tail=b"", omit=None):
+    """
+    直接输入16进制值的字段：输入值 + 尾部
+    :param omit: 16进制缩写函数 omit(字段字节串)，默认显示第一个字节
+    """
+    omit = omit or omit_hex(0, 1)
+
+    def encode(text):
+        data = encoder.const(text) + tail
+        return omit(data), data
+
+    return Field(name, (input_name,), encode)
+
+
+def const_field(name, data):
+    """
+    固定值字段（预留位等）
+    """
+    return Field(name, (), lambda: (encoder.hex_text(data), data))
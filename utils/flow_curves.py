@@ -0,0 +1,146 @@
+"""
+流程曲线数据
+
+用电机运动曲线仿真（motor_simulation）和PID控温曲线预测（pid_simulation）计算一个流程的全部曲线：五个电机的
+位置、四路PID的设定值和温度，每条曲线保存为一个降采样金字塔（CurvePyramid）。两个仿真都是按事件整理出的
+分段模型（匀速运动段、一阶惯性响应段），在任意时刻都可以直接求值。
+
+修改流程项后调用 update：先找出新旧流程中不同的流程项，其中最早的动作开始时刻之前的曲线不会改变，只对之后的
+时间轴重新求值，金字塔再比较新旧曲线，只重算实际改变的窗口。
+
+    curves = FlowCurves()
+    curves.update(rows, actions)
+    positions, lows, highs = curves.pyramids["转机1"].envelope(first, stop, width)
+"""
+import math
+from collections import Counter
+
+import numpy as np
+
+from utils import motor_simulation, pid_simulation
+from utils.curve_pyramid import CurvePyramid
+
+# 曲线分组：(组名, 单位, [曲线名])
+CURVE_GROUPS = (
+    ("电机位置", "mm", list(motor_simulation.MOTOR_NAMES)),
+    ("温度", "℃", [f"PID{n}设定值" for n in range(1, pid_simulation.PID_CHANNELS + 1)] +
+     [f"PID{n}温度" for n in range(1, pid_simulation.PID_CHANNELS + 1)]),
+)
+# 时间轴的结束时刻按该粒度(s)向上取整，流程末尾小的改动不会改变曲线长度
+TIME_AXIS_CHUNK = 3600
+
+
+def changed_since(old_rows, new_rows, old_actions, new_actions):
+    """
+    新旧流程中不同的流程项里最早的动作开始时刻
+    :param old_rows: 旧流程项 [(动作开始时间, 动作ID, 动作时间)]
+    :param new_rows: 新流程项
+    :param old_actions: 旧动作参数 {动作ID: 参数编码}
+    :param new_actions: 新动作参数
+    :return: 最早的动作开始时刻，没有不同时返回None
+    """
+    old_rows = [(row[0], row[1].upper(), row[2]) for row in old_rows]
+    new_rows = [(row[0], row[1].upper(), row[2]) for row in new_rows]
+    changed = list((Counter(old_rows) - Counter(new_rows)).elements())
+    changed += list((Counter(new_rows) - Counter(old_rows)).elements())
+    # 参数编码改变的动作ID，引用它的流程项也算作改变
+    changed_ids = {action_id.upper() for action_id in set(old_actions) | set(new_actions)
+                   if old_actions.get(action_id) != new_actions.get(action_id)}
+    changed += [row for row in new_rows + old_rows if row[1] in changed_ids]
+    if not changed:
+        return None
+    return min(row[0] for row in changed)
+
+
+class FlowCurves:
+    """
+    一个流程的全部曲线及其降采样金字塔
+    """
+
+    def __init__(self, dt=1.0, model=None, limits=None, initial_positions=None):
+        """
+        :param dt: 采样间隔(s)
+        :param model: PID预测用的加热对象参数（pid_simulation.ThermalModel）
+        :param limits: 各电机的行程限位 [(下限, 上限)]
+        :param initial_positions: 各电机的初始位置
+        """
+        self.dt = dt
+        self.model = model
+        self.limits = limits
+        self.initial_positions = initial_positions
+        self.rows = []
+        self.actions = {}
+        self.end_time = 0.0
+        self.pyramids = {name: CurvePyramid() for _, _, names in CURVE_GROUPS for name in names}
+
+    def __len__(self):
+        """曲线的采样点数"""
+        return len(next(iter(self.pyramids.values())))
+
+    def sample_index(self, time):
+        """时刻time所在的采样点序号"""
+        return int(math.floor(time / self.dt + 1e-9))
+
+    def update(self, rows, actions):
+        """
+        按新的流程项重新计算曲线
+        :param rows: 动态表流程项 [(动作开始时间(s), 动作ID, 动作时间)]
+        :param actions: 动作参数 {动作ID: 参数编码字节串（不含动作ID）}
+        :return: 曲线改变的时间窗口 (起始时刻, 结束时刻)，没有改变时返回None
+        """
+        rows = list(rows)
+        actions = dict(actions)
+        since = changed_since(self.rows, rows, self.actions, actions)
+        if since is None and len(self):
+            return None
+        self.rows, self.actions = rows, actions
+
+        states, motor_end = motor_simulation.build_states(rows, actions, self.limits, self.initial_positions)
+        channels, settled_time = pid_simulation.build_channels(rows, actions, self.model)
+        end_time = max(TIME_AXIS_CHUNK, math.ceil(max(motor_end, settled_time) / TIME_AXIS_CHUNK) * TIME_AXIS_CHUNK)
+        # 时间轴变短时截断的部分也要重新计算
+        first = self.sample_index(min(since or 0, end_time, self.end_time))
+        self.end_time = end_time
+        times = motor_simulation.time_axis(end_time, self.dt)[first:]
+
+        curves = [state.evaluate(times) for state in states]
+        setpoints, temperatures = [], []
+        for channel in channels:
+            channel.advance(end_time + self.dt)
+            setpoint, temperature = channel.evaluate(times)
+            setpoints.append(setpoint)
+            temperatures.append(temperature)
+        curves += setpoints + temperatures
+
+        windows = []
+        for pyramid, values in zip(self.pyramids.values(), curves):
+            window = pyramid.set_values(values, first)
+            if window is not None:
+                windows.append(window)
+        if not windows:
+            return None
+        return (min(window[0] for window in windows) * self.dt,
+                max(window[1] for window in windows) * self.dt)
+
+    def envelope(self, name, start_time, end_time, width):
+        """
+        曲线name在 [start_time, end_time] 内显示为width个像素时每列的最小值和最大值
+        :return: (各列的起始时刻, 最小值, 最大值)
+        """
+        positions, lows, highs = self.pyramids[name].envelope(self.sample_index(start_time),
+                                                              self.sample_index(end_time) + 1, width)
+        return positions * self.dt, lows, highs
+
+    def value_range(self, names, start_time, end_time, width):
+        """
+        一组曲线在 [start_time, end_time] 内的最小值和最大值（都没有值时返回None）
+        """
+        lows, highs = [], []
+        for name in names:
+            _, low, high = self.envelope(name, start_time, end_time, width)
+            lows.append(np.fmin.reduce(low) if len(low) else np.nan)
+            highs.append(np.fmax.reduce(high) if len(high) else np.nan)
+        low, high = np.fmin.reduce(lows), np.fmax.reduce(highs)
+        if np.isnan(low) or np.isnan(high):
+            return None
+        return float(low), float(high)
@@ -0,0 +1,378 @@
+"""
+总表的离线执行（流程试运行）
+
+按地面注入实验流程序号的方式从总表中选出一个动态表，在事件队列驱动的时钟上依次执行其中的流程项：每个流程项
+在动作开始时刻按动作ID的类别分派给对应的设备模型，设备模型更新自己的状态，并可以预约之后的事件（电机到位、
+升温到目标值等）。时钟直接跳到下一个事件，不按实际时间等待，数天的流程几秒内就能执行完。
+
+执行过程输出两份记录，供检查流程是否符合预期：
+- 事件记录：[{"time": 时刻, "event": 事件, "action_id": 动作ID, "device": 设备, "detail": 说明}]
+- 设备状态轨迹：[(时刻, 设备, {状态名: 值})]，每次设备状态改变时记录，也可以按固定间隔采样
+
+设备模型可以替换或增加：继承 DeviceModel，在 action_codes 中声明处理的动作类别，再传给 FlowExecutor。
+
+    with TotalTableImage(path) as image:
+        executor = FlowExecutor.from_image(image, dynamic_id=1, trace_interval=60)
+        executor.run()
+    for event in executor.events:
+        print(event)
+"""
+import heapq
+import itertools
+
+from utils import action_specs
+from utils import motor_simulation, pid_simulation
+from utils.data_utils import action_code_of
+from utils.total_table_reader import decode_config
+
+# 事件类型（同一时刻按此顺序处理：先结束上一个动作和设备事件，再开始新动作，最后采样）
+EVENT_ACTION_END, EVENT_DEVICE, EVENT_ACTION_START, EVENT_SAMPLE = range(4)
+EVENT_NAMES = {EVENT_ACTION_END: "动作结束", EVENT_DEVICE: "设备事件", EVENT_ACTION_START: "动作开始",
+               EVENT_SAMPLE: "采样"}
+# 炉丝加热电压寄存器与电压(V)的换算范围（action_specs.furnace_wire_heating_spec）
+HEATER_VOLTAGE_RANGE = (2.8, 28.0)
+HEATER_REGISTER_MAX = 4095
+# 其他动作类别的设备名
+GENERIC_DEVICE_NAMES = {7: "电机状态查询", 8: "磁场", 9: "电机磁场电流", "C": "在线监控状态", "D": "电机关闭",
+                        "E": "在线监控表头"}
+
+
+class DeviceModel:
+    """
+    设备模型基类
+
+    action_codes 为该设备处理的动作类别；execute 执行一个动作，on_event 处理该设备自己预约的事件，
+    state 返回某一时刻的设备状态（写入状态轨迹）。
+    """
+    name = ""
+    action_codes = ()
+
+    def execute(self, executor, time, action_id, action_code, values):
+        """
+        执行动作
+        :param executor: FlowExecutor（用 executor.schedule 预约之后的事件）
+        :param values: 按参数声明解码的寄存器值 {字段名: 值}
+        :return: 写入事件记录的说明
+        """
+        raise NotImplementedError
+
+    def on_event(self, executor, time, detail):
+        """
+        处理预约的事件
+        :return: 写入事件记录的说明，事件已失效（例如运动被新动作打断）时返回None
+        """
+        return None
+
+    def state(self, time):
+        """
+        time时刻的设备状态
+        """
+        return {}
+
+
+class MotorDevice(DeviceModel):
+    """
+    炉丝电机（类别1）设置速度、细分、方向和使能，转机1、样提机2、炉上机3、炉中机4、炉下机5（类别2~6）运动
+    （运动模型见 utils/motor_simulation.py）
+    """
+    name = "电机"
+    action_codes = (1,) + motor_simulation.MOTOR_ACTION_CODES
+
+    def __init__(self, limits=None, initial_positions=None):
+        count = len(motor_simulation.MOTOR_NAMES)
+        self.limits = list(limits) if limits is not None else [(float("-inf"), float("inf"))] * count
+        initial_positions = initial_positions if initial_positions is not None else [0.0] * count
+        self.states = [motor_simulation.MotorState(initial_positions[n]) for n in range(count)]
+
+    def execute(self, executor, time, action_id, action_code, values):
+        if action_code == 1:
+            motor_simulation.apply_hearth_motor(self.states, values)
+            return " ".join(f"{name}:{state.velocity * state.direction:.4g}mm/s{'' if state.enabled else '(禁用)'}"
+                            for name, state in zip(motor_simulation.MOTOR_NAMES, self.states))
+        n = motor_simulation.MOTOR_ACTION_CODES.index(action_code)
+        state = self.states[n]
+        segments = len(state.starts)
+        state.move(time, motor_simulation.motor_distance(action_code, values), self.limits[n])
+        name = motor_simulation.MOTOR_NAMES[n]
+        if len(state.starts) == segments:
+            return f"{name}不运动（位置{state.position_at(time):.4g}mm）"
+        stop = state.stops[-1]
+        if stop == float("inf"):
+            return f"{name}从{state.origins[-1]:.4g}mm持续运动"
+        executor.schedule(stop, EVENT_DEVICE, self, (n, segments))
+        return f"{name}从{state.origins[-1]:.4g}mm运动到{state.position_at(stop):.4g}mm"
+
+    def on_event(self, executor, time, detail):
+        n, segment = detail
+        state = self.states[n]
+        if segment >= len(state.stops) or state.stops[segment] != time:
+            # 运动已被同一电机的新动作打断
+            return None
+        return f"{motor_simulation.MOTOR_NAMES[n]}到位（{state.position_at(time):.4g}mm）"
+
+    def state(self, time):
+        values = {}
+        for name, state in zip(motor_simulation.MOTOR_NAMES, self.states):
+            values[name] = round(float(state.position_at(time)), 6)
+            values[f"{name}运动中"] = bool(state.starts) and state.starts[-1] <= time < state.stops[-1]
+        return values
+
+
+class FurnaceSwitchDevice(DeviceModel):
+    """
+    炉子开关（类别0）：LED、CCD、阀门、加速度、样品盒，只有片选中选中的开关量才会改变
+    """
+    name = "炉子开关"
+    action_codes = (0,)
+    # 开关量片选中各开关量的位置（从低位起，每个开关量占两位，最低两位固定为0）
+    SWITCH_SHIFTS = {"led_enable": 2, "ccd_enable": 4, "valve_enable": 6, "acc": 8, "sample_box": 10}
+
+    def __init__(self):
+        self.switches = {key: None for key in action_specs.FURNACE_SWITCH_KEYS}
+
+    def execute(self, executor, time, action_id, action_code, values):
+        selection = values.get("switch_plate_selection", 0xFFFF)
+        changed = []
+        for key, options in action_specs.FURNACE_SWITCH_KEYS.items():
+            index = values.get(key)
+            if index is None or not (selection >> self.SWITCH_SHIFTS[key]) & 0b11:
+                continue
+            self.switches[key] = options[index]
+            changed.append(f"{key}={options[index]}")
+        return " ".join(changed) or "没有选中的开关量"
+
+    def state(self, time):
+        return dict(self.switches)
+
+
+class HeaterDevice(DeviceModel):
+    """
+    炉丝加热（类别A）：四路加热电压，只有选中的电压才会改变
+    """
+    name = "炉丝加热"
+    action_codes = ("A",)
+
+    def __init__(self):
+        self.voltages = [None] * 4
+
+    def execute(self, executor, time, action_id, action_code, values):
+        selection = values.get("voltage_select", 0xFFFF)
+        low, high = HEATER_VOLTAGE_RANGE
+        changed = []
+        for n in range(4):
+            register = values.get(f"val_{n + 1}")
+            if register is None or not (selection >> (2 + 2 * n)) & 0b11:
+                continue
+            self.voltages[n] = round(register / HEATER_REGISTER_MAX * (high - low) + low, 3)
+            changed.append(f"电压{n + 1}={self.voltages[n]}V")
+        return " ".join(changed) or "没有选中的电压"
+
+    def state(self, time):
+        return {f"电压{n + 1}": voltage for n, voltage in enumerate(self.voltages)}
+
+
+class PidDevice(DeviceModel):
+    """
+    PID控温曲线（类别B）和PID参数设置（类别F）（温度模型见 utils/pid_simulation.py）
+    """
+    name = "PID"
+    action_codes = ("B", "F")
+
+    def __init__(self, model=None):
+        self.model = model or pid_simulation.ThermalModel()
+        self.channels = [pid_simulation.ChannelState(self.model) for _ in range(pid_simulation.PID_CHANNELS)]
+
+    def execute(self, executor, time, action_id, action_code, values):
+        changed = []
+        if action_code == "B":
+            climbs = values.get("climb_enable", (pid_simulation.CLIMB_NONE,) * pid_simulation.PID_CHANNELS)
+            for n, channel in enumerate(self.channels):
+                if climbs[n] is None or climbs[n] == pid_simulation.CLIMB_NONE:
+                    continue
+                channel.set_program(time, climbs[n], pid_simulation.pid_values(values, n + 1))
+                if channel.slope != 0 and channel.ramp_end > time:
+                    executor.schedule(channel.ramp_end, EVENT_DEVICE, self, (n, channel.ramp_end))
+                changed.append(f"PID{n + 1}:{action_specs.PID_CLIMB_KEYS[climbs[n]]}")
+        else:
+            for n, channel in enumerate(self.channels):
+                p_value = values.get(f"val_{3 * n + 1}")
+                if p_value is not None:
+                    channel.set_p_gain(time, p_value / pid_simulation.PID_PARAM_SCALE)
+                    changed.append(f"PID{n + 1}:P={channel.p_gain:g}")
+        return " ".join(changed) or "没有改变"
+
+    def on_event(self, executor, time, detail):
+        n, ramp_end = detail
+        channel = self.channels[n]
+        if channel.ramp_end != ramp_end or channel.slope == 0:
+            # 斜坡已被新的控温曲线替换
+            return None
+        channel.advance(time)
+        return f"PID{n + 1}设定值到达{channel.level:.4g}℃（温度{channel.temperature:.4g}℃）"
+
+    def state(self, time):
+        values = {}
+        for n, channel in enumerate(self.channels):
+            channel.advance(time)
+            values[f"PID{n + 1}设定值"] = round(channel.level, 3) if channel.closed_loop else None
+            values[f"PID{n + 1}温度"] = round(channel.temperature, 3)
+        return values
+
+
+class GenericDevice(DeviceModel):
+    """
+    没有专门模型的动作类别：记录最近一次动作解码出的寄存器值
+    """
+
+    def __init__(self, action_code):
+        self.action_codes = (action_code,)
+        self.name = GENERIC_DEVICE_NAMES.get(action_code, f"类别{action_code}")
+        self.values = {}
+
+    def execute(self, executor, time, action_id, action_code, values):
+        self.values = dict(values)
+        return f"{len(values)}个参数"
+
+    def state(self, time):
+        return dict(self.values)
+
+
+def default_devices():
+    """
+    默认的设备模型：电机、炉子开关、炉丝加热、PID，以及其他类别的通用模型
+    """
+    return ([MotorDevice(), FurnaceSwitchDevice(), HeaterDevice(), PidDevice()] +
+            [GenericDevice(action_code) for action_code in GENERIC_DEVICE_NAMES])
+
+
+def select_dynamic_table(image, dynamic_id, copy=0):
+    """
+    按实验流程序号选出动态表（与地面注入时一样按动态表配置序号查找）
+    :return: DynamicEntry
+    """
+    for table in image.iter_dynamic_tables(copy):
+        if table.dynamic_id == dynamic_id:
+            return table
+    raise ValueError(f"总表中没有实验流程序号为{dynamic_id}的动态表")
+
+
+class FlowExecutor:
+    """
+    在事件队列上执行一个动态表
+    """
+
+    def __init__(self, rows, actions, devices=None, trace_interval=None, end_time=None):
+        """
+        :param rows: 动态表流程项 [(动作开始时间(s), 动作ID, 动作时间)]
+        :param actions: 动作参数 {动作ID: 参数编码字节串（不含动作ID）}
+        :param devices: 设备模型列表，默认为 default_devices()
+        :param trace_interval: 设备状态的采样间隔(s)，None表示只在状态改变时记录
+        :param end_time: 执行到该时刻为止，默认执行完最后一个事件
+        """
+        self.rows = list(rows)
+        self.actions = actions
+        self.devices = {}
+        for device in (default_devices() if devices is None else devices):
+            self.register(device)
+        self.trace_interval = trace_interval
+        self.end_time = end_time
+        self.time = 0
+        self.events = []
+        self.trace = []
+        # 执行过动作的设备（按间隔采样时只记录这些设备）
+        self.active = {}
+        self._queue = []
+        self._sequence = itertools.count()
+        self._decoded = {}
+
+    @classmethod
+    def from_image(cls, image, dynamic_id, copy=0, **kwargs):
+        """
+        从总表（TotalTableImage）中按实验流程序号选出动态表，动作参数取自总表中的动作表
+        """
+        table = select_dynamic_table(image, dynamic_id, copy)
+        actions = {action.action_id: bytes(action.data) for action in image.iter_actions(copy)}
+        return cls(table.rows(), actions, **kwargs)
+
+    def register(self, device):
+        """
+        注册设备模型（同一动作类别后注册的模型替换先注册的）
+        """
+        for action_code in device.action_codes:
+            self.devices[action_code] = device
+
+    def schedule(self, time, kind, device=None, detail=None):
+        """
+        预约事件
+        """
+        heapq.heappush(self._queue, (time, kind, next(self._sequence), device, detail))
+
+    def log(self, kind, action_id=None, device=None, detail=""):
+        self.events.append({"time": self.time, "event": EVENT_NAMES[kind], "action_id": action_id,
+                            "device": device.name if device is not None else None, "detail": detail})
+
+    def record(self, device):
+        self.trace.append((self.time, device.name, device.state(self.time)))
+
+    def run(self):
+        """
+        执行到最后一个事件（或end_time）
+        :return: self
+        """
+        for row in sorted(self.rows, key=lambda row: row[0]):
+            if row[1].upper() != "FFFF":
+                self.schedule(row[0], EVENT_ACTION_START, None, row)
+        if self.trace_interval:
+            self.schedule(0, EVENT_SAMPLE)
+        else:
+            # 初始状态
+            for device in self.unique_devices():
+                self.record(device)
+
+        while self._queue:
+            time, kind, _, device, detail = heapq.heappop(self._queue)
+            if self.end_time is not None and time > self.end_time:
+                break
+            self.time = time
+            if kind == EVENT_ACTION_START:
+                self.start_action(*detail)
+            elif kind == EVENT_ACTION_END:
+                self.log(kind, detail, self.devices.get(action_code_of(detail)))
+            elif kind == EVENT_DEVICE:
+                message = device.on_event(self, time, detail)
+                if message is not None:
+                    self.log(kind, None, device, message)
+                    self.record(device)
+            elif kind == EVENT_SAMPLE:
+                for sampled in self.active.values():
+                    self.record(sampled)
+                # 还有其他事件（或没有到end_time）时继续采样
+                if (any(item[1] != EVENT_SAMPLE for item in self._queue) or
+                        (self.end_time is not None and time + self.trace_interval <= self.end_time)):
+                    self.schedule(time + self.trace_interval, EVENT_SAMPLE)
+        return self
+
+    def unique_devices(self):
+        return list({id(device): device for device in self.devices.values()}.values())
+
+    def start_action(self, start_time, action_id, duration):
+        """
+        动作开始：解码参数并分派给设备模型
+        """
+        action_id = action_id.upper()
+        if duration:
+            self.schedule(start_time + duration, EVENT_ACTION_END, None, action_id)
+        action_code = action_code_of(action_id)
+        device = self.devices.get(action_code)
+        if device is None:
+            self.log(EVENT_ACTION_START, action_id, None, f"没有处理类别{action_code}的设备模型")
+            return
+        if action_id not in self.actions:
+            self.log(EVENT_ACTION_START, action_id, device, "动作表中没有该动作ID")
+            return
+        if action_id not in self._decoded:
+            self._decoded[action_id] = decode_config(action_code, bytes(self.actions[action_id]))
+        message = device.execute(self, start_time, action_id, action_code, self._decoded[action_id])
+        self.active[id(device)] = device
+        self.log(EVENT_ACTION_START, action_id, device, message)
+        self.record(device)
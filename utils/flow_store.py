@@ -0,0 +1,170 @@
+from array import array
+
+from utils import encoder
+
+
+class FlowStore:
+    """
+    实验流程表的数据（按列存放）
+
+    每一列是一个定长数组，第i行由各列的第i个元素组成：动作起始时刻(i64)、动作ID(u16)、动作时间(u16)、
+    参数编码序号(i32)、是否是新动作(u8)。参数编码只保存一份（相同参数的流程项共用），列中只记录其序号。
+    主窗口的流程表模型、动态表生成和流程编译工具都只读取这里的数据。
+    """
+
+    def __init__(self):
+        # 动作起始时刻
+        self.start_times = array('q')
+        # 动作ID
+        self.action_ids = array('H')
+        # 动作时间
+        self.durations = array('H')
+        # 参数编码在 blobs 中的序号，-1 表示没有参数编码（直接引用已存在的动作ID）
+        self.config_refs = array('i')
+        # 是否是新动作(是=1, 否=0)
+        self.new_flags = array('B')
+        # 参数编码（不含动作ID）及其序号 {参数编码: 序号}
+        self.blobs = []
+        self._blob_index = {}
+
+    def __len__(self):
+        return len(self.action_ids)
+
+    def intern_config(self, config):
+        """
+        参数编码只保存一份
+        :param config: 参数编码字节串
+        :return: 序号，没有参数编码时为-1
+        """
+        if not config:
+            return -1
+        ref = self._blob_index.get(config)
+        if ref is None:
+            ref = len(self.blobs)
+            self.blobs.append(config)
+            self._blob_index[config] = ref
+        return ref
+
+    # ---------------- 读取 ----------------
+    def action_id(self, index):
+        """
+        :return: 动作ID（4位16进制字符串）
+        """
+        return f"{self.action_ids[index]:04X}"
+
+    def config(self, index):
+        """
+        :return: 参数编码字节串（不含动作ID），没有时为空字节串
+        """
+        ref = self.config_refs[index]
+        return self.blobs[ref] if ref >= 0 else b""
+
+    def config_hex(self, index):
+        """
+        :return: 配置界面发送的16进制编码（动作ID低字节在前 + 参数编码），没有参数编码时为空字符串
+        """
+        ref = self.config_refs[index]
+        if ref < 0:
+            return ""
+        return encoder.hex_text(encoder.action_id_u16(self.action_id(index)) + self.blobs[ref])
+
+    def row(self, index):
+        """
+        :return: (动作起始时刻, 动作ID, 动作时间, 参数编码（配置界面的16进制编码）, 是否是新动作)
+        """
+        return (self.start_times[index], self.action_id(index), self.durations[index], self.config_hex(index),
+                self.new_flags[index])
+
+    def action_info(self):
+        """
+        动态表的流程项
+        :return: [(动作开始时间, 动作ID, 动作时间)]
+        """
+        return [(start_time, f"{action_id:04X}", duration)
+                for start_time, action_id, duration in zip(self.start_times, self.action_ids, self.durations)]
+
+    # ---------------- 修改 ----------------
+    def insert_rows(self, position, rows):
+        """
+        在position处插入多行
+        :param rows: [(动作起始时刻, 动作ID, 动作时间, 参数编码（配置界面的16进制编码）, 是否是新动作)]
+        """
+        rows = list(rows)
+        if not rows:
+            return
+        start_times, action_ids, durations, config_hexes, new_flags = zip(*rows)
+        # 配置界面的16进制编码前4位是动作ID，只保存后面的参数编码
+        config_refs = [self.intern_config(bytes.fromhex(config_hex[4:])) if config_hex else -1
+                       for config_hex in config_hexes]
+        self.start_times[position:position] = array('q', start_times)
+        self.action_ids[position:position] = array('H', [int(action_id, 16) for action_id in action_ids])
+        self.durations[position:position] = array('H', durations)
+        self.config_refs[position:position] = array('i', config_refs)
+        self.new_flags[position:position] = array('B', new_flags)
+
+    def remove_rows(self, position, count=1):
+        """
+        删除从position开始的count行（参数编码保留，供之后相同参数的流程项使用）
+        """
+        for column in self.columns():
+            del column[position:position + count]
+
+    def move_row(self, source, destination):
+        """
+        把第source行移动到第destination行
+        """
+        for column in self.columns():
+            value = column[source]
+            del column[source]
+            column.insert(destination, value)
+
+    def clear(self):
+        for column in self.columns():
+            del column[:]
+        self.blobs = []
+        self._blob_index = {}
+
+    def columns(self):
+        return self.start_times, self.action_ids, self.durations, self.config_refs, self.new_flags
+
+    # ---------------- 流程描述 ----------------
+    def to_spec(self, dynamic_id):
+        """
+        转为流程描述（flow_compiler.py 的格式）中的一个流程
+        有参数编码的流程项写出动作类别和参数编码（编译时按参数编码查询动作ID），其余写出动作ID
+        :param dynamic_id: 动态表配置序号ID
+        :return: {"dynamic_id": ..., "rows": [...]}
+        """
+        blob_hexes = [encoder.hex_text(blob) for blob in self.blobs]
+        rows = []
+        for start_time, action_id, duration, ref in zip(self.start_times, self.action_ids, self.durations,
+                                                        self.config_refs):
+            action_id = f"{action_id:04X}"
+            if ref >= 0:
+                row = {"start_time": start_time, "category": action_id[0], "config_hex": blob_hexes[ref],
+                       "action_id": action_id}
+            else:
+                row = {"start_time": start_time, "action_id": action_id}
+            if duration:
+                row["duration"] = duration
+            rows.append(row)
+        return {"dynamic_id": dynamic_id, "rows": rows}
+
+    @classmethod
+    def from_spec(cls, flow):
+        """
+        由流程描述中的一个流程创建（流程项中必须有动作ID，例如 to_spec 写出的流程）
+        :param flow: {"dynamic_id": ..., "rows": [...]}
+        :raise ValueError: 流程项缺少动作ID
+        """
+        store = cls()
+        rows = []
+        for row in flow.get("rows") or []:
+            if "action_id" not in row:
+                raise ValueError(f"流程项缺少动作ID（起始时刻{row.get('start_time')}），请先用 flow_compiler 分配动作ID")
+            action_id = str(row["action_id"]).upper()
+            config_hex = str(row.get("config_hex") or "")
+            rows.append((int(row["start_time"]), action_id, int(row.get("duration", 0)),
+                         action_id[2:4] + action_id[0:2] + config_hex if config_hex else "", 0))
+        store.insert_rows(0, rows)
+        return store
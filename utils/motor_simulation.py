@@ -0,0 +1,235 @@
+"""
+电机运动曲线仿真
+
+按动态表的流程项依次执行炉丝电机（类别1）和转机1、样提机2、炉上机3、炉中机4、炉下机5（类别2~6）的动作，
+得到五个电机的位置随时间变化的曲线。每个电机的运动先整理成若干段匀速运动 (起始时刻, 结束时刻, 起始位置, 速度)，
+再用numpy对整个时间轴一次求值，跨越数天、按秒采样的流程也只需要很短的时间。
+
+仿真采用的模型（与配置界面的换算公式互逆）：
+- 类别1设置各电机的速度、细分、方向和使能，对之后开始的运动生效。速度寄存器按界面的公式还原为 mm/s
+  （界面按8细分换算，其他细分按 8/细分数 的比例缩放），运动类别按直线运动计算。
+- 类别2~6让对应的电机按当前的速度和方向运动：开环方式运动开环设置的脉冲数对应的距离，编码器方式运动编码器
+  设置值对应的距离，限位开关方式一直运动到该方向的行程限位（没有给出限位时持续运动到该电机的下一个动作）。
+- 任何方式的运动到达行程限位都会停止；同一电机的新动作开始时，上一个动作立即结束。
+
+    times, positions = motor_simulation.simulate(rows, actions, end_time=3 * 86400)
+    # positions[0] 为转机1的位置曲线，positions[4] 为炉下机5的位置曲线
+"""
+import numpy as np
+
+from utils import action_specs
+from utils.data_utils import get_config
+from utils.total_table_reader import decode_config
+
+# 电机名（与炉丝电机参数中的电机顺序相同）
+MOTOR_NAMES = ("转机1", "样提机2", "炉上机3", "炉中机4", "炉下机5")
+# 动作类别2~6分别驱动第1~5个电机
+MOTOR_ACTION_CODES = (2, 3, 4, 5, 6)
+# 细分下拉框各选项的细分数：2相4拍、2细分、4细分、8细分
+SUBDIVISION_MICROSTEPS = (1, 2, 4, 8)
+# 界面换算速度时使用的细分数
+VELOCITY_MICROSTEPS = 8
+# 运行方式下拉框：0=开环 1=限位开关 2=编码器
+RUN_OPEN_LOOP, RUN_LIMIT_SWITCH, RUN_ENCODER = 0, 1, 2
+
+
+def velocity_from_count(count, conf, steps):
+    """
+    炉丝电机速度寄存器的计数值还原为直线运动速度(mm/s)（action_specs.motor_velocity_count 的逆运算）
+    :param steps: 直线运动每转的脉冲数
+    """
+    P, i, z1, z2 = conf
+    pulse_rate = (1024 * 1000) / (2 * (count + 1))
+    return pulse_rate / steps * (P / i) * (z1 / z2)
+
+
+def distance_from_pulses(pulses, conf):
+    """
+    脉冲数还原为直线运动距离(mm)（action_specs.motor_pulses 的逆运算）
+    """
+    P, i, z1, z2 = conf
+    return pulses / 200 * (P / i) * (z1 / z2)
+
+
+class MotorState:
+    """
+    仿真中一个电机的当前设置和已经生成的运动段
+    """
+
+    def __init__(self, position=0.0, velocity=0.0):
+        self.velocity = velocity
+        # 方向 1=正转 -1=反转
+        self.direction = 1
+        self.enabled = True
+        self.initial = position
+        # 运动段：起始时刻、结束时刻、起始位置、速度
+        self.starts = []
+        self.stops = []
+        self.origins = []
+        self.velocities = []
+
+    def position_at(self, time):
+        if not self.starts:
+            return self.initial
+        start, stop = self.starts[-1], self.stops[-1]
+        return self.origins[-1] + self.velocities[-1] * (min(time, stop) - start)
+
+    def move(self, time, distance, limits):
+        """
+        从time开始按当前速度和方向运动distance（为None时一直运动到行程限位）
+        :param limits: 行程限位 (下限, 上限)
+        """
+        position = self.position_at(time)
+        if self.starts and self.stops[-1] > time:
+            # 新动作开始，上一个动作立即结束
+            self.stops[-1] = time
+        if not self.enabled or self.velocity <= 0:
+            return
+        low, high = limits
+        velocity = self.velocity * self.direction
+        target = (high if velocity > 0 else low) if distance is None else position + self.direction * abs(distance)
+        target = min(max(target, low), high)
+        duration = (target - position) / velocity if np.isfinite(target) else np.inf
+        if duration <= 0:
+            return
+        self.starts.append(time)
+        self.stops.append(time + duration)
+        self.origins.append(position)
+        self.velocities.append(velocity)
+
+    def evaluate(self, times):
+        """
+        在时间轴上求位置
+        """
+        if not self.starts:
+            return np.full(len(times), self.initial, dtype=np.float64)
+        starts = np.asarray(self.starts, dtype=np.float64)
+        stops = np.asarray(self.stops, dtype=np.float64)
+        origins = np.asarray(self.origins, dtype=np.float64)
+        velocities = np.asarray(self.velocities, dtype=np.float64)
+        index = np.searchsorted(starts, times, side='right') - 1
+        before = index < 0
+        index[before] = 0
+        elapsed = np.minimum(times, stops[index]) - starts[index]
+        return np.where(before, self.initial, origins[index] + velocities[index] * elapsed)
+
+
+def apply_hearth_motor(states, values):
+    """
+    执行炉丝电机动作：设置五个电机的速度、细分、方向和使能
+    """
+    config = get_config(1)
+    enable = values.get("motor_enable")
+    for n, motor in enumerate(action_specs.HEARTH_MOTORS):
+        state = states[n]
+        subdivision, direction = values.get(f"{motor}_subdivision_direction", (None, 0))
+        count = values.get(f"{motor}_velocity")
+        if count is not None:
+            conf = action_specs.motor_conf(config[f"{motor}_settings"]["velocity"])
+            velocity = velocity_from_count(count, conf, action_specs.HEARTH_VELOCITY_STEPS[n])
+            if subdivision is not None:
+                velocity *= VELOCITY_MICROSTEPS / SUBDIVISION_MICROSTEPS[subdivision]
+            state.velocity = velocity
+        state.direction = -1 if direction == 1 else 1
+        if enable is not None:
+            state.enabled = (enable >> (2 * n)) & 0b11 != 0
+
+
+def motor_distance(action_code, values):
+    """
+    类别2~6动作的运动距离(mm)，限位开关方式返回None（运动到行程限位）
+    """
+    config = get_config(action_code)
+    run_mode = values.get("run_mode", RUN_OPEN_LOOP)
+    if run_mode == RUN_LIMIT_SWITCH:
+        return None
+    if run_mode == RUN_ENCODER:
+        return values.get("run_encoder", 0) * action_specs.MOTOR_ENCODER_DIVISORS[action_code] / 1024
+    return distance_from_pulses(values.get("run_loop", 0), action_specs.motor_conf(config["open_loop_config"]))
+
+
+def time_axis(end_time, dt=1.0):
+    """
+    从0到end_time（含）按dt采样的时间轴
+    """
+    return np.arange(0, int(np.floor(end_time / dt + 1e-9)) + 1, dtype=np.float64) * dt
+
+
+def build_states(rows, actions, limits=None, initial_positions=None):
+    """
+    按流程项依次执行电机动作，整理出五个电机的运动段
+    :param rows: 动态表流程项 [(动作开始时间(s), 动作ID, 动作时间)]
+    :param actions: 动作参数 {动作ID: 参数编码字节串（不含动作ID）}，流程中其他类别或找不到参数的动作不影响电机
+    :param limits: 各电机的行程限位 [(下限, 上限)]，默认不限
+    :param initial_positions: 各电机的初始位置，默认都为0
+    :return: ([MotorState], 最后一个运动结束的时刻（至少到最后一个流程项）)
+    """
+    count = len(MOTOR_NAMES)
+    limits = list(limits) if limits is not None else [(-np.inf, np.inf)] * count
+    initial_positions = initial_positions if initial_positions is not None else [0.0] * count
+    states = [MotorState(initial_positions[n]) for n in range(count)]
+    # 每个动作ID只解码一次
+    decoded = {}
+    last_time = 0
+    for start_time, action_id, _ in sorted(rows, key=lambda row: row[0]):
+        action_id = action_id.upper()
+        if action_id == "FFFF" or action_id not in actions:
+            continue
+        action_code = int(action_id[0], 16)
+        if action_code not in (1,) + MOTOR_ACTION_CODES:
+            continue
+        if action_id not in decoded:
+            decoded[action_id] = decode_config(action_code, bytes(actions[action_id]))
+        values = decoded[action_id]
+        last_time = max(last_time, start_time)
+        if action_code == 1:
+            apply_hearth_motor(states, values)
+        else:
+            n = MOTOR_ACTION_CODES.index(action_code)
+            states[n].move(start_time, motor_distance(action_code, values), limits[n])
+
+    finite_stops = [stop for state in states for stop in state.stops if np.isfinite(stop)]
+    return states, max([last_time] + finite_stops)
+
+
+def simulate(rows, actions, dt=1.0, end_time=None, limits=None, initial_positions=None):
+    """
+    仿真一个流程中五个电机的位置曲线
+    :param rows: 动态表流程项 [(动作开始时间(s), 动作ID, 动作时间)]
+    :param actions: 动作参数 {动作ID: 参数编码字节串（不含动作ID）}，流程中其他类别或找不到参数的动作不影响电机
+    :param dt: 采样间隔(s)
+    :param end_time: 仿真结束时刻，默认为最后一个运动结束的时刻（至少到最后一个流程项）
+    :param limits: 各电机的行程限位 [(下限, 上限)]，默认不限
+    :param initial_positions: 各电机的初始位置，默认都为0
+    :return: (时间轴, 位置曲线 (5, 采样点数))，位置单位为mm
+    """
+    states, last_stop = build_states(rows, actions, limits, initial_positions)
+    times = time_axis(last_stop if end_time is None else end_time, dt)
+    positions = np.empty((len(states), len(times)), dtype=np.float64)
+    for n, state in enumerate(states):
+        positions[n] = state.evaluate(times)
+    return times, positions
+
+
+def simulate_store(store, **kwargs):
+    """
+    仿真流程表（FlowStore）中的流程，动作参数取自流程项中的参数编码
+    """
+    actions = {}
+    for index in range(len(store)):
+        config = store.config(index)
+        if config:
+            actions.setdefault(store.action_id(index), config)
+    return simulate(store.action_info(), actions, **kwargs)
+
+
+def simulate_image(image, dynamic_id=None, copy=0, **kwargs):
+    """
+    仿真总表（TotalTableImage）中的一个动态表，动作参数取自总表中的动作表
+    :param dynamic_id: 动态表配置序号，默认为第一个动态表
+    """
+    actions = {action.action_id: bytes(action.data) for action in image.iter_actions(copy)}
+    for table in image.iter_dynamic_tables(copy):
+        if dynamic_id is None or table.dynamic_id == dynamic_id:
+            return simulate(table.rows(), actions, **kwargs)
+    raise ValueError(f"总表中没有动态表{dynamic_id}")
@@ -0,0 +1,204 @@
+"""
+电机参数的批量换算（参数扫描）
+
+单位换算与 utils/action_specs.py 中的 motor_pulses / motor_velocity_count 相同，但一次换算一组物理量：
+输入为 numpy 数组，输出为寄存器值数组，并检查16位、32位字段是否越界。
+扫描函数在默认参数记录的基础上只改写被扫描字段对应的字节，一次生成成千上万条动作参数编码。
+
+    counts = motor_sweep.velocity_counts([1, 2, 3], conf, unit_index=1)
+    grid, records = motor_sweep.hearth_velocity_sweep(np.linspace(1, 50, 50), subdivisions=(1, 2, 3))
+    hex_list = motor_sweep.records_hex(records)
+"""
+import numpy as np
+
+from utils import action_specs
+from utils import encoder
+from utils.data_utils import get_config
+
+# 直线运动速度单位换算为 mm/s 的除数：0=mm/s 1=mm/min 2=mm/h
+UNIT_DIVISORS = (1, 60, 3600)
+
+# 转机1~炉下机5可扫描的字段 {字段名: (输入名, 运动类别输入名, 电机参数配置, 位数)}
+MOTOR_SWEEP_FIELDS = {
+    "run_loop": ("run_loop", "open_loop_type", "open_loop_config", 32),
+    "pulse_output_threshold": ("pulse_output", "no_open_loop_type", "no_open_loop_config", 32),
+    "consecutive_steps": ("consecutive_steps", "limit_switch_type", "limit_switch_config", 16),
+    # 失步阈值只写入低16位
+    "out_of_step_threshold": ("out_of_step", "no_open_loop_type", "no_open_loop_config", 16),
+}
+
+# hearth_velocity_sweep 返回的扫描网格每行的内容
+SWEEP_GRID_DTYPE = np.dtype([("motor", np.int8), ("subdivision", np.int8), ("velocity", np.float64)])
+
+
+# ---------------------- 单位换算 ----------------------
+def motor_pulses(values, conf, type_index=0):
+    """
+    一组运动距离（角度）换算为脉冲数
+    :param values: 直线运动的距离(mm)或圆周运动的角度
+    :param conf: 电机参数 (丝杠螺距P, 减速比i, 主动齿轮齿数z1, 传动齿轮齿数z2)
+    :param type_index: 运动类别 0=直线运动 1=圆周运动
+    :return: 脉冲数（float64数组，未取整）
+    """
+    values = np.asarray(values, dtype=np.float64)
+    P, i, z1, z2 = conf
+    if type_index == 0:
+        return ((values / (z1 / z2)) / (P / i)) * 200
+    return ((values / (z1 / z2)) / (1 / i)) / 1.8
+
+
+def velocity_counts(velocities, conf, type_index=0, unit_index=0, steps=200):
+    """
+    一组炉丝电机速度换算为速度寄存器的计数值
+    :param velocities: 速度
+    :param conf: 电机参数 (丝杠螺距P, 减速比i, 主动齿轮齿数z1, 传动齿轮齿数z2)
+    :param type_index: 运动类别 0=直线运动 1=圆周运动
+    :param unit_index: 直线运动的速度单位 0=mm/s 1=mm/min 2=mm/h
+    :param steps: 直线运动每转的脉冲数
+    :return: 计数值（float64数组，未取整）
+    """
+    velocities = np.asarray(velocities, dtype=np.float64)
+    P, i, z1, z2 = conf
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if type_index == 0:
+            if unit_index in (1, 2):
+                velocities = velocities / UNIT_DIVISORS[unit_index]
+            F = ((velocities / (P / i)) / (z1 / z2)) * steps
+        else:
+            F = (velocities / (z1 / z2)) / (1 / i) / 1.8
+        # 与界面相同先保留8位小数，使接近整数的计数值取整后不会少1
+        return np.round((((1024 * 1000) / F) / 2) - 1, 8)
+
+
+def check_range(values, bits, name="参数", low_word=False):
+    """
+    换算结果截断为整数（与界面中 int() 相同，向0取整）并检查是否越界
+    :param bits: 字段位数（16或32）
+    :param name: 出错时提示的参数名
+    :param low_word: 只取低16位（失步阈值），不检查上限
+    :return: 寄存器值（int64数组）
+    :raise ValueError: 有值不是有限数或超出范围
+    """
+    values = np.asarray(values, dtype=np.float64)
+    bad = ~np.isfinite(values)
+    words = np.trunc(np.where(bad, 0, values)).astype(np.int64)
+    if low_word:
+        words &= 0xFFFF
+    else:
+        bad |= (words < 0) | (words >= 1 << bits)
+    if bad.any():
+        index = np.flatnonzero(bad)
+        shown = ", ".join(f"第{k}个值 {values.flat[k]}" for k in index[:5])
+        more = f" 等{len(index)}个" if len(index) > 5 else ""
+        raise ValueError(f"{name}超出{bits}位范围：{shown}{more}")
+    return words
+
+
+# ---------------------- 写入参数记录 ----------------------
+def le_bytes(words, dtype):
+    """
+    寄存器值按小端写成 (N, 字节数) 的字节矩阵
+    """
+    dtype = np.dtype(dtype).newbyteorder('<')
+    return np.ascontiguousarray(words, dtype=dtype).view(np.uint8).reshape(len(words), dtype.itemsize)
+
+
+def put_addressed_u32(records, start, words, high_address_size):
+    """
+    改写带地址的32位字段（高16位 + 高位地址 + 低16位 + 低位地址）中的两个16位值
+    :param start: 字段在记录中的起始位置
+    :param high_address_size: 高位地址的字节数
+    """
+    low_start = start + 2 + high_address_size
+    records[:, start:start + 2] = le_bytes(words >> 16, np.uint16)
+    records[:, low_start:low_start + 2] = le_bytes(words & 0xFFFF, np.uint16)
+
+
+def put_u16(records, start, words):
+    """
+    改写字段开头的16位值（带地址的16位字段）
+    """
+    records[:, start:start + 2] = le_bytes(words, np.uint16)
+
+
+def tile_record(record, count):
+    """
+    把一条参数记录复制成 (count, 记录长度) 的字节矩阵
+    """
+    return np.tile(np.frombuffer(record.to_bytes(), dtype=np.uint8), (count, 1))
+
+
+def records_hex(records):
+    """
+    字节矩阵的每一行转为16进制参数编码（与配置界面生成的 config_hex 相同）
+    """
+    return [row.tobytes().hex().upper() for row in records]
+
+
+# ---------------------- 参数扫描 ----------------------
+def hearth_velocity_sweep(velocities, motors=None, subdivisions=(3,), unit_index=None, type_index=0,
+                          base_values=None):
+    """
+    炉丝电机速度扫描：每个 电机 × 细分 × 速度 生成一条动作参数编码，其余参数保持默认值（或base_values中给出的值）
+    :param velocities: 速度数组
+    :param motors: 扫描的电机序号（1~5），默认全部
+    :param subdivisions: 细分下拉框索引 0=2/4 1=2 2=4 3=8
+    :param unit_index: 速度单位 0=mm/s 1=mm/min 2=mm/h，默认使用各电机界面上的默认单位
+    :param type_index: 运动类别 0=直线运动 1=圆周运动
+    :param base_values: 其余输入的值 {输入名: 值}
+    :return: (扫描网格（SWEEP_GRID_DTYPE数组）, 参数编码字节矩阵)，两者按行对应
+    """
+    velocities = np.asarray(velocities, dtype=np.float64).ravel()
+    motors = range(1, len(action_specs.HEARTH_MOTORS) + 1) if motors is None else motors
+    config = get_config(1)
+    spec = action_specs.hearth_wire_motor_spec()
+    grids = []
+    blocks = []
+    for n in motors:
+        motor = action_specs.HEARTH_MOTORS[n - 1]
+        velocity_conf = config[f"{motor}_settings"]["velocity"]
+        unit = action_specs.HEARTH_UNIT_DEFAULTS[n - 1] if unit_index is None else unit_index
+        counts = velocity_counts(velocities, action_specs.motor_conf(velocity_conf), type_index, unit,
+                                 action_specs.HEARTH_VELOCITY_STEPS[n - 1])
+        words = check_range(counts, 32, f"{motor}速度计数值")
+        high_address_size = len(encoder.const(velocity_conf["address_head"]))
+        for subdivision in subdivisions:
+            # 细分、单位等只影响固定的字节，用一条记录编码后复制，再逐列改写速度
+            record = spec.new_record(dict(base_values or {}, **{f"subdivision_{n}": subdivision,
+                                                                f"type_{n}": type_index, f"unit_{n}": unit}))
+            block = tile_record(record, len(words))
+            put_addressed_u32(block, record.field_span(f"{motor}_velocity")[0], words, high_address_size)
+            blocks.append(block)
+            grid = np.empty(len(words), dtype=SWEEP_GRID_DTYPE)
+            grid["motor"] = n
+            grid["subdivision"] = subdivision
+            grid["velocity"] = velocities
+            grids.append(grid)
+    if not blocks:
+        return np.empty(0, dtype=SWEEP_GRID_DTYPE), np.empty((0, 0), dtype=np.uint8)
+    return np.concatenate(grids), np.concatenate(blocks)
+
+
+def motor_field_sweep(action_code, field_name, values, type_index=0, base_values=None):
+    """
+    转机1~炉下机5（动作类别2~6）的距离、步数类字段扫描：每个值生成一条动作参数编码
+    :param action_code: 动作类别 2~6
+    :param field_name: MOTOR_SWEEP_FIELDS 中的字段名
+    :param values: 距离(mm)或角度数组
+    :param type_index: 运动类别 0=直线运动 1=圆周运动
+    :param base_values: 其余输入的值 {输入名: 值}
+    :return: 参数编码字节矩阵，按values的顺序
+    """
+    input_name, type_name, conf_key, bits = MOTOR_SWEEP_FIELDS[field_name]
+    config = get_config(action_code)
+    words = check_range(motor_pulses(np.ravel(values), action_specs.motor_conf(config[conf_key]), type_index), bits,
+                        field_name, low_word=field_name == "out_of_step_threshold")
+    record = action_specs.build_spec(action_code).new_record(dict(base_values or {}, **{type_name: type_index}))
+    records = tile_record(record, len(words))
+    start = record.field_span(field_name)[0]
+    if bits == 32:
+        settings = config["run_loop_settings" if field_name == "run_loop" else "pulse_output_threshold"]
+        put_addressed_u32(records, start, words, len(encoder.const(settings["high_address"])))
+    else:
+        put_u16(records, start, words)
+    return records
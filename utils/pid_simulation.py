@@ -0,0 +1,239 @@
+"""
+PID控温曲线预测
+
+按动态表的流程项依次执行PID控温曲线（类别B）和PID参数设置（类别F）动作，计算四路PID的设定值曲线和预计的温度曲线。
+
+PID控温曲线动作中每一路的爬升率使能：
+- 爬升/降温：设定值从 温度起始值（65535 表示从当前温度开始）在 加热时间 内线性变化到 温度目标值，之后保持；
+- 开环：按占空比(%)加热，温度趋向 环境温度 + 开环温升 * 占空比 / 100，没有设定值；
+- 关闭：停止加热，温度趋向环境温度，没有设定值；
+- 不选：该路保持原来的状态。
+
+温度按一阶惯性环节计算：闭环时以设定值为输入，时间常数为 对象时间常数 / (1 + 对象增益 * P)（P取自该路最近的
+PID参数设置动作）；开环和关闭时以平衡温度为输入，时间常数为对象时间常数。设定值分段线性，因此每一段的温度都有
+解析解，先按事件整理出各段，再用numpy对整个时间轴一次求值。
+
+    times, setpoints, temperatures = pid_simulation.simulate(rows, actions)
+    # setpoints[0] 为PID1的设定值曲线（没有设定值处为nan），temperatures[0] 为PID1的温度曲线
+"""
+import numpy as np
+
+from utils.data_utils import action_code_of
+from utils.motor_simulation import time_axis
+from utils.total_table_reader import decode_config
+
+# PID路数
+PID_CHANNELS = 4
+# 爬升率使能下拉框：爬升、开环、关闭、不选、降温（与 action_specs.PID_CLIMB_KEYS 的顺序相同）
+CLIMB_UP, CLIMB_OPEN, CLIMB_CLOSE, CLIMB_NONE, CLIMB_DOWN = range(5)
+# 温度起始值为该值时从当前温度开始
+CURRENT_TEMPERATURE = 65535
+# PID参数设置动作中每路的 P、I、D 写入时乘以1000
+PID_PARAM_SCALE = 1000
+
+
+class ThermalModel:
+    """
+    预测温度用的加热对象参数
+    """
+
+    def __init__(self, ambient=25.0, plant_tau=600.0, plant_gain=20.0, open_loop_span=1000.0, p_gain=0.1):
+        """
+        :param ambient: 环境温度(℃)，也是初始温度
+        :param plant_tau: 对象时间常数(s)
+        :param plant_gain: 对象增益，决定闭环时间常数
+        :param open_loop_span: 开环占空比100%时的温升(℃)
+        :param p_gain: 没有PID参数设置动作时使用的P
+        """
+        self.ambient = ambient
+        self.plant_tau = plant_tau
+        self.plant_gain = plant_gain
+        self.open_loop_span = open_loop_span
+        self.p_gain = p_gain
+
+    def closed_loop_tau(self, p_gain):
+        return self.plant_tau / (1 + self.plant_gain * max(p_gain, 0))
+
+
+class ChannelState:
+    """
+    一路PID当前的输入和已经生成的温度段
+
+    每段的输入为 a + b * (t - t0)，温度从y0开始按时间常数tau跟随输入。
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.p_gain = model.p_gain
+        self.time = 0.0
+        self.temperature = model.ambient
+        # 当前输入：起始值、斜率、斜率持续到的时刻、时间常数、是否为设定值（闭环）
+        self.level = model.ambient
+        self.slope = 0.0
+        self.ramp_end = 0.0
+        self.tau = model.plant_tau
+        self.closed_loop = False
+        # 温度段：起始时刻、输入起始值、输入斜率、时间常数、起始温度、是否为设定值
+        self.starts = []
+        self.levels = []
+        self.slopes = []
+        self.taus = []
+        self.origins = []
+        self.visible = []
+
+    def advance(self, until):
+        """
+        生成到until为止的温度段（斜坡结束处分段）
+        """
+        while self.time < until:
+            ramping = self.slope != 0 and self.ramp_end > self.time
+            stop = min(until, self.ramp_end) if ramping else until
+            slope = self.slope if ramping else 0.0
+            self.starts.append(self.time)
+            self.levels.append(self.level)
+            self.slopes.append(slope)
+            self.taus.append(self.tau)
+            self.origins.append(self.temperature)
+            self.visible.append(self.closed_loop)
+            elapsed = stop - self.time
+            self.temperature = float(segment_response(self.level, slope, self.tau, self.temperature, elapsed))
+            self.level += slope * elapsed
+            self.time = stop
+            if ramping and stop >= self.ramp_end:
+                self.slope = 0.0
+
+    def set_program(self, time, climb, values):
+        """
+        执行PID控温曲线动作中该路的爬升率使能
+        :param values: (加热时间, 温度起始值, 温度目标值, 占空比)
+        """
+        self.advance(time)
+        heat_time, start, target, duty = values
+        model = self.model
+        if climb in (CLIMB_UP, CLIMB_DOWN):
+            if start == CURRENT_TEMPERATURE:
+                start = self.level if self.closed_loop else self.temperature
+            self.closed_loop = True
+            self.tau = model.closed_loop_tau(self.p_gain)
+            self.level = float(start)
+            if heat_time > 0:
+                self.slope = (target - start) / heat_time
+                self.ramp_end = time + heat_time
+            else:
+                self.level = float(target)
+                self.slope = 0.0
+        elif climb in (CLIMB_OPEN, CLIMB_CLOSE):
+            self.closed_loop = False
+            self.tau = model.plant_tau
+            self.level = model.ambient + (model.open_loop_span * duty / 100 if climb == CLIMB_OPEN else 0.0)
+            self.slope = 0.0
+
+    def set_p_gain(self, time, p_gain):
+        """
+        执行PID参数设置动作，闭环时从time开始使用新的时间常数
+        """
+        self.advance(time)
+        self.p_gain = p_gain
+        if self.closed_loop:
+            self.tau = self.model.closed_loop_tau(p_gain)
+
+    def evaluate(self, times):
+        """
+        在时间轴上求设定值和温度
+        :return: (设定值（没有设定值处为nan）, 温度)
+        """
+        starts = np.asarray(self.starts, dtype=np.float64)
+        index = np.maximum(np.searchsorted(starts, times, side='right') - 1, 0)
+        elapsed = np.maximum(times - starts[index], 0)
+        levels = np.asarray(self.levels)[index]
+        slopes = np.asarray(self.slopes)[index]
+        temperatures = segment_response(levels, slopes, np.asarray(self.taus)[index],
+                                        np.asarray(self.origins)[index], elapsed)
+        setpoints = np.where(np.asarray(self.visible)[index], levels + slopes * elapsed, np.nan)
+        return setpoints, temperatures
+
+
+def segment_response(level, slope, tau, origin, elapsed):
+    """
+    一阶惯性环节对斜坡输入 level + slope * t 的响应（初值为origin）
+    """
+    return level + slope * (elapsed - tau) + (origin - level + slope * tau) * np.exp(-elapsed / tau)
+
+
+def pid_values(values, n):
+    """
+    PID控温曲线动作中第n路（1~4）的 (加热时间, 温度起始值, 温度目标值, 占空比)
+    """
+    return tuple(values.get(f"PID{n}_val_{k}", 0) for k in range(1, 5))
+
+
+def build_channels(rows, actions, model=None):
+    """
+    按流程项依次执行PID控温曲线和PID参数设置动作，整理出四路PID的输入
+    :param rows: 动态表流程项 [(动作开始时间(s), 动作ID, 动作时间)]
+    :param actions: 动作参数 {动作ID: 参数编码字节串（不含动作ID）}，其他类别或找不到参数的动作不影响温度
+    :param model: 加热对象参数（ThermalModel），默认使用 ThermalModel()
+    :return: ([ChannelState], 最后一个动作（或斜坡结束）后再过5个时间常数的时刻)，
+             求值前需先用 ChannelState.advance 生成到结束时刻为止的温度段
+    """
+    model = model or ThermalModel()
+    channels = [ChannelState(model) for _ in range(PID_CHANNELS)]
+    decoded = {}
+    last_time = 0.0
+    for start_time, action_id, _ in sorted(rows, key=lambda row: row[0]):
+        action_id = action_id.upper()
+        if action_id == "FFFF" or action_id not in actions:
+            continue
+        action_code = action_code_of(action_id)
+        if action_code not in ("B", "F"):
+            continue
+        if action_id not in decoded:
+            decoded[action_id] = decode_config(action_code, bytes(actions[action_id]))
+        values = decoded[action_id]
+        last_time = max(last_time, start_time)
+        if action_code == "B":
+            climbs = values.get("climb_enable", (CLIMB_NONE,) * PID_CHANNELS)
+            for n, channel in enumerate(channels):
+                if climbs[n] is not None and climbs[n] != CLIMB_NONE:
+                    channel.set_program(start_time, climbs[n], pid_values(values, n + 1))
+        else:
+            for n, channel in enumerate(channels):
+                p_value = values.get(f"val_{3 * n + 1}")
+                if p_value is not None:
+                    channel.set_p_gain(start_time, p_value / PID_PARAM_SCALE)
+
+    settle = max(max(channel.taus + [channel.tau]) for channel in channels)
+    return channels, max([last_time] + [channel.ramp_end for channel in channels]) + 5 * settle
+
+
+def simulate(rows, actions, dt=1.0, end_time=None, model=None):
+    """
+    预测一个流程中四路PID的设定值和温度曲线
+    :param rows: 动态表流程项 [(动作开始时间(s), 动作ID, 动作时间)]
+    :param actions: 动作参数 {动作ID: 参数编码字节串（不含动作ID）}，其他类别或找不到参数的动作不影响温度
+    :param dt: 采样间隔(s)
+    :param end_time: 预测结束时刻，默认为最后一个动作（或斜坡结束）后再过5个时间常数
+    :param model: 加热对象参数（ThermalModel），默认使用 ThermalModel()
+    :return: (时间轴, 设定值 (4, 采样点数), 温度 (4, 采样点数))，单位为℃
+    """
+    channels, settled_time = build_channels(rows, actions, model)
+    end_time = settled_time if end_time is None else end_time
+    times = time_axis(end_time, dt)
+    setpoints = np.empty((PID_CHANNELS, len(times)), dtype=np.float64)
+    temperatures = np.empty((PID_CHANNELS, len(times)), dtype=np.float64)
+    for n, channel in enumerate(channels):
+        channel.advance(end_time + dt)
+        setpoints[n], temperatures[n] = channel.evaluate(times)
+    return times, setpoints, temperatures
+
+
+def simulate_store(store, **kwargs):
+    """
+    预测流程表（FlowStore）中的流程，动作参数取自流程项中的参数编码
+    """
+    actions = {}
+    for index in range(len(store)):
+        config = store.config(index)
+        if config:
+            actions.setdefault(store.action_id(index), config)
+    return simulate(store.action_info(), actions, **kwargs)
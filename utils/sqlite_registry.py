@@ -0,0 +1,314 @@
+import os
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS action (
+    category    TEXT NOT NULL,
+    action_id   TEXT NOT NULL,
+    config_hex  TEXT NOT NULL,
+    partial_key TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS action_config_idx ON action (category, config_hex);
+CREATE UNIQUE INDEX IF NOT EXISTS action_id_idx ON action (category, action_id);
+CREATE INDEX IF NOT EXISTS action_partial_idx ON action (category, partial_key);
+CREATE TABLE IF NOT EXISTS action_id_seq (
+    category TEXT PRIMARY KEY,
+    max_id   INTEGER NOT NULL
+);
+"""
+
+
+class SqliteActionRegistry:
+    """
+    基于SQLite的动作ID注册表，接口与ActionRegistry相同，可替代data/*.txt文件
+
+    所有类别存放在一张表中，(category, config_hex) 和 (category, action_id) 均为唯一索引，查询和新ID分配都是索引查询。
+    数据库使用WAL日志模式，写入在 BEGIN IMMEDIATE 事务中完成，多个操作员共用同一个数据库文件时不会互相覆盖：
+    相同参数配置只会保存一次，不同参数配置占用同一个动作ID时拒绝写入并提示冲突。
+    action_id_seq 表记录每个类别出现过的最大动作ID（包括迁移时因参数配置重复而未写入的旧ID），新ID不会与其重复。
+    """
+
+    def __init__(self, db_path):
+        """
+        :param db_path: SQLite数据库文件路径
+        """
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        # 部分匹配键函数 {action_code: key_func}
+        self._partial_keys = {}
+        self._conn = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def register_partial_key(self, action_code, key_func):
+        """
+        为动作类别注册部分匹配键（同ActionRegistry.register_partial_key），已有记录的部分匹配键会重新计算
+        """
+        with self._lock:
+            self._partial_keys[action_code] = key_func
+            rows = self._conn.execute("SELECT rowid, config_hex FROM action WHERE category = ?",
+                                      (str(action_code),)).fetchall()
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany("UPDATE action SET partial_key = ? WHERE rowid = ?",
+                                       [(key_func(config), rowid) for rowid, config in rows])
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _partial_key(self, config_hex, action_code):
+        key_func = self._partial_keys.get(action_code)
+        if key_func is None:
+            return None
+        return key_func(config_hex)
+
+    def lookup(self, config_hex, action_code):
+        """
+        查询参数配置对应的已有动作ID
+        :return: 已存在的动作ID，不存在返回None
+        """
+        config_hex = str(config_hex).upper()
+        category = str(action_code)
+        with self._lock:
+            partial_key = self._partial_key(config_hex, action_code)
+            if partial_key is not None:
+                row = self._conn.execute(
+                    "SELECT action_id FROM action WHERE category = ? AND partial_key = ? ORDER BY rowid LIMIT 1",
+                    (category, partial_key)).fetchone()
+            else:
+                row = self._conn.execute("SELECT action_id FROM action WHERE category = ? AND config_hex = ?",
+                                         (category, config_hex)).fetchone()
+        return row[0] if row else None
+
+    def lookup_config(self, action_id, action_code):
+        """
+        查询动作ID对应的参数配置
+        :return: 参数配置的16进制编码，不存在返回None
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT config_hex FROM action WHERE category = ? AND action_id = ?",
+                                     (str(action_code), str(action_id).upper())).fetchone()
+        return row[0] if row else None
+
+    def next_action_id(self, action_code):
+        """
+        该类别下一个可用的新动作ID（最大ID+1，类别为空时为 类别+"000"）
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT max_id FROM action_id_seq WHERE category = ?",
+                                     (str(action_code),)).fetchone()
+        if row is None:
+            return str(action_code) + "000"
+        return format(row[0] + 1, '04X')
+
+    def get_action_id(self, config_hex, action_code):
+        """
+        根据配置参数编码查询动作ID，若存在则返回已存在的ID，不存在返回一个新ID
+        :return: 返回一个Tuple，(动作id, 是否是新动作：是 = 1，否 = 0)
+        """
+        action_id = self.lookup(config_hex, action_code)
+        if action_id is not None:
+            return action_id, 0
+        return self.next_action_id(action_code), 1
+
+    def allocate(self, config_hex, action_code, action_id=None):
+        """
+        查询参数配置对应的动作ID，不存在时分配新ID并写入（见allocate_many）
+        :return: (动作ID, 结果)
+        """
+        return self.allocate_many([(action_id, config_hex)], action_code)[0]
+
+    def allocate_many(self, records, action_code):
+        """
+        批量查询参数配置、分配新动作ID并写入，查询、分配和写入在同一个 BEGIN IMMEDIATE 事务中完成，
+        多个操作员同时保存时不会分到同一个ID
+        :param records: [(指定的动作ID或None, 参数编码)]，为None时分配该类别最大ID+1
+        :return: 每条记录的 (动作ID, 结果)，结果为 "new" 新记录，"exists" 参数配置已使用指定的动作ID，
+                 "duplicate" 参数配置已使用其他动作ID（返回已有的ID），"collision" 指定的动作ID已被其他参数配置占用
+        """
+        results = []
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for action_id, config_hex in records:
+                    config_hex = str(config_hex).upper()
+                    existing = self.lookup(config_hex, action_code)
+                    if existing is not None:
+                        same = action_id is not None and existing == action_id.upper()
+                        results.append((existing, "exists" if same else "duplicate"))
+                        continue
+                    action_id = self.next_action_id(action_code) if action_id is None else action_id.upper()
+                    results.append((action_id, self._insert(action_id, config_hex, action_code)))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return results
+
+    def _insert(self, action_id, config_hex, action_code):
+        """
+        在已开启的事务中写入一条记录
+        :return: 写入结果 "new" 新记录，"duplicate" 参数配置已存在，"collision" 动作ID已被其他参数配置占用
+        """
+        category = str(action_code)
+        # 与lookup一样，有部分匹配键的参数配置按键值比对
+        row = self._conn.execute("SELECT action_id FROM action WHERE category = ? AND config_hex = ?",
+                                 (category, config_hex)).fetchone()
+        if row is None and self._partial_key(config_hex, action_code) is not None:
+            existing = self.lookup(config_hex, action_code)
+            row = None if existing is None else (existing,)
+        result = "new"
+        if row is not None:
+            result = "duplicate"
+        else:
+            row = self._conn.execute("SELECT config_hex FROM action WHERE category = ? AND action_id = ?",
+                                     (category, action_id)).fetchone()
+            if row is not None:
+                return "collision"
+            self._conn.execute("INSERT INTO action (category, action_id, config_hex, partial_key) VALUES (?, ?, ?, ?)",
+                               (category, action_id, config_hex, self._partial_key(config_hex, action_code)))
+        self._conn.execute("INSERT INTO action_id_seq (category, max_id) VALUES (?, ?) "
+                           "ON CONFLICT(category) DO UPDATE SET max_id = MAX(max_id, excluded.max_id)",
+                           (category, int(action_id, 16)))
+        return result
+
+    def store(self, action_id, config_hex, action_code):
+        """
+        保存一条动作记录
+        :return: 是否写入成功（动作ID被其他参数配置占用时返回False）
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = self._insert(action_id, config_hex, action_code)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        if result == "collision":
+            print(f"动作ID冲突：{action_id} 已被其他参数配置占用，未写入：{config_hex}")
+            return False
+        return True
+
+    def store_many(self, records, action_code):
+        """
+        批量保存一个类别的动作记录（在一个事务中完成）
+        :param records: [(动作ID, 参数编码)]
+        :return: 每条记录的写入结果，"new" 新记录，"duplicate" 参数配置已存在，"collision" 动作ID已被其他参数配置占用
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                results = [self._insert(action_id, config_hex, action_code) for action_id, config_hex in records]
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return results
+
+    def apply_changes(self, removed, added):
+        """
+        同步动作表文件夹时批量删除和添加记录（同ActionRegistry.apply_changes，在一个事务中完成）
+        """
+        results = {}
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for action_code, records in removed.items():
+                    self._conn.executemany(
+                        "DELETE FROM action WHERE category = ? AND action_id = ? AND config_hex = ?",
+                        [(str(action_code), action_id, config_hex) for action_id, config_hex in records])
+                for action_code, records in added.items():
+                    results[action_code] = [self._add(action_id, config_hex, action_code)
+                                            for action_id, config_hex in records]
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return results
+
+    def replace_all(self, records):
+        """
+        用给定的记录整体重建注册表（同ActionRegistry.replace_all，清空和写入在一个事务中完成）
+        :param records: {动作类别: [(动作ID, 参数编码)]}
+        :return: 每条记录的结果 {动作类别: [结果]}
+        """
+        results = {}
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM action")
+                self._conn.execute("DELETE FROM action_id_seq")
+                for action_code, code_records in records.items():
+                    results[action_code] = [self._add(action_id, config_hex, action_code)
+                                            for action_id, config_hex in code_records]
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return results
+
+    def _add(self, action_id, config_hex, action_code):
+        """
+        在已开启的事务中添加一条同步记录，相同的记录已存在时返回"exists"，否则同_insert
+        """
+        row = self._conn.execute("SELECT action_id FROM action WHERE category = ? AND config_hex = ?",
+                                 (str(action_code), config_hex)).fetchone()
+        if (row is not None and row[0] == action_id) or (
+                row is None and self.lookup(config_hex, action_code) == action_id):
+            return "exists"
+        return self._insert(action_id, config_hex, action_code)
+
+    def clear(self):
+        """
+        清空所有动作记录
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM action")
+                self._conn.execute("DELETE FROM action_id_seq")
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def invalidate(self, action_code=None):
+        """
+        数据库没有内存索引，保留该方法以兼容ActionRegistry的接口
+        """
+
+    def import_txt(self, data_dir, file_names):
+        """
+        一次性把data/*.txt中的动作记录迁移到数据库（在一个事务中完成）
+        :param data_dir: 存放动作表.txt文件的目录
+        :param file_names: 动作类别 -> .txt文件名 的字典
+        :return: {动作类别: (新写入数, 重复的参数配置数, 冲突的动作ID数)}
+        """
+        report = {}
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for action_code, file_name in file_names.items():
+                    counts = {"new": 0, "duplicate": 0, "collision": 0}
+                    file_path = os.path.join(data_dir, file_name)
+                    if os.path.exists(file_path):
+                        with open(file_path, 'r', encoding='utf-8') as data_file:
+                            for line in data_file:
+                                parts = line.strip().split(" ")
+                                if len(parts) != 2:
+                                    continue
+                                counts[self._insert(parts[0], parts[1], action_code)] += 1
+                    report[action_code] = (counts["new"], counts["duplicate"], counts["collision"])
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return report
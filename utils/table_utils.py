@@ -0,0 +1,398 @@
+import datetime
+import fnmatch
+import operator
+import os
+import re
+import struct
+import tempfile
+
+from utils import encoder
+from utils.data_utils import base_path
+
+# 动作表文件名：以 AT 开头且包含四位十六进制数的 .bin 文件
+ACTION_FILE_PATTERN = re.compile(r'AT.*?([0-9A-Fa-f]{4}).*?\.bin$')
+# 动态表文件名：以 DT 开头且包含四位数的 .bin 文件
+DYNAMIC_FILE_PATTERN = re.compile(r'DT.*?(\d{4}).*?\.bin$')
+# 一个实验流程最大动作数
+MAX_ACTION_NUM = 128
+# 动态表补齐用的空动作 (动作开始时间, 动作ID, 动作时间)
+EMPTY_DYNAMIC_RECORD = (4294967295, 'FFFF', 65535)
+EMPTY_DYNAMIC_RECORD_BYTES = encoder.dynamic_record(*EMPTY_DYNAMIC_RECORD)
+# 动态表表头（配置序号u16 + 最大动作数u48）和每条记录的字节数
+DYNAMIC_HEADER_SIZE = 8
+DYNAMIC_RECORD_SIZE = len(EMPTY_DYNAMIC_RECORD_BYTES)
+# 生成器一次写入整条动态表记录：动作开始时间(u32) + 动作ID(u16) + 动作时间(u16，写入前交换高低字节，即大端)
+DYNAMIC_ROW = struct.Struct('<IHH')
+# 最后一个动作的动作时间
+FINALLY_ACTION_DURATION = 65535
+# 总表配置值
+TOTAL_TABLE_CONFIG = '00F0'
+# 电机的参数默认配置值
+MOTOR_HEX_STR = '00C0'
+
+
+# ---------------------------- 动作表 ----------------------------
+def build_action_table(action_id, config):
+    """
+    生成动作表：动作ID（低字节在前） + 参数编码
+    :param action_id: 动作ID（4位16进制字符串）
+    :param config: 参数编码字节串
+    """
+    return encoder.action_id_u16(action_id) + config
+
+
+def action_table_file_name(action_id):
+    """
+    动作表文件名 AT_动作ID.bin
+    """
+    return 'AT_' + action_id.upper() + '.bin'
+
+
+def list_table_files(folder_path, pattern):
+    """
+    遍历文件夹，返回文件名匹配 pattern 的 .bin 文件路径（按文件名排序，保证每次拼接的顺序一致）
+    """
+    table_files = []
+    for root, dirs, files in os.walk(folder_path):
+        for filename in files:
+            if filename.endswith('.bin') and pattern.match(filename):
+                table_files.append(os.path.join(root, filename))
+    table_files.sort(key=lambda path: (os.path.basename(path), path))
+    return table_files
+
+
+# ---------------------------- 动态表 ----------------------------
+def build_dynamic_records(action_info, max_action_num=MAX_ACTION_NUM):
+    """
+    由流程项 [(动作开始时间, 动作ID, 动作时间)] 生成动态表记录：最后一个动作的动作时间改为65535，
+    不足 max_action_num 条时用空动作补齐
+    """
+    records = [(start_time, action_id.upper(), action_time) for start_time, action_id, action_time in action_info]
+    if len(records) == 0:
+        return records
+    start_time, action_id, action_time = records[-1]
+    records[-1] = (start_time, action_id, FINALLY_ACTION_DURATION)
+    if len(records) < max_action_num:
+        records.extend([EMPTY_DYNAMIC_RECORD] * (max_action_num - len(records)))
+    return records
+
+
+def swap_u16(value):
+    """
+    交换16位整数的高低字节（动作时间按大端写入）
+    """
+    return ((value & 0xFF) << 8) | (value >> 8)
+
+
+def _row_int(value, maximum, name):
+    """
+    动态表记录中的整数字段，不是整数或超出0~maximum时抛出ValueError
+    """
+    try:
+        value = operator.index(value)
+    except TypeError:
+        raise ValueError(f"{name}{value!r}不是整数") from None
+    if not 0 <= value <= maximum:
+        raise ValueError(f"{name}{value}超出范围0~{maximum}")
+    return value
+
+
+def dynamic_row_values(start_time, action_id, action_time):
+    """
+    检查一条动态表记录的取值范围，返回写入缓冲区的整数
+    :param start_time: 动作开始时间（u32）
+    :param action_id: 动作ID（4位16进制字符串）
+    :param action_time: 动作时间（u16）
+    :return: (动作开始时间, 动作ID, 字节交换后的动作时间)
+    """
+    start_time = _row_int(start_time, 0xFFFFFFFF, "动作开始时间")
+    action_time = _row_int(action_time, 0xFFFF, "动作时间")
+    try:
+        action_value = int(action_id, 16)
+    except (TypeError, ValueError):
+        raise ValueError(f"动作ID{action_id!r}不是16进制数") from None
+    if not 0 <= action_value <= 0xFFFF:
+        raise ValueError(f"动作ID{action_id}超出范围0000~FFFF")
+    return start_time, action_value, swap_u16(action_time)
+
+
+class DynamicTableBuilder:
+    """
+    动态表生成器
+
+    预先分配 表头 + max_action_num 条记录 的缓冲区，并用空动作填满；流程项直接写入对应位置的记录，
+    生成动态表时只复制一次缓冲区，不需要逐行转换16进制文本再拼接。
+    """
+
+    def __init__(self, dynamic_id, max_action_num=MAX_ACTION_NUM):
+        """
+        :param dynamic_id: 动态表配置序号ID（整数，四位十进制数）
+        :param max_action_num: 最大动作数
+        """
+        self.max_action_num = max_action_num
+        # 已写入的流程项数
+        self.count = 0
+        self._buffer = bytearray(DYNAMIC_HEADER_SIZE) + EMPTY_DYNAMIC_RECORD_BYTES * max_action_num
+        self.dynamic_id = dynamic_id
+        self._buffer[0:DYNAMIC_HEADER_SIZE] = self.header()
+
+    def header(self):
+        """
+        动态表表头：动态表配置序号（BCD码，与 db_utils.format_dynamic_id 相同） + 最大动作数（u48，与 format_max_action 相同）
+        """
+        return encoder.bcd_u16(self.dynamic_id) + encoder.u48(self.max_action_num)
+
+    def set_row(self, index, start_time, action_id, action_time):
+        """
+        写入第index条记录
+        :param action_id: 动作ID（4位16进制字符串）
+        """
+        if not 0 <= index < self.max_action_num:
+            raise ValueError(f"流程项序号{index}超出最大动作数{self.max_action_num}")
+        DYNAMIC_ROW.pack_into(self._buffer, DYNAMIC_HEADER_SIZE + index * DYNAMIC_RECORD_SIZE,
+                              *dynamic_row_values(start_time, action_id, action_time))
+
+    def append(self, start_time, action_id, action_time):
+        """
+        在已写入的流程项后面追加一条记录
+        """
+        self.set_row(self.count, start_time, action_id, action_time)
+        self.count += 1
+
+    def extend(self, action_info):
+        """
+        追加流程项 [(动作开始时间, 动作ID, 动作时间)]
+        先检查全部流程项的取值范围，任一项超出范围时抛出ValueError，缓冲区保持不变
+        """
+        if self.count + len(action_info) > self.max_action_num:
+            raise ValueError(f"流程项数{self.count + len(action_info)}超过最大动作数{self.max_action_num}")
+        rows = []
+        for number, row in enumerate(action_info, self.count + 1):
+            try:
+                rows.append(dynamic_row_values(*row))
+            except ValueError as e:
+                raise ValueError(f"第{number}项：{e}") from None
+        buffer = self._buffer
+        offset = DYNAMIC_HEADER_SIZE + self.count * DYNAMIC_RECORD_SIZE
+        pack_into = DYNAMIC_ROW.pack_into
+        for row in rows:
+            pack_into(buffer, offset, *row)
+            offset += DYNAMIC_RECORD_SIZE
+        self.count += len(action_info)
+
+    def clear(self):
+        """
+        清空流程项，所有记录恢复为空动作
+        """
+        self._buffer[DYNAMIC_HEADER_SIZE:] = EMPTY_DYNAMIC_RECORD_BYTES * self.max_action_num
+        self.count = 0
+
+    def to_bytes(self):
+        """
+        生成动态表，最后一个流程项的动作时间写为65535
+        """
+        table = bytearray(self._buffer)
+        if self.count > 0:
+            offset = DYNAMIC_HEADER_SIZE + self.count * DYNAMIC_RECORD_SIZE - 2
+            encoder.U16_BE.pack_into(table, offset, FINALLY_ACTION_DURATION)
+        return bytes(table)
+
+    def records(self):
+        """
+        从缓冲区读出全部记录（与 build_dynamic_records 的结果相同，用于导出Excel）
+        :return: [(动作开始时间, 动作ID, 动作时间)]
+        """
+        table = self.to_bytes()
+        return [(start_time, f"{action_id:04X}", swap_u16(action_time))
+                for start_time, action_id, action_time in DYNAMIC_ROW.iter_unpack(table[DYNAMIC_HEADER_SIZE:])]
+
+
+def build_dynamic_table(dynamic_id, records, max_action_num=MAX_ACTION_NUM):
+    """
+    生成动态表：动态表配置序号 + 最大动作数 + 每条记录(动作开始时间, 动作ID, 动作时间)
+    :param dynamic_id: 动态表配置序号ID（整数）
+    :param records: build_dynamic_records 生成的动态表记录
+    :param max_action_num: 最大动作数
+    """
+    builder = DynamicTableBuilder(dynamic_id, max_action_num)
+    for index, (start_time, action_id, action_time) in enumerate(records):
+        builder.set_row(index, start_time, action_id, action_time)
+    return builder.to_bytes()
+
+
+def dynamic_table_file_name(dynamic_id):
+    """
+    动态表文件名 DT_四位序号.bin
+    """
+    return f'DT_{dynamic_id:04d}.bin'
+
+
+# ---------------------------- 静态表 ----------------------------
+def count_actions(folder_path):
+    """
+    统计文件夹中每类动作的动作表数（按动作ID的首位分类）
+    :return: {'0': 数量, ..., 'F': 数量}
+    """
+    actions_count = {hex(i)[-1].upper(): 0 for i in range(16)}
+    for root, dirs, files in os.walk(folder_path):
+        for filename in fnmatch.filter(files, 'AT*.bin'):
+            match = ACTION_FILE_PATTERN.match(filename)
+            if match:
+                first_char = match.group(1).upper()[0]
+                if first_char in actions_count:
+                    actions_count[first_char] += 1
+    return actions_count
+
+
+def count_dynamic_tables(folder_path):
+    """
+    统计文件夹中以 DT 开头的 .bin 流程表文件数
+    """
+    dynamic_count = 0
+    for root, dirs, files in os.walk(folder_path):
+        dynamic_count += len(fnmatch.filter(files, 'DT*.bin'))
+    return dynamic_count
+
+
+def read_static_part(file_name):
+    """读取与程序位于相同目录下的静态表片段（static_middle_bin.txt / static_tail_bin.txt，内容为16进制文本）"""
+    with open(os.path.join(base_path, file_name), 'r', encoding='utf-8') as file:
+        return bytes.fromhex(file.read())
+
+
+def build_actions_bytes(actions_count):
+    """
+    每类动作数（每类u16，低字节在前）
+    """
+    return b''.join(encoder.u16(value) for value in actions_count.values())
+
+
+def build_static_table(dynamic_count, actions_bytes):
+    """
+    生成静态表：实验总批数(u8) + 静态表中间参数 + 每类动作数 + 静态表尾部参数
+    """
+    return (encoder.u8(dynamic_count) + read_static_part('static_middle_bin.txt') + actions_bytes +
+            read_static_part('static_tail_bin.txt'))
+
+
+def static_table_file_name(today=None):
+    """
+    静态表文件名 ST_静态表月日.bin
+    """
+    today = today or datetime.datetime.today()
+    return 'ST_静态表' + today.strftime('%m%d') + '.bin'
+
+
+# ---------------------------- 总表 ----------------------------
+def calculate_hex_string(length):
+    """
+    计算静态表、总动作表、总动态表、总监控表的十六进制值（基础值+偏移，低字节在前，重复三次），用于界面显示
+    """
+    return encoder.hex_text(encoder.table_offset(length))
+
+
+def total_length_format_hex(total_length):
+    """
+    计算总表长度的十六进制值（低字节在前，重复三次），用于界面显示
+    """
+    return encoder.hex_text(encoder.table_length(total_length))
+
+
+def build_table_head(static_length, action_length, dynamic_length, monitoring_length,
+                     total_table_config=TOTAL_TABLE_CONFIG, motor_hex_str=MOTOR_HEX_STR):
+    """
+    生成表头：总表配置 + 电机配置 + 静态表/总动作表/总动态表/总监控表的偏移 + 总表长度
+    """
+    return (encoder.const(total_table_config) + encoder.const(motor_hex_str) + encoder.table_offset(0) +
+            encoder.table_offset(static_length) + encoder.table_offset(static_length + action_length) +
+            encoder.table_offset(static_length + action_length + dynamic_length) +
+            encoder.table_length(static_length + action_length + dynamic_length + monitoring_length))
+
+
+def table_head_file_name(static_length, action_length, dynamic_length, monitoring_length):
+    """
+    表头文件名
+    """
+    total_length = static_length + action_length + dynamic_length + monitoring_length
+    return (f'AT_已_F000表(电机1关电机2关电机3关电机4关电机5关)00C0H(静态表长度{static_length})25H'
+            f'(动作表长度{action_length})25H(动态表长度{dynamic_length})25H(监控表长度{monitoring_length})25H'
+            f'(总长度{total_length})25H' + '.bin')
+
+
+def calculate_checksum(data):
+    """计算字节串的校验和"""
+    # 计算所有字节的累加和，取低字节
+    return sum(data) % 256
+
+
+def generate_table_name(base_name, checksum):
+    """生成表名，格式为 表名_0x校验和_生成时间"""
+    current_time = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"{base_name}_0x{checksum:02X}_{current_time}"
+
+
+def write_table_file(data, output_file_path):
+    """
+    将字节串写入.bin文件（文件夹不存在则创建）
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(output_file_path)), exist_ok=True)
+    with open(output_file_path, 'wb') as binary_file:
+        binary_file.write(data)
+    return output_file_path
+
+
+def stream_table_file(chunks, output_dir, base_name):
+    """
+    依次把字节块写入文件，写入的同时累加校验和，写完后按 表名_0x校验和_生成时间.bin 命名
+    例如 表头+3总表 传入 [表头] + [静态表, 总动作表, 总动态表, 总监控表] * 3，同一块数据只在内存中保存一份
+    :param chunks: 字节块列表（bytes/bytearray/memoryview）
+    :param output_dir: 输出文件夹（不存在则创建）
+    :param base_name: 表名
+    :return: (文件路径, 校验和)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    # 校验和决定文件名，先写入临时文件，写完再重命名
+    fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=output_dir)
+    # 重复写入的同一块数据只计算一次字节和
+    chunk_sums = {}
+    checksum = 0
+    try:
+        with os.fdopen(fd, 'wb') as binary_file:
+            for chunk in chunks:
+                binary_file.write(chunk)
+                if id(chunk) not in chunk_sums:
+                    chunk_sums[id(chunk)] = sum(chunk)
+                checksum = (checksum + chunk_sums[id(chunk)]) % 256
+        output_file_path = os.path.join(output_dir, generate_table_name(base_name, checksum) + '.bin')
+        os.replace(temp_path, output_file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return output_file_path, checksum
+
+
+# ---------------------------- 文件选择 ----------------------------
+# 静态表、总表对话框选择文件/文件夹使用tkinter的对话框；tkinter只在选择时导入，不影响程序启动时间
+def ask_directory(**options):
+    """
+    弹出文件夹选择对话框
+    :param options: 传给 filedialog.askdirectory 的参数（如title）
+    :return: 选择的文件夹路径，取消时为空字符串
+    """
+    from tkinter import Tk, filedialog
+
+    Tk().withdraw()  # 隐藏主窗口
+    return filedialog.askdirectory(**options)
+
+
+def ask_open_file(**options):
+    """
+    弹出文件选择对话框
+    :param options: 传给 filedialog.askopenfilename 的参数（如title、filetypes）
+    :return: 选择的文件路径，取消时为空字符串
+    """
+    from tkinter import Tk, filedialog
+
+    Tk().withdraw()  # 隐藏主窗口
+    return filedialog.askopenfilename(**options)
@@ -0,0 +1,161 @@
+"""
+实验流程时间线检查
+
+对一个流程的流程项做三项检查：
+- 重叠：按设备建立区间索引（每个流程项占用设备的区间为 [动作开始时刻, 动作开始时刻 + 预计动作时间)），
+  同一设备上的两个区间重叠（或两个动作在同一时刻开始）时报告；转机1、样提机2、炉上机3、炉中机4、炉下机5
+  各为一个设备，其他动作类别各为一个设备。
+- 顺序：动作起始时刻必须按流程项的顺序单调不减。
+- 容量：流程项数不能超过最大动作数（补齐空动作之前），动作开始时刻和动作时间不能超出动态表记录的范围。
+
+预计动作时间取流程项的动作时间和按电机运动模型（utils/motor_simulation.py）估计的运动时间中较大的一个。
+每个设备的区间按开始时刻排序后扫描一遍，总的复杂度为 O(n log n)。
+
+    issues = check_timeline(store.action_info(), actions)
+    for issue in issues:
+        print(issue["kind"], issue["rows"], issue["message"])
+"""
+import math
+from itertools import accumulate
+
+from utils import motor_simulation
+from utils.data_utils import action_code_of
+from utils.table_utils import MAX_ACTION_NUM
+from utils.total_table_reader import decode_config
+
+# 问题类型：重叠、顺序、容量
+ISSUE_OVERLAP, ISSUE_ORDER, ISSUE_CAPACITY = "overlap", "order", "capacity"
+# 动态表记录中动作开始时间为u32，动作时间为u16
+MAX_START_TIME = 0xFFFFFFFF
+MAX_ACTION_TIME = 0xFFFF
+
+
+def device_of(action_id):
+    """
+    动作占用的设备名
+    """
+    action_code = action_code_of(action_id)
+    if action_code in motor_simulation.MOTOR_ACTION_CODES:
+        return motor_simulation.MOTOR_NAMES[motor_simulation.MOTOR_ACTION_CODES.index(action_code)]
+    return f"类别{action_code}"
+
+
+def estimate_durations(rows, actions):
+    """
+    每个流程项的预计动作时间(s)：流程项的动作时间，电机运动取按运动模型估计的运动时间（较大的一个）
+    :param rows: 流程项 [(动作开始时间, 动作ID, 动作时间)]
+    :param actions: 动作参数 {动作ID: 参数编码字节串（不含动作ID）}，找不到参数的动作只使用流程项的动作时间
+    :return: 与rows顺序相同的预计动作时间列表
+    """
+    durations = [float(row[2]) for row in rows]
+    states = [motor_simulation.MotorState() for _ in motor_simulation.MOTOR_NAMES]
+    limits = (-math.inf, math.inf)
+    decoded = {}
+    # 电机速度由之前的炉丝电机动作决定，按动作开始时刻的顺序估计
+    for index in sorted(range(len(rows)), key=lambda i: rows[i][0]):
+        start_time, action_id, _ = rows[index]
+        action_id = action_id.upper()
+        if action_id == "FFFF" or action_id not in actions:
+            continue
+        action_code = action_code_of(action_id)
+        if action_code not in (1,) + motor_simulation.MOTOR_ACTION_CODES:
+            continue
+        if action_id not in decoded:
+            decoded[action_id] = decode_config(action_code, bytes(actions[action_id]))
+        values = decoded[action_id]
+        if action_code == 1:
+            motor_simulation.apply_hearth_motor(states, values)
+            continue
+        state = states[motor_simulation.MOTOR_ACTION_CODES.index(action_code)]
+        segments = len(state.starts)
+        state.move(start_time, motor_simulation.motor_distance(action_code, values), limits)
+        # 限位开关方式的运动时间无法估计，只使用流程项的动作时间
+        if len(state.starts) > segments and math.isfinite(state.stops[-1]):
+            durations[index] = max(durations[index], state.stops[-1] - start_time)
+    return durations
+
+
+class IntervalIndex:
+    """
+    一个设备上的区间索引：区间按开始时刻排序，并记录前缀中最大的结束时刻
+    """
+
+    def __init__(self, intervals):
+        """
+        :param intervals: [(开始时刻, 结束时刻, 流程项序号)]
+        """
+        self.intervals = sorted(intervals)
+        # prefix_ends[i] 为前i+1个区间中最大的结束时刻及其位置
+        self.prefix_ends = list(accumulate(((interval[1], i) for i, interval in enumerate(self.intervals)), max))
+
+    def overlaps(self):
+        """
+        相互重叠的区间（每个区间与它之前结束最晚的区间比较，或与同一时刻开始的区间比较）
+        :return: [(先开始的流程项序号, 后开始的流程项序号)]
+        """
+        pairs = []
+        for i in range(1, len(self.intervals)):
+            start, _, row = self.intervals[i]
+            latest_end, j = self.prefix_ends[i - 1]
+            if start < latest_end:
+                pairs.append((self.intervals[j][2], row))
+            elif start == self.intervals[i - 1][0]:
+                pairs.append((self.intervals[i - 1][2], row))
+        return pairs
+
+
+def build_indexes(rows, durations):
+    """
+    按设备建立区间索引
+    :return: {设备名: IntervalIndex}
+    """
+    intervals = {}
+    for index, ((start_time, action_id, _), duration) in enumerate(zip(rows, durations)):
+        if action_id.upper() == "FFFF":
+            continue
+        intervals.setdefault(device_of(action_id), []).append((start_time, start_time + duration, index))
+    return {device: IntervalIndex(items) for device, items in intervals.items()}
+
+
+def check_timeline(rows, actions=None, max_action_num=MAX_ACTION_NUM):
+    """
+    检查一个流程的流程项
+    :param rows: 流程项 [(动作开始时间, 动作ID, 动作时间)]，按流程表中的顺序
+    :param actions: 动作参数 {动作ID: 参数编码字节串（不含动作ID）}，用于估计电机的运动时间
+    :param max_action_num: 最大动作数
+    :return: [{"kind": 问题类型, "rows": [流程项序号], "message": 说明}]，流程项序号从0开始
+    """
+    rows = list(rows)
+    issues = []
+    if len(rows) > max_action_num:
+        issues.append({"kind": ISSUE_CAPACITY, "rows": list(range(max_action_num, len(rows))),
+                       "message": f"流程项数{len(rows)}超过最大动作数{max_action_num}"})
+    for index, (start_time, action_id, duration) in enumerate(rows):
+        if not 0 <= start_time <= MAX_START_TIME:
+            issues.append({"kind": ISSUE_CAPACITY, "rows": [index],
+                           "message": f"第{index + 1}项的动作起始时刻{start_time}超出范围（0~{MAX_START_TIME}）"})
+        if not 0 <= duration <= MAX_ACTION_TIME:
+            issues.append({"kind": ISSUE_CAPACITY, "rows": [index],
+                           "message": f"第{index + 1}项的动作时间{duration}超出范围（0~{MAX_ACTION_TIME}）"})
+
+    for index in range(1, len(rows)):
+        if rows[index][0] < rows[index - 1][0]:
+            issues.append({"kind": ISSUE_ORDER, "rows": [index - 1, index],
+                           "message": f"第{index + 1}项的动作起始时刻{rows[index][0]}早于"
+                                      f"第{index}项的{rows[index - 1][0]}"})
+
+    durations = estimate_durations(rows, actions or {})
+    for device, index in sorted(build_indexes(rows, durations).items()):
+        for first, second in index.overlaps():
+            end_time = rows[first][0] + durations[first]
+            issues.append({"kind": ISSUE_OVERLAP, "rows": [first, second],
+                           "message": f"{device}：第{second + 1}项（{rows[second][0]}s开始）与"
+                                      f"第{first + 1}项（{rows[first][0]}s ~ {end_time:g}s）重叠"})
+    return issues
+
+
+def format_issues(issues):
+    """
+    问题列表转为多行文本
+    """
+    return "\n".join(issue["message"] for issue in issues)
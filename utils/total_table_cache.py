@@ -0,0 +1,147 @@
+import json
+import os
+import tempfile
+
+from utils import table_utils
+from utils.action_sync import file_digest
+
+# 构建缓存清单文件名（存放在 total_bin 文件夹中）
+MANIFEST_FILE_NAME = 'total_table_manifest.json'
+# 总表中各部分的顺序：静态表 + 总动作表 + 总动态表 + 总监控表
+SEGMENT_NAMES = ('static', 'action', 'dynamic', 'monitoring')
+
+
+class TotalTableCache:
+    """
+    总表的增量构建缓存
+
+    每次生成总表后，在 total_bin/total_table_manifest.json 中记录本次总表文件，以及组成总表的每个输入文件的
+    路径、大小、修改时间、内容哈希和在总表中的偏移，并记录各部分的长度和偏移（calculate_hex_string 的值）。
+    下次生成时，大小和修改时间都没有变化的文件直接从上一次的总表文件中按偏移截取，只重新读取改动过的文件，
+    拼接结果与全部重新读取完全相同。
+
+    文件系统的修改时间有精度限制，记录之后在同一个时间刻度内再次改动的文件修改时间不变。因此修改时间不早于
+    清单文件修改时间的文件不能只凭大小和修改时间判断，一律重新读取并计算哈希。
+    """
+
+    def __init__(self, total_dir):
+        """
+        :param total_dir: 总表文件夹（total_bin）
+        """
+        self.total_dir = total_dir
+        self.manifest_path = os.path.join(total_dir, MANIFEST_FILE_NAME)
+        # 上一次总表的清单，第一次读取时加载
+        self._previous = None
+        # 本次读取的各部分 {segment_name: (长度, [文件记录])}
+        self._segments = {}
+
+    def _load_previous(self):
+        """
+        读取上一次的清单，返回 (上一次总表文件路径, {输入文件路径: 文件记录}, 清单文件的修改时间)；
+        清单或总表文件无效时返回 (None, {}, 0)
+        """
+        if self._previous is not None:
+            return self._previous
+        self._previous = (None, {}, 0)
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as file:
+                saved_ns = os.fstat(file.fileno()).st_mtime_ns
+                manifest = json.load(file)
+            assembly = manifest["assembly"]
+            assembly_path = os.path.join(self.total_dir, assembly["file"])
+            stat = os.stat(assembly_path)
+        except (OSError, ValueError, KeyError):
+            return self._previous
+        # 上一次的总表文件被改动过时不能复用
+        if stat.st_size != assembly["size"] or stat.st_mtime_ns != assembly["mtime_ns"]:
+            return self._previous
+        entries = {}
+        for segment in manifest["segments"].values():
+            for entry in segment["files"]:
+                entries[entry["path"]] = entry
+        self._previous = (assembly_path, entries, saved_ns)
+        return self._previous
+
+    def read_segment(self, segment_name, file_paths):
+        """
+        按顺序读取总表一部分的输入文件并拼接，未改动的文件从上一次的总表中截取
+        :param segment_name: 'static' / 'action' / 'dynamic' / 'monitoring'
+        :param file_paths: 按拼接顺序排列的输入文件路径
+        :return: 拼接后的字节串
+        """
+        assembly_path, previous_entries, saved_ns = self._load_previous()
+        # 每段数据 [上一次总表中的偏移, 长度] 或 新读取的字节串，相邻的可复用数据合并成一次读取
+        pieces = []
+        entries = []
+        offset = 0
+        reused_count = 0
+        for file_path in file_paths:
+            path = os.path.abspath(file_path)
+            stat = os.stat(path)
+            previous = previous_entries.get(path)
+            # 修改时间不早于清单保存时间的文件可能在记录之后又被改动过，重新读取
+            if (previous is not None and previous["size"] == stat.st_size and previous["mtime_ns"] == stat.st_mtime_ns
+                    and stat.st_mtime_ns < saved_ns):
+                digest = previous["sha256"]
+                if pieces and isinstance(pieces[-1], list) and pieces[-1][0] + pieces[-1][1] == previous["offset"]:
+                    pieces[-1][1] += stat.st_size
+                else:
+                    pieces.append([previous["offset"], stat.st_size])
+                reused_count += 1
+            else:
+                with open(path, 'rb') as file:
+                    content = file.read()
+                digest = file_digest(content)
+                pieces.append(content)
+            entries.append({"path": path, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest,
+                            "offset": offset})
+            offset += stat.st_size
+
+        contents = []
+        if reused_count:
+            with open(assembly_path, 'rb') as assembly_file:
+                for piece in pieces:
+                    if isinstance(piece, list):
+                        assembly_file.seek(piece[0])
+                        piece = assembly_file.read(piece[1])
+                    contents.append(piece)
+        else:
+            contents = pieces
+        segment_content = b''.join(contents)
+        self._segments[segment_name] = (len(segment_content), entries)
+        return segment_content
+
+    def save(self, total_table_path):
+        """
+        总表写入后保存清单，记录各输入文件在该总表中的偏移
+        :param total_table_path: 本次生成的总表文件路径（须为 静态表+总动作表+总动态表+总监控表，且位于 total_bin 中）
+        """
+        stat = os.stat(total_table_path)
+        segments = {}
+        segment_offset = 0
+        for segment_name in SEGMENT_NAMES:
+            length, entries = self._segments.get(segment_name, (0, []))
+            segments[segment_name] = {
+                "length": length,
+                "offset": segment_offset,
+                "offset_hex": table_utils.calculate_hex_string(segment_offset),
+                "files": [dict(entry, offset=segment_offset + entry["offset"]) for entry in entries],
+            }
+            segment_offset += length
+        if segment_offset != stat.st_size:
+            print("总表长度与各部分长度之和不一致，未保存构建缓存清单")
+            return
+        manifest = {
+            "assembly": {"file": os.path.basename(total_table_path), "size": stat.st_size,
+                         "mtime_ns": stat.st_mtime_ns},
+            "total_length": segment_offset,
+            "total_length_hex": table_utils.total_length_format_hex(segment_offset),
+            "segments": segments,
+        }
+        os.makedirs(self.total_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=self.total_dir)
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.manifest_path)
+        # 下一次读取以本次的总表为准
+        self._previous = None
@@ -0,0 +1,141 @@
+"""
+两个总表之间按记录比较
+
+先比较各部分的哈希值，相同的部分直接跳过；不同的部分再解析成记录：动作表按动作ID对齐并逐字段比较，
+动态表按 (动态表配置序号, 流程项序号) 对齐并比较动作开始时刻、动作ID和动作时间，监控表给出第一个不同的位置。
+
+    with TotalTableImage(old_path) as old, TotalTableImage(new_path) as new:
+        diff = diff_images(old, new)
+"""
+import hashlib
+
+import numpy as np
+
+from utils.total_table_reader import SEGMENT_NAMES
+
+
+def segment_digest(image, name, copy=0):
+    """总表一部分的哈希值（直接对映射的内容计算）"""
+    return hashlib.sha256(image.segment(name, copy)).hexdigest()
+
+
+def first_difference(old, new):
+    """
+    两段字节的第一个不同的位置，完全相同时返回None
+    """
+    length = min(len(old), len(new))
+    if length:
+        mismatch = np.flatnonzero(np.frombuffer(old, dtype=np.uint8, count=length) !=
+                                  np.frombuffer(new, dtype=np.uint8, count=length))
+        if len(mismatch):
+            return int(mismatch[0])
+    return None if len(old) == len(new) else length
+
+
+def diff_fields(old_action, new_action):
+    """
+    同一动作ID的两个动作表逐字段比较
+    :return: [(字段名, 旧值16进制, 新值16进制)]
+    """
+    old_fields = {name: hex_value for name, hex_value, _ in old_action.decode_fields()}
+    changes = []
+    for name, hex_value, _ in new_action.decode_fields():
+        old_value = old_fields.get(name)
+        if old_value != hex_value:
+            changes.append((name, old_value, hex_value))
+    if not changes:
+        # 没有字段声明（未知类别）或字段划分相同但长度不同
+        changes.append(("config_hex", old_action.config_hex, new_action.config_hex))
+    return changes
+
+
+def diff_actions(old_image, new_image, old_copy=0, new_copy=0):
+    """
+    按动作ID对齐比较总动作表
+    :return: {"added": [动作ID], "removed": [动作ID], "modified": [(动作ID, [(字段名, 旧值, 新值)])]}
+    """
+    old_actions = {action.action_id: action for action in old_image.iter_actions(old_copy)}
+    new_actions = {action.action_id: action for action in new_image.iter_actions(new_copy)}
+    modified = []
+    for action_id, new_action in new_actions.items():
+        old_action = old_actions.get(action_id)
+        if old_action is None or old_action.data == new_action.data:
+            continue
+        modified.append((action_id, diff_fields(old_action, new_action)))
+    return {"added": sorted(set(new_actions) - set(old_actions)),
+            "removed": sorted(set(old_actions) - set(new_actions)),
+            "modified": sorted(modified)}
+
+
+def diff_rows(old_rows, new_rows):
+    """
+    按流程项序号比较两组流程项
+    :return: [(流程项序号, 旧流程项, 新流程项)]，新增、删除的流程项对应的旧、新流程项为None
+    """
+    changes = []
+    for index in range(max(len(old_rows), len(new_rows))):
+        old_row = old_rows[index] if index < len(old_rows) else None
+        new_row = new_rows[index] if index < len(new_rows) else None
+        if old_row != new_row:
+            changes.append((index, old_row, new_row))
+    return changes
+
+
+def diff_dynamic_tables(old_image, new_image, old_copy=0, new_copy=0):
+    """
+    按 (动态表配置序号, 流程项序号) 对齐比较总动态表，内容相同的动态表直接跳过
+    :return: {"added": [动态表配置序号], "removed": [动态表配置序号],
+              "modified": [(动态表配置序号, [(流程项序号, 旧流程项, 新流程项)])]}，
+             新增、删除的流程项对应的旧、新流程项为None
+    """
+    old_tables = {table.dynamic_id: table for table in old_image.iter_dynamic_tables(old_copy)}
+    new_tables = {table.dynamic_id: table for table in new_image.iter_dynamic_tables(new_copy)}
+    modified = []
+    for dynamic_id, new_table in new_tables.items():
+        old_table = old_tables.get(dynamic_id)
+        if old_table is None or (old_table.max_action_num == new_table.max_action_num and
+                                 old_table.data == new_table.data):
+            continue
+        changes = diff_rows(old_table.rows(), new_table.rows())
+        if not changes:
+            # 流程项相同，不同之处在补齐用的空动作中
+            changes = diff_rows(old_table.rows(include_empty=True), new_table.rows(include_empty=True))
+        if old_table.max_action_num != new_table.max_action_num:
+            changes.append((None, old_table.max_action_num, new_table.max_action_num))
+        modified.append((dynamic_id, changes))
+    return {"added": sorted(set(new_tables) - set(old_tables), key=str),
+            "removed": sorted(set(old_tables) - set(new_tables), key=str),
+            "modified": sorted(modified, key=lambda item: str(item[0]))}
+
+
+def diff_images(old_image, new_image, old_copy=0, new_copy=0):
+    """
+    比较两个总表（TotalTableImage）
+    :return: {"head": 表头是否相同, "identical": 是否完全相同,
+              "segments": {部分: 是否相同}, "static": {...}, "actions": {...}, "dynamic": {...},
+              "monitoring": 第一个不同的位置（相同时为None）}
+    """
+    same = {name: segment_digest(old_image, name, old_copy) == segment_digest(new_image, name, new_copy)
+            for name in SEGMENT_NAMES}
+    diff = {"head": old_image.head == new_image.head, "segments": same,
+            "static": None, "actions": None, "dynamic": None, "monitoring": None}
+    if not same["static"]:
+        old_counts = old_image.action_counts(old_copy)
+        new_counts = new_image.action_counts(new_copy)
+        diff["static"] = {
+            "batch_count": (old_image.batch_count(old_copy), new_image.batch_count(new_copy)),
+            "action_counts": {str(action_code): (old_counts.get(action_code, 0), count)
+                              for action_code, count in new_counts.items()
+                              if old_counts.get(action_code, 0) != count},
+            "first_difference": first_difference(old_image.segment('static', old_copy),
+                                                 new_image.segment('static', new_copy)),
+        }
+    if not same["action"]:
+        diff["actions"] = diff_actions(old_image, new_image, old_copy, new_copy)
+    if not same["dynamic"]:
+        diff["dynamic"] = diff_dynamic_tables(old_image, new_image, old_copy, new_copy)
+    if not same["monitoring"]:
+        diff["monitoring"] = first_difference(old_image.segment('monitoring', old_copy),
+                                              new_image.segment('monitoring', new_copy))
+    diff["identical"] = diff["head"] and all(same.values())
+    return diff
@@ -0,0 +1,387 @@
+"""
+总表（总表_*.bin、总表+3总表_*.bin）的读取与解析
+
+文件用mmap映射，表头、静态表、动作表、动态表、监控表都以memoryview切片的形式给出，不复制文件内容；
+动作表的字段按 config/*.yaml 生成的参数声明（utils/action_specs.py）切分和解码，只在访问时才解析。
+
+    with TotalTableImage("total_bin/总表+3总表_0x5A_20240101_120000.bin") as image:
+        print(image.head["total_length"], image.action_counts())
+        for action in image.iter_actions():
+            print(action.action_id, action.decode_fields())
+        for dynamic in image.iter_dynamic_tables():
+            print(dynamic.dynamic_id, dynamic.rows())
+"""
+import mmap
+import os
+import re
+import struct
+
+import numpy as np
+
+from utils import action_specs
+from utils import encoder
+from utils import table_utils
+
+# 表头：总表配置 + 电机配置 + 静态表/总动作表/总动态表/总监控表的偏移（各重复三次） + 总表长度（重复三次）
+TABLE_HEAD = struct.Struct('<2s2s15I')
+TABLE_HEAD_SIZE = TABLE_HEAD.size
+# 总表中各部分的顺序
+SEGMENT_NAMES = ('static', 'action', 'dynamic', 'monitoring')
+# 动态表记录：动作开始时间(u32) + 动作ID(u16) + 动作时间(大端u16)
+DYNAMIC_RECORD = struct.Struct('<IH2s')
+# 文件名中的校验和：表名_0x校验和_生成时间.bin
+CHECKSUM_PATTERN = re.compile(r'_0x([0-9A-Fa-f]{2})_\d{8}_\d{6}')
+# 动作类别 0~9 为整数，A~F 为字符串
+ACTION_CODES = tuple(range(10)) + tuple("ABCDEF")
+
+# {动作类别: ([(字段, 起始位置, 结束位置)], 参数记录长度)}，第一次解析该类别时生成
+_layouts = {}
+
+
+def action_layout(action_code):
+    """
+    动作类别的参数记录布局（按当前的配置文件）
+    """
+    layout = _layouts.get(action_code)
+    if layout is None:
+        layout = _layouts[action_code] = action_specs.build_spec(action_code).layout()
+    return layout
+
+
+def decode_config(action_code, config):
+    """
+    按参数声明解码参数编码中各字段的寄存器值
+    :param config: 参数编码字节串（不含动作ID）
+    :return: {字段名: 寄存器值}
+    """
+    values = {}
+    for field, start, stop in action_layout(action_code)[0]:
+        if field.decode is not None and stop <= len(config):
+            values[field.name] = field.decode(config[start:stop])
+    return values
+
+
+def static_counts_offset():
+    """
+    静态表中每类动作数的位置：实验总批数(u8) + 静态表中间参数之后
+    """
+    return 1 + len(table_utils.read_static_part('static_middle_bin.txt'))
+
+
+class ActionEntry:
+    """
+    总动作表中的一个动作表
+    """
+    __slots__ = ("offset", "action_id", "action_code", "data")
+
+    def __init__(self, offset, action_id, action_code, data):
+        # 在文件中的位置
+        self.offset = offset
+        # 动作ID（4位16进制字符串）
+        self.action_id = action_id
+        # 动作类别，未知类别为None
+        self.action_code = action_code
+        # 参数编码（memoryview，不含动作ID）
+        self.data = data
+
+    @property
+    def config_hex(self):
+        return encoder.hex_text(self.data)
+
+    def decode_fields(self):
+        """
+        按参数声明切分字段
+        :return: [(字段名, 16进制值, 寄存器值)]，不能解码的字段寄存器值为None
+        """
+        if self.action_code is None:
+            return []
+        fields = []
+        for field, start, stop in action_layout(self.action_code)[0]:
+            data = self.data[start:stop]
+            value = field.decode(data) if field.decode is not None and len(data) == stop - start else None
+            fields.append((field.name, encoder.hex_text(data), value))
+        return fields
+
+
+class DynamicEntry:
+    """
+    总动态表中的一个动态表
+    """
+    __slots__ = ("offset", "dynamic_id", "max_action_num", "data")
+
+    def __init__(self, offset, dynamic_id, max_action_num, data):
+        self.offset = offset
+        # 动态表配置序号（BCD码还原的十进制数）
+        self.dynamic_id = dynamic_id
+        self.max_action_num = max_action_num
+        # 全部记录（memoryview，不含表头）
+        self.data = data
+
+    def rows(self, include_empty=False):
+        """
+        :param include_empty: 是否包含补齐用的空动作
+        :return: [(动作开始时间, 动作ID, 动作时间)]
+        """
+        rows = []
+        for start_time, action_id, action_time in DYNAMIC_RECORD.iter_unpack(self.data):
+            if action_id == 0xFFFF and not include_empty:
+                break
+            rows.append((start_time, f"{action_id:04X}", encoder.U16_BE.unpack(action_time)[0]))
+        return rows
+
+
+class TotalTableImage:
+    """
+    用mmap打开的总表文件
+
+    有表头的文件（总表+3总表）按表头中的偏移和总表长度定位各部分，并检查三份总表是否一致；
+    没有表头的文件（总表）按静态表中的每类动作数和实验总批数依次解析出各部分的长度。
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._file = open(file_path, 'rb')
+        try:
+            self.size = os.fstat(self._file.fileno()).st_size
+            # 空文件不能映射
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        except BaseException:
+            self._file.close()
+            raise
+        self.view = memoryview(self._mmap) if self._mmap is not None else memoryview(b"")
+        # 解析中发现的问题
+        self.problems = []
+        self.head = self._parse_head()
+        if self.head is not None:
+            self.body_offset = TABLE_HEAD_SIZE
+            self.total_length = self.head["total_length"]
+            self.copies = (self.size - TABLE_HEAD_SIZE) // self.total_length if self.total_length else 0
+            if self.copies * self.total_length != self.size - TABLE_HEAD_SIZE:
+                self._problem(f"文件长度{self.size}不是 表头 + 总表长度{self.total_length} 的整数倍")
+            self._bounds = self._bounds_from_head()
+        else:
+            self.body_offset = 0
+            self.total_length = self.size
+            self.copies = 1
+            self._bounds = self._bounds_from_content()
+
+    def close(self):
+        """
+        关闭文件，之后不能再访问解析出的动作表、动态表中的数据
+        """
+        self.view.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # 仍有解析结果引用映射的内容，等它们释放后由垃圾回收关闭
+                pass
+        self._file.close()
+
+    def _problem(self, message):
+        if message not in self.problems:
+            self.problems.append(message)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # ---------------- 表头 ----------------
+    def _parse_head(self):
+        """
+        解析表头，文件不是以总表配置开头或各偏移不合理时视为没有表头
+        """
+        if self.size < TABLE_HEAD_SIZE or bytes(self.view[0:2]) != encoder.const(table_utils.TOTAL_TABLE_CONFIG):
+            return None
+        values = TABLE_HEAD.unpack_from(self.view)
+        table_config, motor_config, words = values[0], values[1], values[2:]
+        triples = [words[i:i + 3] for i in range(0, 15, 3)]
+        offsets = [triple[0] - encoder.TABLE_OFFSET_BASE for triple in triples[:4]]
+        total_length = triples[4][0]
+        if offsets[0] != 0 or sorted(offsets) != offsets or offsets[3] > total_length:
+            return None
+        for name, triple in zip(SEGMENT_NAMES + ("total_length",), triples):
+            if len(set(triple)) != 1:
+                self._problem(f"表头中{name}的三个值不一致：{', '.join(f'{value:08X}' for value in triple)}")
+        return {"table_config": encoder.hex_text(table_config), "motor_config": encoder.hex_text(motor_config),
+                "offsets": dict(zip(SEGMENT_NAMES, offsets)),
+                "offsets_hex": {name: table_utils.calculate_hex_string(offset)
+                                for name, offset in zip(SEGMENT_NAMES, offsets)},
+                "total_length": total_length,
+                "total_length_hex": table_utils.total_length_format_hex(total_length)}
+
+    def _bounds_from_head(self):
+        offsets = [self.head["offsets"][name] for name in SEGMENT_NAMES] + [self.total_length]
+        return {name: (offsets[i], offsets[i + 1]) for i, name in enumerate(SEGMENT_NAMES)}
+
+    def _bounds_from_content(self):
+        """
+        没有表头时由内容推算各部分的范围：静态表长度固定，动作表按每类动作数逐个跳过，动态表按实验总批数逐个跳过
+        """
+        view = self.view
+        static_length = static_counts_offset() + 32 + len(table_utils.read_static_part('static_tail_bin.txt'))
+        if self.size < static_length:
+            self._problem(f"文件长度{self.size}小于静态表长度{static_length}")
+            return {name: (0, self.size) if name == 'static' else (self.size, self.size) for name in SEGMENT_NAMES}
+        position = static_length
+        self._bounds = {"static": (0, static_length)}
+        for action_code, count in self._static_counts(0).items():
+            for _ in range(count):
+                if position + 2 > self.size:
+                    break
+                code = self._action_code(encoder.U16.unpack_from(view, position)[0])
+                position += 2 + (action_layout(code)[1] if code is not None else 0)
+        action_end = min(position, self.size)
+        for _ in range(view[0]):
+            if position + table_utils.DYNAMIC_HEADER_SIZE > self.size:
+                break
+            max_action_num = encoder.U48.unpack_from(view, position + 2)
+            position += table_utils.DYNAMIC_HEADER_SIZE + \
+                (max_action_num[0] | max_action_num[1] << 32) * table_utils.DYNAMIC_RECORD_SIZE
+        dynamic_end = min(position, self.size)
+        return {"static": (0, static_length), "action": (static_length, action_end),
+                "dynamic": (action_end, dynamic_end), "monitoring": (dynamic_end, self.size)}
+
+    # ---------------- 各部分 ----------------
+    def segment(self, name, copy=0):
+        """
+        第copy份总表中的一部分
+        :param name: 'static' / 'action' / 'dynamic' / 'monitoring'
+        :return: memoryview
+        """
+        start, stop = self._bounds[name]
+        base = self.body_offset + copy * self.total_length
+        return self.view[base + start:base + stop]
+
+    def segment_offset(self, name, copy=0):
+        return self.body_offset + copy * self.total_length + self._bounds[name][0]
+
+    def _static_counts(self, copy):
+        static = self.segment('static', copy)
+        offset = static_counts_offset()
+        if len(static) < offset + 32:
+            return {}
+        return dict(zip(ACTION_CODES, struct.unpack_from('<16H', static, offset)))
+
+    def batch_count(self, copy=0):
+        """
+        静态表中的实验总批数
+        """
+        static = self.segment('static', copy)
+        return static[0] if len(static) else 0
+
+    def action_counts(self, copy=0):
+        """
+        静态表中的每类动作数 {动作类别: 数量}
+        """
+        return self._static_counts(copy)
+
+    @staticmethod
+    def _action_code(action_id):
+        code = action_id >> 12
+        action_code = code if code < 10 else "ABCDEF"[code - 10]
+        try:
+            action_layout(action_code)
+        except (KeyError, ValueError):
+            return None
+        return action_code
+
+    def iter_actions(self, copy=0):
+        """
+        依次解析总动作表中的动作表（未知类别或长度不足时停止，并记录问题）
+        """
+        segment = self.segment('action', copy)
+        base = self.segment_offset('action', copy)
+        position = 0
+        while position + 2 <= len(segment):
+            action_id = encoder.U16.unpack_from(segment, position)[0]
+            action_code = self._action_code(action_id)
+            if action_code is None:
+                self._problem(f"位置{base + position}：动作ID {action_id:04X} 的类别未知，停止解析动作表")
+                return
+            length = action_layout(action_code)[1]
+            if position + 2 + length > len(segment):
+                self._problem(f"位置{base + position}：动作 {action_id:04X} 的参数编码不完整")
+                return
+            yield ActionEntry(base + position, f"{action_id:04X}", action_code,
+                              segment[position + 2:position + 2 + length])
+            position += 2 + length
+        if position != len(segment):
+            self._problem(f"动作表末尾有{len(segment) - position}个字节无法解析")
+
+    def iter_dynamic_tables(self, copy=0):
+        """
+        依次解析总动态表中的动态表
+        """
+        segment = self.segment('dynamic', copy)
+        base = self.segment_offset('dynamic', copy)
+        position = 0
+        while position + table_utils.DYNAMIC_HEADER_SIZE <= len(segment):
+            bcd_id = encoder.U16.unpack_from(segment, position)[0]
+            low, high = encoder.U48.unpack_from(segment, position + 2)
+            max_action_num = low | high << 32
+            start = position + table_utils.DYNAMIC_HEADER_SIZE
+            stop = start + max_action_num * table_utils.DYNAMIC_RECORD_SIZE
+            if stop > len(segment):
+                self._problem(f"位置{base + position}：动态表记录不完整（最大动作数{max_action_num}）")
+                return
+            yield DynamicEntry(base + position, bcd_number(bcd_id), max_action_num, segment[start:stop])
+            position = stop
+        if position != len(segment):
+            self._problem(f"动态表末尾有{len(segment) - position}个字节无法解析")
+
+    # ---------------- 检查 ----------------
+    def copies_identical(self):
+        """
+        三份总表是否完全相同（有表头的文件）
+        """
+        first = self.view[self.body_offset:self.body_offset + self.total_length]
+        return all(self.view[self.body_offset + i * self.total_length:
+                             self.body_offset + (i + 1) * self.total_length] == first
+                   for i in range(1, self.copies))
+
+    def checksum(self):
+        """
+        整个文件的校验和（字节累加和的低字节，与 table_utils.calculate_checksum 相同）
+        """
+        if not self.size:
+            return 0
+        return int(np.frombuffer(self._mmap, dtype=np.uint8).sum(dtype=np.uint64) % 256)
+
+    def file_name_checksum(self):
+        """
+        文件名中记录的校验和，文件名中没有时为None
+        """
+        match = CHECKSUM_PATTERN.search(os.path.basename(self.file_path))
+        return int(match.group(1), 16) if match else None
+
+    def check(self):
+        """
+        检查表头、三份总表、校验和以及静态表中的每类动作数
+        :return: 发现的问题
+        """
+        if self.head is not None and self.copies > 1 and not self.copies_identical():
+            self._problem(f"{self.copies}份总表内容不一致")
+        expected = self.file_name_checksum()
+        if expected is not None and expected != self.checksum():
+            self._problem(f"校验和0x{self.checksum():02X}与文件名中的0x{expected:02X}不一致")
+        counts = {}
+        for action in self.iter_actions():
+            counts[action.action_code] = counts.get(action.action_code, 0) + 1
+        for action_code, count in self.action_counts().items():
+            if counts.get(action_code, 0) != count:
+                self._problem(f"静态表中类别{action_code}的动作数为{count}，动作表中实际为{counts.get(action_code, 0)}")
+        dynamic_count = sum(1 for _ in self.iter_dynamic_tables())
+        if dynamic_count != self.batch_count():
+            self._problem(f"静态表中实验总批数为{self.batch_count()}，动态表实际为{dynamic_count}个")
+        return list(self.problems)
+
+
+def bcd_number(value):
+    """
+    BCD码的16位整数还原为十进制数（动态表配置序号），不是BCD码时原样返回
+    """
+    text = f"{value:04X}"
+    return int(text) if text.isdigit() else value